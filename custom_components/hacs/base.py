@@ -45,6 +45,7 @@ from .enums import (
     HacsDisabledReason,
     HacsDispatchEvent,
     HacsGitHubRepo,
+    HacsQueuePriority,
     HacsStage,
     LovelaceMode,
 )
@@ -201,6 +202,13 @@ class HacsRepositories:
     _repositories_by_full_name: dict[str, HacsRepository] = field(default_factory=dict)
     _repositories_by_id: dict[str, HacsRepository] = field(default_factory=dict)
     _removed_repositories_by_full_name: dict[str, RemovedRepository] = field(default_factory=dict)
+    _repositories_by_category: dict[str, set[HacsRepository]] = field(default_factory=dict)
+    _downloaded_repositories: set[HacsRepository] = field(default_factory=set)
+    _list_rows: dict[str, tuple[tuple[Any, ...], int, dict[str, Any]]] = field(
+        default_factory=dict
+    )
+    _list_rows_removed: dict[str, int] = field(default_factory=dict)
+    list_version: int = 0
 
     @property
     def list_all(self) -> list[HacsRepository]:
@@ -215,14 +223,59 @@ class HacsRepositories:
     @property
     def list_downloaded(self) -> list[HacsRepository]:
         """Return a list of downloaded repositories."""
-        return [repo for repo in self._repositories if repo.data.installed]
+        return list(self._downloaded_repositories)
+
+    def list_by_category(self, category: str) -> list[HacsRepository]:
+        """Return a list of repositories in a category."""
+        return list(self._repositories_by_category.get(category, ()))
 
     def category_downloaded(self, category: HacsCategory) -> bool:
         """Check if a given category has been downloaded."""
-        for repository in self.list_downloaded:
-            if repository.data.category == category:
-                return True
-        return False
+        return not self._downloaded_repositories.isdisjoint(
+            self._repositories_by_category.get(category, ())
+        )
+
+    def update_downloaded(self, repository: HacsRepository) -> None:
+        """Sync the downloaded index with the installed state of a repository."""
+        if repository.data.installed and repository in self._repositories:
+            self._downloaded_repositories.add(repository)
+        else:
+            self._downloaded_repositories.discard(repository)
+
+    def list_row(
+        self,
+        repository: HacsRepository,
+        key: tuple[Any, ...],
+        build: Callable[[], dict[str, Any]],
+    ) -> tuple[int, dict[str, Any]]:
+        """Return the list row of a repository and the list version it last changed in.
+
+        ``key`` is a snapshot of the data the row is built from, the row is only rebuilt
+        with ``build`` when the key differs from the one it was cached with.
+        """
+        repo_id = str(repository.data.id)
+        if (cached := self._list_rows.get(repo_id)) is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        self.list_version += 1
+        self._list_rows[repo_id] = (key, self.list_version, row := build())
+        self._list_rows_removed.pop(repo_id, None)
+        return self.list_version, row
+
+    def drop_list_row(self, repository: HacsRepository) -> None:
+        """Drop the cached list row of a repository that is no longer listed."""
+        repo_id = str(repository.data.id)
+        if self._list_rows.pop(repo_id, None) is not None:
+            self.list_version += 1
+            self._list_rows_removed[repo_id] = self.list_version
+
+    def list_removed_since(self, version: int) -> list[str]:
+        """Return the ids of repositories unregistered after a list version."""
+        return [
+            repo_id
+            for repo_id, removed_version in self._list_rows_removed.items()
+            if removed_version > version
+        ]
 
     def register(self, repository: HacsRepository, default: bool = False) -> None:
         """Register a repository."""
@@ -246,6 +299,11 @@ class HacsRepositories:
 
         self._repositories_by_id[repo_id] = repository
         self._repositories_by_full_name[repository.data.full_name_lower] = repository
+        self._repositories_by_category.setdefault(repository.data.category, set()).add(
+            repository
+        )
+        self._list_rows_removed.pop(repo_id, None)
+        self.update_downloaded(repository)
 
         if default:
             self.mark_default(repository)
@@ -268,6 +326,10 @@ class HacsRepositories:
 
         self._repositories_by_id.pop(repo_id, None)
         self._repositories_by_full_name.pop(repository.data.full_name_lower, None)
+        if (category := self._repositories_by_category.get(repository.data.category)) is not None:
+            category.discard(repository)
+        self._downloaded_repositories.discard(repository)
+        self.drop_list_row(repository)
 
     def mark_default(self, repository: HacsRepository) -> None:
         """Mark a repository as default."""
@@ -806,6 +868,7 @@ class HacsBase:
                 raise HacsException("Unknown error")
 
             repository.data.installed = True
+            self.repositories.update_downloaded(repository)
             repository.data.installed_version = self.integration.version.string
             repository.data.new = False
             repository.data.releases = True
@@ -866,7 +929,7 @@ class HacsBase:
                 ):
                     repository.data.update_data({**dict(REPOSITORY_KEYS_TO_EXPORT), **repo_data})
                     if (manifest := repo_data.get("manifest")) is not None:
-                        repository.repository_manifest.update_data(
+                        repository.update_manifest(
                             {**dict(HACS_MANIFEST_KEYS_TO_EXPORT), **manifest}
                         )
 
@@ -912,25 +975,21 @@ class HacsBase:
             self.log.debug("Queue is already running")
             return
 
-        async def _handle_queue():
-            if not self.queue.has_pending_tasks:
-                await self.data.async_write()
-                return
+        while self.queue.has_pending_tasks:
             can_update = await self.async_can_update()
             self.log.debug(
                 "Can update %s repositories, items in queue %s",
                 can_update,
                 self.queue.pending_tasks,
             )
-            if can_update != 0:
-                try:
-                    await self.queue.execute(can_update)
-                except HacsExecutionStillInProgress:
-                    return
-
-                await _handle_queue()
+            if can_update == 0:
+                return
+            try:
+                await self.queue.execute(can_update)
+            except HacsExecutionStillInProgress:
+                return
 
-        await _handle_queue()
+        await self.data.async_write()
 
     async def async_handle_removed_repositories(self, _=None) -> None:
         """Handle removed repositories."""
@@ -1006,7 +1065,7 @@ class HacsBase:
                 and not self.repositories.is_default(repository.data.id)
             ):
                 repositories_to_update += 1
-                self.queue.add(update_repository(repository))
+                self.queue.add(update_repository(repository), HacsQueuePriority.BACKGROUND)
 
         async def update_coordinators() -> None:
             """Update all coordinators."""
@@ -0,0 +1,223 @@
+"""Startup benchmark of restoring the HACS repository catalog.
+
+Restores a repositories store through HacsData, the way HACS does at startup, and
+reports the restore time, the resident memory it added and how many repositories got a
+manifest, content and release objects. The repository list, twice to read the cached rows
+the second time, and a storage write are run afterwards, as the frontend and the first
+data write do shortly after startup.
+
+Each mode runs in a fresh interpreter so the memory numbers do not influence each other:
+
+- lazy: restore as HACS does, catalog entries keep a RepositoryCatalogRecord.
+- eager: create the manifest, content and release objects of every repository right
+  after restoring it, as restore did before catalog records were introduced.
+
+Run it from the Home Assistant configuration directory:
+
+    python -m custom_components.hacs.benchmark [--store FILE] [--repositories N]
+
+Without a store, a catalog of N synthetic repositories is generated. A store is the
+.storage/hacs.repositories file of an installation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import resource
+import subprocess
+import sys
+import time
+from typing import Any
+
+from awesomeversion import AwesomeVersion
+
+from .base import HacsBase
+from .enums import HacsCategory
+from .utils.data import HacsData
+from .websocket.repositories import _repository_list_row, _repository_list_row_key
+
+MODES = ("eager", "lazy")
+DEFAULT_REPOSITORIES = 5000
+DOWNLOADED_EVERY = 250
+CATEGORIES = (
+    HacsCategory.INTEGRATION,
+    HacsCategory.PLUGIN,
+    HacsCategory.THEME,
+    HacsCategory.PYTHON_SCRIPT,
+    HacsCategory.TEMPLATE,
+)
+
+
+def _synthetic_store(count: int) -> dict[str, dict[str, Any]]:
+    """Return a repositories store with count repositories, a few of them downloaded."""
+    repositories = {}
+    for idx in range(count):
+        category = CATEGORIES[idx % len(CATEGORIES)]
+        data: dict[str, Any] = {
+            "category": category,
+            "full_name": f"owner{idx}/repository-{idx}",
+            "description": f"Repository number {idx} of the benchmark catalog",
+            "authors": [f"@owner{idx}"],
+            "domain": f"repository_{idx}" if category == HacsCategory.INTEGRATION else None,
+            "downloads": idx * 3,
+            "etag_repository": f'W/"{idx:032x}"',
+            "last_updated": "2024-05-01T12:00:00Z",
+            "stargazers_count": idx % 500,
+            "topics": ["home-assistant", f"topic-{idx % 40}"],
+            "last_fetched": 1714564800.0,
+            "last_version": f"1.{idx % 20}.0",
+            "repository_manifest": {"name": f"Repository {idx}", "homeassistant": "2024.1.0"},
+        }
+        if idx % 7 == 0:
+            data["repository_manifest"]["country"] = ["NO", "SE"]
+        if idx % DOWNLOADED_EVERY == 0:
+            data.update(installed=True, version_installed=f"1.{idx % 20}.0", releases=True)
+        repositories[str(100000 + idx)] = data
+    return repositories
+
+
+def _rss() -> int:
+    """Return the resident memory of the process, in bytes."""
+    return int(Path("/proc/self/statm").read_text().split()[1]) * resource.getpagesize()
+
+
+def _materialized(hacs: HacsBase) -> int:
+    """Return the number of repositories with a manifest, content or release objects."""
+    return sum(
+        1
+        for repository in hacs.repositories.list_all
+        if repository._repository_manifest is not None  # pylint: disable=protected-access
+        or repository._content is not None  # pylint: disable=protected-access
+        or repository._releases is not None  # pylint: disable=protected-access
+    )
+
+
+def _list_rows(hacs: HacsBase) -> int:
+    """Build the rows of the repository list like hacs/repositories/list does."""
+    listed = 0
+    for category in sorted(hacs.common.categories):
+        for repo in hacs.repositories.list_by_category(category):
+            if repo.ignored_by_country_configuration or not repo.data.last_fetched:
+                continue
+            hacs.repositories.list_row(
+                repo,
+                _repository_list_row_key(hacs, repo),
+                lambda repo=repo: _repository_list_row(hacs, repo),
+            )
+            listed += 1
+    return listed
+
+
+async def _async_run_mode(mode: str, repositories: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Restore the store in one mode and return the measurements."""
+    hacs = HacsBase()
+    hacs.core.config_path = "/config"
+    hacs.core.ha_version = AwesomeVersion("2025.4.0")
+    hacs.common.categories = set(CATEGORIES)
+    hacs.data = HacsData(hacs)
+
+    rss_before = _rss()
+    start = time.perf_counter()
+    await hacs.data.register_unknown_repositories(repositories)
+    for entry, repository_data in repositories.items():
+        hacs.data.async_restore_repository(entry, repository_data)
+        if mode == "eager" and (repository := hacs.repositories.get_by_id(entry)):
+            _ = repository.repository_manifest, repository.content, repository.releases
+    restore = time.perf_counter() - start
+    rss_restored = _rss()
+    restored_materialized = _materialized(hacs)
+
+    list_times = []
+    for _ in range(2):
+        # The second run reads the cached rows
+        start = time.perf_counter()
+        listed = _list_rows(hacs)
+        list_times.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    hacs.data.content = {}
+    for repository in hacs.repositories.list_all:
+        hacs.data.async_store_repository_data(repository)
+    write_time = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "repositories": len(hacs.repositories.list_all),
+        "listed": listed,
+        "restore": restore,
+        "rss": rss_restored - rss_before,
+        "max_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+        "restored_materialized": restored_materialized,
+        "list": list_times[0],
+        "list_cached": list_times[1],
+        "write": write_time,
+        "materialized": _materialized(hacs),
+    }
+
+
+def _load_store(args: argparse.Namespace) -> dict[str, dict[str, Any]]:
+    """Return the repositories store to restore."""
+    if args.store is None:
+        return _synthetic_store(args.repositories)
+    store = json.loads(args.store.read_text(encoding="utf-8"))
+    return store.get("data", store)
+
+
+def _report(results: list[dict[str, Any]]) -> None:
+    """Print the measurements of all modes."""
+    print(
+        f"{'mode':<7}{'repos':>7}{'restore (ms)':>14}{'RSS (MiB)':>11}{'max RSS (MiB)':>15}"
+        f"{'objects':>9}{'list (ms)':>11}{'cached (ms)':>13}{'write (ms)':>12}"
+        f"{'objects after':>15}"
+    )
+    for result in results:
+        print(
+            f"{result['mode']:<7}{result['repositories']:>7}{result['restore'] * 1000:>14.1f}"
+            f"{result['rss'] / 2**20:>11.1f}{result['max_rss'] / 2**20:>15.1f}"
+            f"{result['restored_materialized']:>9}{result['list'] * 1000:>11.1f}"
+            f"{result['list_cached'] * 1000:>13.1f}{result['write'] * 1000:>12.1f}"
+            f"{result['materialized']:>15}"
+        )
+    by_mode = {result["mode"]: result for result in results}
+    if {"eager", "lazy"} <= by_mode.keys():
+        eager, lazy = by_mode["eager"], by_mode["lazy"]
+        print(
+            f"\nrestore {eager['restore'] / lazy['restore']:.2f}x faster, "
+            f"{(eager['rss'] - lazy['rss']) / 2**20:.1f} MiB less resident memory"
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--store", type=Path, help="hacs.repositories store to restore")
+    parser.add_argument(
+        "--repositories",
+        type=int,
+        default=DEFAULT_REPOSITORIES,
+        help="number of synthetic repositories when no store is given",
+    )
+    parser.add_argument("--mode", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(asyncio.run(_async_run_mode(args.mode, _load_store(args)))))
+        return
+
+    results = []
+    for mode in MODES:
+        child = subprocess.run(
+            [sys.executable, "-m", __spec__.name, "--mode", mode, *sys.argv[1:]],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        results.append(json.loads(child.stdout.splitlines()[-1]))
+    _report(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,9 @@ PACKAGE_NAME = "custom_components.hacs"
 DEFAULT_CONCURRENT_TASKS = 15
 DEFAULT_CONCURRENT_BACKOFF_TIME = 1
 
+DEFAULT_QUEUE_WORKERS = 5
+DEFAULT_QUEUE_RATE = 2.0
+
 HACS_REPOSITORY_ID = "172733314"
 
 HACS_ACTION_GITHUB_API_HEADERS = {
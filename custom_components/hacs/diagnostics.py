@@ -33,6 +33,7 @@ async def async_get_config_entry_diagnostics(
             "archived_repositories": hacs.common.archived_repositories,
             "ignored_repositories": hacs.common.ignored_repositories,
             "lovelace_mode": hacs.core.lovelace_mode,
+            "queue": hacs.queue.stats,
             "configuration": {},
         },
         "custom_repositories": [
@@ -1,7 +1,7 @@
 """Helper constants."""
 
 # pylint: disable=missing-class-docstring
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 
 
 class HacsGitHubRepo(StrEnum):
@@ -69,3 +69,10 @@ class HacsDisabledReason(StrEnum):
     CONSTRAINS = "constrains"
     LOAD_HACS = "load_hacs"
     RESTORE = "restore"
+
+
+class HacsQueuePriority(IntEnum):
+    """Priority of a task in the queue, lower values run first."""
+
+    DEFAULT = 0
+    BACKGROUND = 1
@@ -9,7 +9,7 @@ from aiogithubapi import AIOGitHubAPIException
 from ..enums import HacsCategory, HacsDispatchEvent
 from ..exceptions import HacsException
 from ..utils.decorator import concurrent
-from .base import HacsRepository
+from .base import HacsRepository, RepositoryContent
 
 if TYPE_CHECKING:
     from ..base import HacsBase
@@ -24,8 +24,11 @@ class HacsAppdaemonRepository(HacsRepository):
         self.data.full_name = full_name
         self.data.full_name_lower = full_name.lower()
         self.data.category = HacsCategory.APPDAEMON
-        self.content.path.local = self.localpath
-        self.content.path.remote = "apps"
+
+    def setup_content(self, content: RepositoryContent) -> None:
+        """Set the category specific content paths."""
+        content.path.local = self.localpath
+        content.path.remote = "apps"
 
     @property
     def localpath(self):
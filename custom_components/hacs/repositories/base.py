@@ -20,7 +20,7 @@ from aiogithubapi.objects.repository import AIOGitHubAPIRepository
 import attr
 from homeassistant.helpers import device_registry as dr, issue_registry as ir
 
-from ..const import DOMAIN
+from ..const import DEFAULT_CONCURRENT_TASKS, DOMAIN
 from ..enums import HacsDispatchEvent, RepositoryFile
 from ..exceptions import (
     HacsException,
@@ -269,6 +269,53 @@ class HacsManifest:
                 setattr(self, key, value)
 
 
+class RepositoryCatalogRecord:
+    """Stored catalog data of a repository that is not downloaded.
+
+    Restore keeps the stored manifest, last release tag and checked local path of
+    these repositories here, without creating the manifest, content and release
+    objects. The repository list, the country filter and the storage writes read the
+    record as is, the objects are created from it once the repository is viewed,
+    validated or downloaded.
+    """
+
+    def __init__(
+        self,
+        manifest: dict[str, Any],
+        local_path: str | None = None,
+        last_release: str | None = None,
+    ) -> None:
+        """Initialize the record."""
+        self.manifest = manifest
+        self.local_path = local_path
+        self.last_release = last_release
+
+    @property
+    def name(self) -> str | None:
+        """Return the name from the manifest."""
+        return self.manifest.get("name")
+
+    @property
+    def country(self) -> list[str]:
+        """Return the countries from the manifest."""
+        if isinstance(country := self.manifest.get("country", []), str):
+            return [country]
+        return country
+
+    @property
+    def homeassistant(self) -> str | None:
+        """Return the minimum Home Assistant version from the manifest."""
+        return self.manifest.get("homeassistant")
+
+    def update_data(self, data: dict) -> None:
+        """Update the stored manifest data."""
+        self.manifest = {
+            key: value
+            for key, value in {**self.manifest, **data}.items()
+            if value is not None and value != []
+        }
+
+
 class RepositoryReleases:
     """RepositoyReleases."""
 
@@ -304,26 +351,92 @@ class HacsRepository:
         self.hacs = hacs
         self.additional_info = ""
         self.data = RepositoryData()
-        self.content = RepositoryContent()
-        self.content.path = RepositoryPath()
         self.repository_object: AIOGitHubAPIRepository | None = None
         self.updated_info = False
         self.state = None
         self.force_branch = False
         self.integration_manifest = {}
-        self.repository_manifest = HacsManifest.from_dict({})
-        self.validate = Validate()
-        self.releases = RepositoryReleases()
         self.pending_restart = False
         self.tree = []
         self.treefiles = []
         self.ref = None
         self.logger = LOGGER
+        # Created on first use, most catalog repositories are never viewed or downloaded
+        self._content: RepositoryContent | None = None
+        self._repository_manifest: HacsManifest | None = None
+        self._validate: Validate | None = None
+        self._releases: RepositoryReleases | None = None
+        self.catalog: RepositoryCatalogRecord | None = None
 
     def __str__(self) -> str:
         """Return a string representation of the repository."""
         return self.string
 
+    @property
+    def content(self) -> RepositoryContent:
+        """Return the repository content."""
+        if self._content is None:
+            self._content = RepositoryContent()
+            self._content.path = RepositoryPath()
+            self.setup_content(self._content)
+            if self.catalog is not None:
+                self._content.path.local = self.catalog.local_path
+        return self._content
+
+    @property
+    def content_local_path(self) -> str | None:
+        """Return the local content path, without creating the content of catalog entries."""
+        if self._content is None and self.catalog is not None:
+            return self.catalog.local_path
+        return self.content.path.local
+
+    def setup_content(self, content: RepositoryContent) -> None:
+        """Set the category specific content paths."""
+
+    @property
+    def repository_manifest(self) -> HacsManifest:
+        """Return the repository manifest."""
+        if self._repository_manifest is None:
+            self._repository_manifest = HacsManifest.from_dict(
+                self.catalog.manifest if self.catalog is not None else {}
+            )
+        return self._repository_manifest
+
+    @repository_manifest.setter
+    def repository_manifest(self, value: HacsManifest) -> None:
+        """Set the repository manifest."""
+        self._repository_manifest = value
+
+    @property
+    def manifest_info(self) -> HacsManifest | RepositoryCatalogRecord:
+        """Return the manifest, or the catalog record while the manifest is not created.
+
+        Both provide name, country, homeassistant and the stored manifest data.
+        """
+        if self._repository_manifest is None and self.catalog is not None:
+            return self.catalog
+        return self.repository_manifest
+
+    def update_manifest(self, data: dict) -> None:
+        """Update the manifest, or the catalog record while the manifest is not created."""
+        self.manifest_info.update_data(data)
+
+    @property
+    def validate(self) -> Validate:
+        """Return the validation result."""
+        if self._validate is None:
+            self._validate = Validate()
+        return self._validate
+
+    @property
+    def releases(self) -> RepositoryReleases:
+        """Return the release information."""
+        if self._releases is None:
+            self._releases = RepositoryReleases()
+            if self.catalog is not None and self.catalog.last_release is not None:
+                self._releases.last_release = self.catalog.last_release
+        return self._releases
+
     @property
     def string(self) -> str:
         """Return a string representation of the repository."""
@@ -332,8 +445,8 @@ class HacsRepository:
     @property
     def display_name(self) -> str:
         """Return display name."""
-        if self.repository_manifest.name is not None:
-            return self.repository_manifest.name
+        if (name := self.manifest_info.name) is not None:
+            return name
 
         if self.data.category == "integration":
             if self.data.manifest_name is not None:
@@ -352,7 +465,7 @@ class HacsRepository:
         if configuration == "all":
             return False
 
-        manifest = [entry.lower() for entry in self.repository_manifest.country or []]
+        manifest = [entry.lower() for entry in self.manifest_info.country or []]
         if not manifest:
             return False
         return configuration not in manifest
@@ -432,11 +545,11 @@ class HacsRepository:
     @property
     def can_download(self) -> bool:
         """Return True if we can download."""
-        if self.repository_manifest.homeassistant is not None:
+        if (homeassistant := self.manifest_info.homeassistant) is not None:
             if self.data.releases:
                 if not version_left_higher_or_equal_then_right(
                     self.hacs.core.ha_version.string,
-                    self.repository_manifest.homeassistant,
+                    homeassistant,
                 ):
                     return False
         return True
@@ -645,7 +758,7 @@ class HacsRepository:
         if not contents:
             raise HacsException("No content to download")
 
-        download_queue = QueueManager(hass=self.hacs.hass)
+        download_queue = QueueManager(hass=self.hacs.hass, workers=DEFAULT_CONCURRENT_TASKS)
 
         for content in contents:
             if self.repository_manifest.content_in_root and self.repository_manifest.filename:
@@ -761,6 +874,7 @@ class HacsRepository:
         if not await self.remove_local_directory():
             raise HacsException("Could not uninstall")
         self.data.installed = False
+        self.hacs.repositories.update_downloaded(self)
         await self._async_post_uninstall()
         await async_remove_store(self.hacs.hass, f"hacs/{self.data.id}.hacs")
 
@@ -996,6 +1110,7 @@ class HacsRepository:
 
         if self.validate.success:
             self.data.installed = True
+            self.hacs.repositories.update_downloaded(self)
             self.data.installed_commit = self.data.last_commit
 
             if version_to_install == self.data.default_branch:
@@ -14,7 +14,7 @@ from ..utils.decode import decode_content
 from ..utils.decorator import concurrent
 from ..utils.filters import get_first_directory_in_directory
 from ..utils.json import json_loads
-from .base import HacsRepository
+from .base import HacsRepository, RepositoryContent
 
 if TYPE_CHECKING:
     from ..base import HacsBase
@@ -29,8 +29,11 @@ class HacsIntegrationRepository(HacsRepository):
         self.data.full_name = full_name
         self.data.full_name_lower = full_name.lower()
         self.data.category = HacsCategory.INTEGRATION
-        self.content.path.remote = "custom_components"
-        self.content.path.local = self.localpath
+
+    def setup_content(self, content: RepositoryContent) -> None:
+        """Set the category specific content paths."""
+        content.path.remote = "custom_components"
+        content.path.local = self.localpath
 
     @property
     def localpath(self):
@@ -9,7 +9,7 @@ from ..enums import HacsCategory, HacsDispatchEvent
 from ..exceptions import HacsException
 from ..utils.decorator import concurrent
 from ..utils.json import json_loads
-from .base import HacsRepository
+from .base import HacsRepository, RepositoryContent
 
 HACSTAG_REPLACER = re.compile(r"\D+")
 
@@ -29,7 +29,10 @@ class HacsPluginRepository(HacsRepository):
         self.data.full_name_lower = full_name.lower()
         self.data.file_name = None
         self.data.category = HacsCategory.PLUGIN
-        self.content.path.local = self.localpath
+
+    def setup_content(self, content: RepositoryContent) -> None:
+        """Set the category specific content paths."""
+        content.path.local = self.localpath
 
     @property
     def localpath(self):
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 from ..enums import HacsCategory, HacsDispatchEvent
 from ..exceptions import HacsException
 from ..utils.decorator import concurrent
-from .base import HacsRepository
+from .base import HacsRepository, RepositoryContent
 
 if TYPE_CHECKING:
     from ..base import HacsBase
@@ -24,9 +24,12 @@ class HacsPythonScriptRepository(HacsRepository):
         self.data.full_name = full_name
         self.data.full_name_lower = full_name.lower()
         self.data.category = HacsCategory.PYTHON_SCRIPT
-        self.content.path.remote = "python_scripts"
-        self.content.path.local = self.localpath
-        self.content.single = True
+
+    def setup_content(self, content: RepositoryContent) -> None:
+        """Set the category specific content paths."""
+        content.path.remote = "python_scripts"
+        content.path.local = self.localpath
+        content.single = True
 
     @property
     def localpath(self):
@@ -9,7 +9,7 @@ from homeassistant.exceptions import HomeAssistantError
 from ..enums import HacsCategory, HacsDispatchEvent
 from ..exceptions import HacsException
 from ..utils.decorator import concurrent
-from .base import HacsRepository
+from .base import HacsRepository, RepositoryContent
 
 if TYPE_CHECKING:
     from ..base import HacsBase
@@ -24,9 +24,12 @@ class HacsThemeRepository(HacsRepository):
         self.data.full_name = full_name
         self.data.full_name_lower = full_name.lower()
         self.data.category = HacsCategory.THEME
-        self.content.path.remote = "themes"
-        self.content.path.local = self.localpath
-        self.content.single = False
+
+    def setup_content(self, content: RepositoryContent) -> None:
+        """Set the category specific content paths."""
+        content.path.remote = "themes"
+        content.path.local = self.localpath
+        content.single = False
 
     @property
     def localpath(self):
@@ -12,7 +12,12 @@ from homeassistant.exceptions import HomeAssistantError
 from ..base import HacsBase
 from ..const import HACS_REPOSITORY_ID
 from ..enums import HacsDisabledReason, HacsDispatchEvent
-from ..repositories.base import TOPIC_FILTER, HacsManifest, HacsRepository
+from ..repositories.base import (
+    TOPIC_FILTER,
+    HacsManifest,
+    HacsRepository,
+    RepositoryCatalogRecord,
+)
 from .logger import LOGGER
 from .path import is_safe
 from .store import async_load_from_store, async_save_to_store
@@ -113,7 +118,7 @@ class HacsData:
     @callback
     def async_store_repository_data(self, repository: HacsRepository) -> dict:
         """Store the repository data."""
-        data = {"repository_manifest": repository.repository_manifest.manifest}
+        data = {"repository_manifest": repository.manifest_info.manifest}
 
         for key, default in (
             EXPORTED_DOWNLOADED_REPOSITORY_DATA
@@ -288,7 +293,6 @@ class HacsData:
         repository.data.stargazers_count = repository_data.get(
             "stargazers_count"
         ) or repository_data.get("stars", 0)
-        repository.releases.last_release = repository_data.get("last_release_tag")
         repository.data.releases = repository_data.get("releases", False)
         repository.data.installed = repository_data.get("installed", False)
         repository.data.new = repository_data.get("new", False)
@@ -304,20 +308,34 @@ class HacsData:
         if last_fetched := repository_data.get("last_fetched"):
             repository.data.last_fetched = datetime.fromtimestamp(last_fetched, UTC)
 
-        repository.repository_manifest = HacsManifest.from_dict(
-            repository_data.get("manifest") or repository_data.get("repository_manifest") or {}
+        manifest = repository_data.get("manifest") or repository_data.get(
+            "repository_manifest"
         )
+        local_path = None
+        if repository.localpath is not None and is_safe(self.hacs, repository.localpath):
+            local_path = repository.localpath
+
+        if repository.data.installed:
+            repository.repository_manifest = HacsManifest.from_dict(manifest or {})
+            if (last_release := repository_data.get("last_release_tag")) is not None:
+                repository.releases.last_release = last_release
+            if local_path is not None:
+                # Set local path
+                repository.content.path.local = local_path
+        else:
+            # Manifest, content and releases are created from the record on first use
+            repository.catalog = RepositoryCatalogRecord(
+                manifest or {}, local_path, repository_data.get("last_release_tag")
+            )
 
         if repository.data.prerelease == repository.data.last_version:
             repository.data.prerelease = None
 
-        if repository.localpath is not None and is_safe(self.hacs, repository.localpath):
-            # Set local path
-            repository.content.path.local = repository.localpath
-
         if repository.data.installed:
             repository.data.first_install = False
 
         if entry == HACS_REPOSITORY_ID:
             repository.data.installed_version = self.hacs.version
             repository.data.installed = True
+
+        self.hacs.repositories.update_downloaded(repository)
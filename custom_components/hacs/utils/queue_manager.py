@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 from collections.abc import Coroutine
+import heapq
+from itertools import count
 import time
+from typing import Any
 
 from homeassistant.core import HomeAssistant
 
+from ..const import DEFAULT_QUEUE_WORKERS
+from ..enums import HacsQueuePriority
 from ..exceptions import HacsExecutionStillInProgress
 from .logger import LOGGER
 
@@ -15,30 +21,113 @@ _LOGGER = LOGGER
 
 
 class QueueManager:
-    """The QueueManager class."""
-
-    def __init__(self, hass: HomeAssistant) -> None:
+    """The QueueManager class.
+
+    Tasks are executed in priority order by at most ``workers`` concurrent workers.
+    When ``rate`` is set, task starts are paced by a token bucket refilled with
+    ``rate`` tokens per second, holding at most ``workers`` tokens.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        workers: int = DEFAULT_QUEUE_WORKERS,
+        rate: float | None = None,
+    ) -> None:
         self.hass = hass
-        self.queue: list[Coroutine] = []
+        self.workers = max(1, workers)
+        self.rate = rate
+        self.queue: list[tuple[int, int, float, Coroutine]] = []
         self.running = False
+        self._sequence = count()
+        self._checked_out = 0
+        self._in_flight = 0
+        self._tokens = float(self.workers)
+        self._token_time = time.monotonic()
+        self._completed = 0
+        self._failed = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._run_total = 0.0
+        self._run_max = 0.0
 
     @property
     def pending_tasks(self) -> int:
         """Return a count of pending tasks in the queue."""
-        return len(self.queue)
+        return len(self.queue) + self._checked_out
 
     @property
     def has_pending_tasks(self) -> bool:
         """Return a count of pending tasks in the queue."""
         return self.pending_tasks != 0
 
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth and latency metrics."""
+        finished = self._completed + self._failed
+        return {
+            "queued": len(self.queue),
+            "in_flight": self._in_flight,
+            "workers": self.workers,
+            "rate": self.rate,
+            "completed": self._completed,
+            "failed": self._failed,
+            "wait_avg": round(self._wait_total / finished, 3) if finished else 0.0,
+            "wait_max": round(self._wait_max, 3),
+            "run_avg": round(self._run_total / finished, 3) if finished else 0.0,
+            "run_max": round(self._run_max, 3),
+        }
+
     def clear(self) -> None:
         """Clear the queue."""
         self.queue = []
 
-    def add(self, task: Coroutine) -> None:
+    def add(self, task: Coroutine, priority: HacsQueuePriority = HacsQueuePriority.DEFAULT) -> None:
         """Add a task to the queue."""
-        self.queue.append(task)
+        heapq.heappush(self.queue, (priority, next(self._sequence), time.monotonic(), task))
+
+    async def _async_acquire_token(self) -> None:
+        """Wait for the token bucket to allow another task to start."""
+        if not self.rate:
+            return
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                float(self.workers), self._tokens + (now - self._token_time) * self.rate
+            )
+            self._token_time = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    async def _async_run_entry(self, added: float, task: Coroutine) -> None:
+        """Run a single task and record its metrics."""
+        try:
+            await self._async_acquire_token()
+        except asyncio.CancelledError:
+            # The task never started, close it so it is not reported as never awaited
+            task.close()
+            self._checked_out -= 1
+            raise
+        started = time.monotonic()
+        waited = started - added
+        self._wait_total += waited
+        self._wait_max = max(self._wait_max, waited)
+        self._in_flight += 1
+        try:
+            await task
+        except Exception as exception:  # pylint: disable=broad-except
+            self._failed += 1
+            _LOGGER.error("<QueueManager> %s", exception)
+        else:
+            self._completed += 1
+        finally:
+            self._in_flight -= 1
+            self._checked_out -= 1
+            runtime = time.monotonic() - started
+            self._run_total += runtime
+            self._run_max = max(self._run_max, runtime)
 
     async def execute(self, number_of_tasks: int | None = None) -> None:
         """Execute the tasks in the queue."""
@@ -52,31 +141,34 @@ class QueueManager:
         self.running = True
 
         _LOGGER.debug("<QueueManager> Checking out tasks to execute")
-        local_queue = []
-
-        if number_of_tasks:
-            for task in self.queue[:number_of_tasks]:
-                local_queue.append(task)
-        else:
-            for task in self.queue:
-                local_queue.append(task)
-
-        _LOGGER.debug("<QueueManager> Starting queue execution for %s tasks", len(local_queue))
+        local_queue: deque[tuple[float, Coroutine]] = deque()
+        for _ in range(min(number_of_tasks or len(self.queue), len(self.queue))):
+            _, _, added, task = heapq.heappop(self.queue)
+            local_queue.append((added, task))
+        self._checked_out += len(local_queue)
+        checked_out = len(local_queue)
+
+        async def _worker() -> None:
+            while local_queue:
+                await self._async_run_entry(*local_queue.popleft())
+
+        _LOGGER.debug("<QueueManager> Starting queue execution for %s tasks", checked_out)
         start = time.time()
-        result = await asyncio.gather(*local_queue, return_exceptions=True)
-        for entry in result:
-            if isinstance(entry, Exception):
-                _LOGGER.error("<QueueManager> %s", entry)
+        try:
+            await asyncio.gather(*(_worker() for _ in range(min(self.workers, checked_out))))
+        finally:
+            # Tasks left when the execution was cancelled are dropped
+            for _, task in local_queue:
+                task.close()
+            self._checked_out -= len(local_queue)
+            local_queue.clear()
+            self.running = False
         end = time.time() - start
 
-        for task in local_queue:
-            self.queue.remove(task)
-
         _LOGGER.debug(
             "<QueueManager> Queue execution finished for %s tasks finished in %.2f seconds",
-            len(local_queue),
+            checked_out,
             end,
         )
         if self.has_pending_tasks:
             _LOGGER.debug("<QueueManager> %s tasks remaining in the queue", len(self.queue))
-        self.running = False
@@ -18,12 +18,64 @@ if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
 
     from ..base import HacsBase
+    from ..repositories.base import HacsRepository
+
+
+def _repository_list_row_key(hacs: HacsBase, repo: HacsRepository) -> tuple[Any, ...]:
+    """Return a snapshot of the data the list row of a repository is built from.
+
+    Comparing the snapshot is much cheaper than building the row, which is only rebuilt
+    when the repository data or manifest changed.
+    """
+    return (
+        tuple(vars(repo.data).values()),
+        tuple(vars(repo.manifest_info).values()),
+        repo.content_local_path,
+        repo.pending_restart,
+        repo.state,
+        hacs.repositories.is_default(str(repo.data.id)),
+    )
+
+
+def _repository_list_row(hacs: HacsBase, repo: HacsRepository) -> dict[str, Any]:
+    """Return the list representation of a repository."""
+    return {
+        "authors": repo.data.authors,
+        "available_version": repo.display_available_version,
+        "installed_version": repo.display_installed_version,
+        "config_flow": repo.data.config_flow,
+        "can_download": repo.can_download,
+        "category": repo.data.category,
+        "country": repo.manifest_info.country,
+        "custom": not hacs.repositories.is_default(str(repo.data.id)),
+        "description": repo.data.description,
+        "domain": repo.data.domain,
+        "downloads": repo.data.downloads,
+        "file_name": repo.data.file_name,
+        "full_name": repo.data.full_name,
+        "hide": repo.data.hide,
+        "homeassistant": repo.manifest_info.homeassistant,
+        "id": repo.data.id,
+        "installed": repo.data.installed,
+        "last_updated": repo.data.last_updated,
+        "local_path": repo.content_local_path,
+        "name": repo.display_name,
+        "new": repo.data.new,
+        "pending_upgrade": repo.pending_update,
+        "stars": repo.data.stargazers_count,
+        "state": repo.state,
+        "status": repo.display_status,
+        "topics": repo.data.topics,
+    }
 
 
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "hacs/repositories/list",
         vol.Optional("categories"): [str],
+        vol.Optional("since"): vol.All(int, vol.Range(min=0)),
+        vol.Optional("page"): vol.All(int, vol.Range(min=1)),
+        vol.Optional("page_size"): vol.All(int, vol.Range(min=1)),
     }
 )
 @websocket_api.require_admin
@@ -33,45 +85,49 @@ async def hacs_repositories_list(
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
-    """List repositories."""
+    """List repositories.
+
+    Without ``since``, ``page`` or ``page_size`` the full list is returned as before.
+    Otherwise the result is a dict with the rows changed after list version ``since``,
+    the ids removed after it, the current version and the total number of rows.
+    """
     hacs: HacsBase = hass.data.get(DOMAIN)
+    since = msg.get("since")
+    rows = []
+
+    for category in sorted(msg.get("categories", hacs.common.categories)):
+        for repo in hacs.repositories.list_by_category(category):
+            if repo.ignored_by_country_configuration or not repo.data.last_fetched:
+                # Report rows that were listed before as removed
+                hacs.repositories.drop_list_row(repo)
+                continue
+            version, row = hacs.repositories.list_row(
+                repo,
+                _repository_list_row_key(hacs, repo),
+                lambda repo=repo: _repository_list_row(hacs, repo),
+            )
+            if since is None or version > since:
+                rows.append(row)
+
+    if since is None and "page" not in msg and "page_size" not in msg:
+        connection.send_message(websocket_api.result_message(msg["id"], rows))
+        return
+
+    total = len(rows)
+    if page_size := msg.get("page_size"):
+        rows.sort(key=lambda row: str(row["id"]))
+        offset = (msg.get("page", 1) - 1) * page_size
+        rows = rows[offset : offset + page_size]
+
     connection.send_message(
         websocket_api.result_message(
             msg["id"],
-            [
-                {
-                    "authors": repo.data.authors,
-                    "available_version": repo.display_available_version,
-                    "installed_version": repo.display_installed_version,
-                    "config_flow": repo.data.config_flow,
-                    "can_download": repo.can_download,
-                    "category": repo.data.category,
-                    "country": repo.repository_manifest.country,
-                    "custom": not hacs.repositories.is_default(str(repo.data.id)),
-                    "description": repo.data.description,
-                    "domain": repo.data.domain,
-                    "downloads": repo.data.downloads,
-                    "file_name": repo.data.file_name,
-                    "full_name": repo.data.full_name,
-                    "hide": repo.data.hide,
-                    "homeassistant": repo.repository_manifest.homeassistant,
-                    "id": repo.data.id,
-                    "installed": repo.data.installed,
-                    "last_updated": repo.data.last_updated,
-                    "local_path": repo.content.path.local,
-                    "name": repo.display_name,
-                    "new": repo.data.new,
-                    "pending_upgrade": repo.pending_update,
-                    "stars": repo.data.stargazers_count,
-                    "state": repo.state,
-                    "status": repo.display_status,
-                    "topics": repo.data.topics,
-                }
-                for repo in hacs.repositories.list_all
-                if repo.data.category in msg.get("categories", hacs.common.categories)
-                and not repo.ignored_by_country_configuration
-                and repo.data.last_fetched
-            ],
+            {
+                "repositories": rows,
+                "removed": hacs.repositories.list_removed_since(since or 0),
+                "version": hacs.repositories.list_version,
+                "total": total,
+            },
         )
     )
 
@@ -61,6 +61,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
 
         coordinator = MBAPI2020DataUpdateCoordinator(hass, config_entry)
         hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = coordinator
+        config_entry.async_on_unload(coordinator.client.oauth.async_shutdown)
+        config_entry.async_on_unload(coordinator.client.async_stop_debug_capture)
 
         await coordinator.client.set_rlock_mode()
 
@@ -0,0 +1,233 @@
+"""Offline check of the background token renewal against a fake token endpoint.
+
+Callers fetch the access token with Oauth.async_get_cached_token at random intervals, like the websocket and the
+REST API do, while a fake token endpoint answers refreshes after a delay. The clock of the event loop and of the
+token expiry runs faster than real time, so several token lifetimes pass within seconds.
+
+Without background renewal, the first caller after the expiry of a token waits for the refresh, and so does every
+caller arriving meanwhile. With it, the token is renewed before it expires and no caller ever waits: the check fails
+when a caller waits for the token endpoint, gets an expired token, or when a caller refreshes the token itself.
+Run it from the Home Assistant configuration directory:
+
+    python -m custom_components.mbapi2020.benchmark_oauth [--lifetimes N] [--endpoint-ms MS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import selectors
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from . import oauth
+from .app_version import AppVersionManager
+from .const import REGION_EUROPE
+from .oauth import Oauth
+from .ssl_helper import async_get_ssl_context
+
+RENEWAL_TASK_NAME = "mbapi2020 token renewal"
+DEFAULT_LIFETIMES = 3
+DEFAULT_ENDPOINT_MS = 2000.0
+TOKEN_LIFETIME_SECONDS = 3600
+CALLERS = 10
+MEAN_CALL_INTERVAL_SECONDS = 60
+# Seconds of the fake clock passing per real second
+SPEEDUP = 1000
+
+
+class _FastSelector(selectors.DefaultSelector):
+    """Selector waiting for the timeouts of the fast clock in real time."""
+
+    def select(self, timeout: float | None = None):
+        return super().select(None if timeout is None else timeout / SPEEDUP)
+
+
+class _FastClockEventLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock runs SPEEDUP times faster than real time."""
+
+    def __init__(self) -> None:
+        super().__init__(_FastSelector())
+        self._start = time.monotonic()
+        self.epoch = time.time()
+
+    def time(self) -> float:
+        return self._start + (time.monotonic() - self._start) * SPEEDUP
+
+    def wall_time(self) -> float:
+        """Return the time of the fast clock since the epoch, used for the token expiry."""
+        return self.epoch + self.time() - self._start
+
+
+class _FakeResponse:
+    """Response of the fake endpoints."""
+
+    status = 200
+
+    def __init__(self, body: dict[str, Any]) -> None:
+        self.body = body
+
+    async def __aenter__(self) -> _FakeResponse:
+        return self
+
+    async def __aexit__(self, *_args) -> None:
+        return None
+
+    async def json(self, content_type: str | None = None) -> dict[str, Any]:
+        return self.body
+
+    async def text(self) -> str:
+        return ""
+
+
+class _FakeSession:
+    """Client session answering the config endpoint at once and the token endpoint after a delay."""
+
+    closed = False
+
+    def __init__(self, endpoint_delay: float) -> None:
+        self.endpoint_delay = endpoint_delay
+        self.refreshes = {"background": 0, "callers": 0}
+        self.tokens = 0
+
+    def get(self, url: str, **_kwargs) -> _FakeResponse:
+        return _FakeResponse({})
+
+    def request(self, method: str, url: str, data: str = "", **_kwargs):
+        if url.endswith("/as/token.oauth2"):
+            return self._token_response()
+        return _FakeResponse({})
+
+    def _token_response(self):
+        task = asyncio.current_task()
+        by = "background" if task is not None and task.get_name() == RENEWAL_TASK_NAME else "callers"
+        self.refreshes[by] += 1
+        session = self
+
+        class _DelayedResponse(_FakeResponse):
+            async def __aenter__(self) -> _FakeResponse:
+                await asyncio.sleep(session.endpoint_delay)
+                self.body = session.issue_token()
+                return self
+
+        return _DelayedResponse({})
+
+    def issue_token(self) -> dict[str, Any]:
+        """Return a new token of the token endpoint."""
+        self.tokens += 1
+        return {
+            "access_token": f"access-{self.tokens}",
+            "refresh_token": f"refresh-{self.tokens}",
+            "expires_in": TOKEN_LIFETIME_SECONDS,
+        }
+
+
+class _StubHass:
+    """Home Assistant stub for Oauth."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+
+    def async_create_background_task(self, target, name: str, eager_start: bool = True) -> asyncio.Task:
+        return self.loop.create_task(target, name=name)
+
+    async def async_add_executor_job(self, target, *args):
+        return await self.loop.run_in_executor(None, target, *args)
+
+
+async def _async_caller(auth: Oauth, stats: dict[str, Any], until: float, rng: random.Random) -> None:
+    """Fetch the token at random intervals until the end of the run."""
+    loop = asyncio.get_running_loop()
+    while (delay := rng.expovariate(1 / MEAN_CALL_INTERVAL_SECONDS)) < until - loop.time():
+        await asyncio.sleep(delay)
+        start = loop.time()
+        # Started eagerly, the call is done at once unless it waits for the token endpoint
+        task = asyncio.Task(auth.async_get_cached_token(), loop=loop, eager_start=True)
+        waited = not task.done()
+        token_info = await task
+        stats["calls"] += 1
+        if waited:
+            stats["waited"] += 1
+            stats["max_wait"] = max(stats["max_wait"], loop.time() - start)
+        if Oauth.is_token_expired(token_info):
+            stats["expired"] += 1
+
+
+async def _async_run(lifetimes: int, endpoint_delay: float, background: bool) -> dict[str, Any]:
+    """Let the callers fetch the token for some token lifetimes, return the measurements."""
+    loop = asyncio.get_running_loop()
+    session = _FakeSession(endpoint_delay)
+    auth = Oauth(_StubHass(loop), session, REGION_EUROPE, None, AppVersionManager(REGION_EUROPE))
+    if not background:
+        auth._schedule_token_renewal = lambda *_args, **_kwargs: None  # noqa: SLF001
+    auth.token = auth._add_custom_values_to_token_info(session.issue_token())  # noqa: SLF001
+
+    stats = {"calls": 0, "waited": 0, "max_wait": 0.0, "expired": 0}
+    until = loop.time() + lifetimes * TOKEN_LIFETIME_SECONDS
+    rng = random.Random(0)
+    await asyncio.gather(*(_async_caller(auth, stats, until, rng) for _ in range(CALLERS)))
+    auth.async_shutdown()
+
+    return {
+        "mode": "background" if background else "on expiry",
+        **stats,
+        "refreshes": session.refreshes,
+    }
+
+
+async def _async_main(args: argparse.Namespace) -> bool:
+    """Run both modes, print the results and return if no caller waited with background renewal."""
+    # Tokens expire on the fast clock as well
+    loop = asyncio.get_running_loop()
+    oauth.time = SimpleNamespace(time=loop.wall_time)
+    # Create the SSL context up front, the executor job would take seconds of the fast clock
+    await async_get_ssl_context(_StubHass(loop))
+    endpoint_delay = args.endpoint_ms / 1000
+    runs = [await _async_run(args.lifetimes, endpoint_delay, background) for background in (False, True)]
+
+    print(
+        f"{CALLERS} callers over {args.lifetimes} token lifetimes of {TOKEN_LIFETIME_SECONDS} s,"
+        f" token endpoint answering after {args.endpoint_ms:g} ms"
+    )
+    print(
+        f"{'renewal':<12}{'calls':>7}{'waited':>8}{'max wait (ms)':>15}{'expired':>9}"
+        f"{'refreshes':>11}{'by callers':>12}{'ok':>5}"
+    )
+    passed = True
+    for run in runs:
+        refreshes = run["refreshes"]
+        ok = run["mode"] == "on expiry" or not (run["waited"] or run["expired"] or refreshes["callers"])
+        passed &= ok
+        print(
+            f"{run['mode']:<12}{run['calls']:>7}{run['waited']:>8}{run['max_wait'] * 1000:>15.0f}"
+            f"{run['expired']:>9}{sum(refreshes.values()):>11}{refreshes['callers']:>12}{'yes' if ok else 'NO':>5}"
+        )
+    return passed
+
+
+def main() -> None:
+    """Run the check."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--lifetimes", type=int, default=DEFAULT_LIFETIMES, help="token lifetimes the callers fetch the token for"
+    )
+    parser.add_argument(
+        "--endpoint-ms",
+        type=float,
+        default=DEFAULT_ENDPOINT_MS,
+        help="delay of the fake token endpoint, in ms of the fast clock",
+    )
+    args = parser.parse_args()
+    loop = _FastClockEventLoop()
+    try:
+        passed = loop.run_until_complete(_async_main(args))
+    finally:
+        loop.close()
+    if not passed:
+        raise SystemExit("Callers waited for the token endpoint despite the background renewal")
+
+
+if __name__ == "__main__":
+    main()
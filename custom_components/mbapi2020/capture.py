@@ -0,0 +1,297 @@
+"""Debug capture of websocket messages for MBAPI2020 integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+import contextlib
+import gzip
+from pathlib import Path
+import struct
+import time
+from typing import IO, TYPE_CHECKING, NamedTuple
+
+from google.protobuf.json_format import MessageToJson
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    CAPTURE_BATCH_SIZE,
+    CAPTURE_COMPRESS,
+    CAPTURE_FILE_PREFIX,
+    CAPTURE_MAX_TOTAL_SIZE,
+    CAPTURE_QUEUE_SIZE,
+    CAPTURE_SEGMENT_SIZE,
+    LOGGER,
+)
+from .proto import vehicle_events_pb2
+
+if TYPE_CHECKING:
+    from .client import Client
+
+CAPTURE_SUFFIX = ".mbcap"
+CAPTURE_MAGIC = b"MBCAP1\n"
+# Datatype of the VEPUpdate messages of the REST API, all other frames are websocket PushMessages
+REST_VEP_UPDATE_DATATYPE = "rfu"
+
+# Frame header: payload length, capture time in ms, message datatype (e.g. "vep", "ssu")
+_FRAME_HEADER = struct.Struct(">IQ3s")
+
+
+class CaptureFrame(NamedTuple):
+    """A single captured message."""
+
+    timestamp: int
+    datatype: str
+    payload: bytes
+
+
+def list_capture_segments(path: str | Path) -> list[Path]:
+    """Return the capture segment files of a directory, oldest first."""
+    path = Path(path)
+    if not path.is_dir():
+        return []
+    return sorted(path.glob(f"{CAPTURE_FILE_PREFIX}_*{CAPTURE_SUFFIX}*"), key=lambda segment: segment.name)
+
+
+def iter_capture_frames(path: str | Path) -> Iterator[CaptureFrame]:
+    """Yield the frames of a capture segment, or of all segments in a directory.
+
+    A truncated last frame, left behind when Home Assistant was stopped while
+    capturing, ends the segment without an error.
+    """
+    path = Path(path)
+    if path.is_dir():
+        for segment in list_capture_segments(path):
+            yield from iter_capture_frames(segment)
+        return
+
+    opener = gzip.open if path.suffix == ".gz" else Path.open
+    with opener(path, "rb") as capture_file:
+        if capture_file.read(len(CAPTURE_MAGIC)) != CAPTURE_MAGIC:
+            raise ValueError(f"{path} is not a mbapi2020 capture file")
+        try:
+            while len(header := capture_file.read(_FRAME_HEADER.size)) == _FRAME_HEADER.size:
+                length, timestamp, datatype = _FRAME_HEADER.unpack(header)
+                payload = capture_file.read(length)
+                if len(payload) != length:
+                    LOGGER.debug("Capture %s ends with a truncated frame", path)
+                    return
+                yield CaptureFrame(timestamp, datatype.rstrip(b"\0").decode("ascii"), payload)
+        except EOFError:
+            LOGGER.debug("Capture %s ends with a truncated gzip stream", path)
+
+
+def parse_capture_frame(frame: CaptureFrame):
+    """Return the protobuf message of a frame, a VEPUpdate for REST API updates, a PushMessage otherwise."""
+    if frame.datatype == REST_VEP_UPDATE_DATATYPE:
+        message = vehicle_events_pb2.VEPUpdate()
+    else:
+        message = vehicle_events_pb2.PushMessage()
+    message.ParseFromString(frame.payload)
+    return message
+
+
+def _replay_frame(client: Client, frame: CaptureFrame) -> None:
+    """Feed a frame through the client handler of its datatype."""
+    message = parse_capture_frame(frame)
+    if frame.datatype == REST_VEP_UPDATE_DATATYPE:
+        client._process_rest_vep_update(message)  # noqa: SLF001
+    else:
+        client.on_data(message)
+
+
+def replay_capture(client: Client, path: str | Path) -> int:
+    """Feed the messages of a capture through the client, return the number replayed.
+
+    Websocket messages go through Client.on_data, REST API updates through the REST
+    update handler. Reads the capture from disk, so this has to run outside of the
+    event loop, e.g. in offline reproduction or benchmark scripts.
+    """
+    replayed = 0
+    for frame in iter_capture_frames(path):
+        _replay_frame(client, frame)
+        replayed += 1
+    return replayed
+
+
+async def async_replay_capture(hass: HomeAssistant, client: Client, path: str | Path) -> int:
+    """Feed the messages of a capture through the client, return the number replayed."""
+    frames = await hass.async_add_executor_job(list, iter_capture_frames(path))
+    for frame in frames:
+        _replay_frame(client, frame)
+    return len(frames)
+
+
+def export_capture_json(path: str | Path, output: str | Path) -> int:
+    """Write every frame of a capture to a JSON file in a directory, return the number written.
+
+    The files are named and formatted like the former per-message debug files, blocking.
+    """
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    exported = 0
+    for frame in iter_capture_frames(path):
+        (output / f"{frame.datatype}{frame.timestamp}.json").write_text(
+            MessageToJson(parse_capture_frame(frame), preserving_proto_field_name=True), encoding="utf-8"
+        )
+        exported += 1
+    return exported
+
+
+class CaptureWriter:
+    """Append websocket messages to rotating capture segments in the background.
+
+    Messages are queued on the event loop and written in batches in the executor as
+    length-prefixed raw protobuf frames. A segment is closed once it holds
+    ``segment_size`` bytes of frames, the oldest segments are removed to keep the
+    capture below ``max_total_size`` bytes. When the queue is full, messages are dropped.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        path: str,
+        *,
+        segment_size: int = CAPTURE_SEGMENT_SIZE,
+        max_total_size: int = CAPTURE_MAX_TOTAL_SIZE,
+        compress: bool = CAPTURE_COMPRESS,
+        queue_size: int = CAPTURE_QUEUE_SIZE,
+    ) -> None:
+        """Initialize the capture writer."""
+        self._hass = hass
+        self._path = Path(path)
+        self._segment_size = segment_size
+        self._max_total_size = max(max_total_size, segment_size)
+        self._compress = compress
+        self._queue: asyncio.Queue[CaptureFrame | None] = asyncio.Queue(maxsize=queue_size)
+        self._task: asyncio.Task | None = None
+        self._file: IO[bytes] | None = None
+        self._segment_bytes = 0
+        self._sequence = 0
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.segments_removed = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return the counters of the capture."""
+        return {
+            "queued": self._queue.qsize(),
+            "written": self.frames_written,
+            "dropped": self.frames_dropped,
+            "segments_removed": self.segments_removed,
+        }
+
+    def capture(self, datatype: str, payload: bytes) -> None:
+        """Queue a serialized message for writing, must run in the event loop."""
+        if self._task is None:
+            self._task = self._hass.async_create_background_task(self._async_run(), name="mbapi2020 debug capture")
+        try:
+            self._queue.put_nowait(CaptureFrame(int(time.time() * 1000), datatype, payload))
+        except asyncio.QueueFull:
+            if not self.frames_dropped:
+                LOGGER.warning("Debug capture can not keep up, dropping messages")
+            self.frames_dropped += 1
+
+    async def async_stop(self) -> None:
+        """Write the queued messages and close the current segment."""
+        if self._task is None:
+            return
+        task, self._task = self._task, None
+        if not task.done():
+            try:
+                self._queue.put_nowait(None)
+            except asyncio.QueueFull:
+                # Make room for the stop marker, the writer is running and drains the queue
+                self._queue.get_nowait()
+                self.frames_dropped += 1
+                self._queue.put_nowait(None)
+            await asyncio.wait((task,))
+        if self._file is not None:
+            # Left open by a writer that did not finish
+            await self._hass.async_add_executor_job(self._reset_segment)
+        LOGGER.debug("Debug capture stopped: %s", self.stats)
+
+    async def _async_run(self) -> None:
+        """Write batches of queued messages until stopped."""
+        stop = False
+        while not stop:
+            batch = [await self._queue.get()]
+            while len(batch) < CAPTURE_BATCH_SIZE and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            stop = None in batch
+            try:
+                await self._hass.async_add_executor_job(
+                    self._write_frames, [frame for frame in batch if frame is not None], stop
+                )
+            except Exception as err:  # noqa: BLE001 - a failed write must not stop the capture
+                LOGGER.error("Error writing debug capture to %s: %s", self._path, err)
+
+    def _write_frames(self, frames: list[CaptureFrame], close: bool) -> None:
+        """Append frames to the current segment, rotating when full, blocking.
+
+        On an error the current segment is given up, the next frame starts a new one.
+        """
+        try:
+            self._append_frames(frames, close)
+        except Exception:
+            self._reset_segment()
+            raise
+
+    def _append_frames(self, frames: list[CaptureFrame], close: bool) -> None:
+        """Append frames to the current segment, rotating when full, blocking."""
+        for frame in frames:
+            if self._file is None:
+                self._open_segment()
+            self._file.write(
+                _FRAME_HEADER.pack(len(frame.payload), frame.timestamp, frame.datatype.encode("ascii"))
+                + frame.payload
+            )
+            self.frames_written += 1
+            self._segment_bytes += _FRAME_HEADER.size + len(frame.payload)
+            if self._segment_bytes >= self._segment_size:
+                self._close_segment()
+
+        if close:
+            self._close_segment()
+        elif self._file is not None and not self._compress:
+            self._file.flush()
+
+    def _open_segment(self) -> None:
+        """Start a new segment, removing old ones to make room for it, blocking."""
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._remove_old_segments(self._max_total_size - self._segment_size)
+
+        name = f"{CAPTURE_FILE_PREFIX}_{int(time.time() * 1000)}_{self._sequence:04d}{CAPTURE_SUFFIX}"
+        self._sequence += 1
+        if self._compress:
+            self._file = gzip.open(self._path / f"{name}.gz", "wb")
+        else:
+            self._file = (self._path / name).open("wb")
+        self._file.write(CAPTURE_MAGIC)
+        self._segment_bytes = len(CAPTURE_MAGIC)
+
+    def _close_segment(self) -> None:
+        """Close the current segment, blocking."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _reset_segment(self) -> None:
+        """Give up the current segment after an error, closing it if still possible, blocking."""
+        capture_file, self._file = self._file, None
+        if capture_file is not None:
+            with contextlib.suppress(Exception):
+                capture_file.close()
+
+    def _remove_old_segments(self, budget: int) -> None:
+        """Remove the oldest segments until the others fit in the budget, blocking."""
+        segments = [(segment, segment.stat().st_size) for segment in list_capture_segments(self._path)]
+        total = sum(size for _, size in segments)
+        for segment, size in segments:
+            if total <= budget:
+                break
+            segment.unlink(missing_ok=True)
+            total -= size
+            self.segments_removed += 1
+
@@ -25,6 +25,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import system_info
 
+from .capture import CaptureWriter
 from .car import (
     AUX_HEAT_OPTIONS,
     BINARY_SENSOR_OPTIONS,
@@ -98,6 +99,7 @@ class Client:
         self._disable_rlock = False
         self.__lock = None
         self._debug_save_path = self._hass.config.path(DEFAULT_CACHE_PATH)
+        self._capture: CaptureWriter | None = None
         self.config_entry = config_entry
         self.session_id = str(uuid.uuid4()).upper()
 
@@ -2251,19 +2253,15 @@ class Client:
 
     def _write_debug_output(self, data, datatype):
         if self.config_entry.options.get(CONF_DEBUG_FILE_SAVE, False):
-            self._hass.async_add_executor_job(self.__write_debug_output, data, datatype)
-
-    def __write_debug_output(self, data, datatype):
-        if self.config_entry.options.get(CONF_DEBUG_FILE_SAVE, False):
-            # LOGGER.debug("Start _write_debug_output")
-
-            path = self._debug_save_path
-            Path(path).mkdir(parents=True, exist_ok=True)
-
-            with Path(f"{path}/{datatype}{int(round(time.time() * 1000))}").open("wb") as current_file:
-                current_file.write(data.SerializeToString())
-
-            self.write_debug_json_output(MessageToJson(data, preserving_proto_field_name=True), datatype)
+            if self._capture is None:
+                self._capture = CaptureWriter(self._hass, self._debug_save_path)
+            self._capture.capture(datatype, data.SerializeToString())
+
+    async def async_stop_debug_capture(self):
+        """Write the pending debug capture messages and close the capture."""
+        if self._capture is not None:
+            await self._capture.async_stop()
+            self._capture = None
 
     def write_debug_json_output(self, data, datatype, use_dumps: bool = False):
         """Write text to files based on datatype."""
@@ -66,6 +66,14 @@ UPDATE_INTERVAL = timedelta(seconds=180)
 STATE_CONFIRMATION_DURATION = 60
 
 DEFAULT_CACHE_PATH = "custom_components/mbapi2020/messages"
+
+# Debug capture of websocket messages, written to rotating segment files in DEFAULT_CACHE_PATH
+CAPTURE_FILE_PREFIX = "capture"
+CAPTURE_QUEUE_SIZE = 1000
+CAPTURE_BATCH_SIZE = 100
+CAPTURE_SEGMENT_SIZE = 8 * 1024 * 1024
+CAPTURE_MAX_TOTAL_SIZE = 64 * 1024 * 1024
+CAPTURE_COMPRESS = True
 DEFAULT_DOWNLOAD_PATH = "custom_components/mbapi2020/resources"
 DEFAULT_LOCALE = "en-GB"
 DEFAULT_COUNTRY_CODE = "EN"
@@ -0,0 +1,40 @@
+"""Export the frames of a MBAPI2020 debug capture as JSON.
+
+Run it from the Home Assistant configuration directory:
+
+    python -m custom_components.mbapi2020.export_capture PATH [--output DIR]
+
+PATH is a capture segment or the directory of the capture segments. Without an output directory, a JSON object per
+frame is printed. With it, every frame is written to a <datatype><timestamp>.json file, like the per-message debug
+files written before the capture.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from google.protobuf.json_format import MessageToDict
+
+from .capture import export_capture_json, iter_capture_frames, parse_capture_frame
+
+
+def main() -> None:
+    """Export the capture."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("path", type=Path, help="capture segment, or directory of capture segments")
+    parser.add_argument("--output", type=Path, help="directory to write a JSON file per frame to")
+    args = parser.parse_args()
+
+    if args.output:
+        exported = export_capture_json(args.path, args.output)
+        print(f"Exported {exported} frames to {args.output}")
+        return
+    for frame in iter_capture_frames(args.path):
+        message = MessageToDict(parse_capture_frame(frame), preserving_proto_field_name=True)
+        print(json.dumps({"timestamp": frame.timestamp, "datatype": frame.datatype, "message": message}))
+
+
+if __name__ == "__main__":
+    main()
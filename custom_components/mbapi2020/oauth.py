@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import asyncio
 import base64
-from copy import deepcopy
 import hashlib
 import json
 import logging
@@ -44,6 +43,12 @@ _LOGGER = logging.getLogger(__name__)
 GATEWAY_ERROR_CODES = (502, 503, 504)
 LOGIN_MAX_ATTEMPTS = 3
 LOGIN_RETRY_BACKOFF_SECONDS = 5
+# Tokens are treated as expired this many seconds before their expiry
+TOKEN_EXPIRY_MARGIN_SECONDS = 60
+# Fraction of a token's lifetime (expires_in) after which it is renewed in the background
+TOKEN_RENEWAL_FRACTION = 0.75
+TOKEN_RENEWAL_RETRY_SECONDS = 15
+TOKEN_RENEWAL_MAX_RETRY_SECONDS = 300
 
 
 class Oauth:
@@ -61,6 +66,7 @@ class Oauth:
         region: str,
         config_entry: ConfigEntry,
         app_version: AppVersionManager,
+        renewal_fraction: float = TOKEN_RENEWAL_FRACTION,
     ) -> None:
         """Initialize the extended OAuth instance."""
         self._session: ClientSession = session
@@ -71,6 +77,11 @@ class Oauth:
         self.token = None
         self._sessionid = ""
         self._get_token_lock = asyncio.Lock()
+        self._renewal_fraction = min(max(renewal_fraction, 0.1), 0.95)
+        self._renewal_handle: asyncio.TimerHandle | None = None
+        self._renewal_task: asyncio.Task | None = None
+        self._renewal_token: dict[str, Any] | None = None
+        self._renewal_attempt = 0
         self._device_guid: str = (config_entry.data.get("device_guid") if config_entry else None) or str(uuid.uuid4())
 
         if region == REGION_CHINA:
@@ -501,8 +512,7 @@ class Oauth:
         except MBAuthError:
             if is_retry:
                 if self._config_entry and self._config_entry.data:
-                    new_config_entry_data = deepcopy(dict(self._config_entry.data))
-                    new_config_entry_data.pop("token", None)
+                    new_config_entry_data = {k: v for k, v in self._config_entry.data.items() if k != "token"}
                     self._hass.config_entries.async_update_entry(self._config_entry, data=new_config_entry_data)
                 raise
 
@@ -541,6 +551,8 @@ class Oauth:
                     token_info = await self.async_refresh_access_token(token_info["refresh_token"], is_retry=False)
 
         self.token = token_info
+        if token_info and token_info is not self._renewal_token and self._renewal_task is None:
+            self._schedule_token_renewal(token_info)
         return token_info
 
     @classmethod
@@ -548,25 +560,102 @@ class Oauth:
         """Check if the token is expired."""
         if token_info is not None:
             now = int(time.time())
-            return token_info["expires_at"] - now < 60
+            return token_info["expires_at"] - now < TOKEN_EXPIRY_MARGIN_SECONDS
         return True
 
-    def _save_token_info(self, token_info):
-        """Save token info."""
-        if self._config_entry:
-            _LOGGER.debug(
-                "Start _save_token_info() to config_entry %s",
-                self._config_entry.entry_id,
-            )
+    def _schedule_token_renewal(self, token_info, delay: float | None = None) -> None:
+        """Schedule the background renewal of a token.
 
-            new_config_entry_data = deepcopy(dict(self._config_entry.data))
-            new_config_entry_data["token"] = token_info
+        Without a delay, the token is renewed once the renewal fraction of its lifetime has passed.
+        """
+        self.cancel_token_renewal()
+        self._renewal_token = token_info
+        if delay is None:
+            expires_in = token_info.get("expires_in") or 0
+            renew_at = token_info["expires_at"] - expires_in * (1 - self._renewal_fraction)
+            delay = max(0.0, renew_at - time.time())
+            self._renewal_attempt = 0
+        _LOGGER.debug("Token renewal scheduled in %.0f seconds", delay)
+        self._renewal_handle = self._hass.loop.call_later(delay, self._start_token_renewal)
+
+    def _start_token_renewal(self) -> None:
+        """Start the background renewal of the current token."""
+        self._renewal_handle = None
+        self._renewal_task = self._hass.async_create_background_task(
+            self._async_renew_token(), name="mbapi2020 token renewal"
+        )
 
-            # Ensure device_guid is preserved
-            if self._device_guid:
-                new_config_entry_data["device_guid"] = self._device_guid
+    async def _async_renew_token(self) -> None:
+        """Renew the current token in the background, retrying with backoff until its expiry."""
+        token_info = self.token
+        try:
+            async with self._get_token_lock:
+                if self.token is not token_info:
+                    # Renewed meanwhile, by a caller that found the token expired
+                    new_token_info = self.token
+                elif token_info and "refresh_token" in token_info:
+                    new_token_info = await self.async_refresh_access_token(token_info["refresh_token"], is_retry=False)
+                else:
+                    new_token_info = None
+        except (aiohttp.ClientError, TimeoutError, MBAuthError) as err:
+            _LOGGER.debug("Background token renewal failed: %s", err)
+            new_token_info = None
+        finally:
+            self._renewal_task = None
+
+        if new_token_info:
+            self._schedule_token_renewal(new_token_info)
+            return
+        if not token_info:
+            return
+
+        # Retry with backoff, as long as the token has not expired
+        self._renewal_attempt += 1
+        remaining = token_info["expires_at"] - TOKEN_EXPIRY_MARGIN_SECONDS - time.time()
+        delay = min(
+            TOKEN_RENEWAL_RETRY_SECONDS * 2 ** (self._renewal_attempt - 1),
+            TOKEN_RENEWAL_MAX_RETRY_SECONDS,
+            remaining / 2,
+        )
+        if delay < 1:
+            _LOGGER.warning("Background token renewal failed, token will be refreshed on next use")
+            return
+        self._schedule_token_renewal(token_info, delay)
+
+    def cancel_token_renewal(self) -> None:
+        """Cancel a scheduled background token renewal."""
+        if self._renewal_handle is not None:
+            self._renewal_handle.cancel()
+            self._renewal_handle = None
+
+    def async_shutdown(self) -> None:
+        """Stop renewing the token in the background."""
+        self.cancel_token_renewal()
+        self._renewal_token = None
+        if self._renewal_task is not None:
+            self._renewal_task.cancel()
+            self._renewal_task = None
 
-            self._hass.config_entries.async_update_entry(self._config_entry, data=new_config_entry_data)
+    def _save_token_info(self, token_info):
+        """Save token info, when it changed."""
+        if self._config_entry:
+            data = self._config_entry.data
+            stored = data.get("token") or {}
+            changed = [key for key, value in token_info.items() if stored.get(key) != value]
+            if changed or stored.keys() - token_info.keys() or data.get("device_guid") != self._device_guid:
+                _LOGGER.debug(
+                    "Start _save_token_info() to config_entry %s, changed token fields: %s",
+                    self._config_entry.entry_id,
+                    ", ".join(sorted(changed)),
+                )
+
+                new_config_entry_data = {**data, "token": dict(token_info)}
+
+                # Ensure device_guid is preserved
+                if self._device_guid:
+                    new_config_entry_data["device_guid"] = self._device_guid
+
+                self._hass.config_entries.async_update_entry(self._config_entry, data=new_config_entry_data)
 
     @classmethod
     def _add_custom_values_to_token_info(cls, token_info):
@@ -0,0 +1,223 @@
+"""Benchmark of a Pirate Weather update over a full sensor set.
+
+Builds every sensor the integration offers, for the current conditions and for each
+forecast day and hour, plus the weather entity. Each update creates a new Forecast
+from an API response, like the coordinator does, and reads the state of every sensor
+and the current conditions and forecasts of the weather entity.
+
+Two modes are compared:
+
+- cached: forecast blocks are parsed once per update and shared by all entities.
+- uncached: every block access parses the block again, as before blocks were cached.
+
+Run it from the Home Assistant configuration directory:
+
+    python -m custom_components.pirateweather.benchmark [--fixture FILE] [--updates N]
+
+Without a fixture, a synthetic response with 61 minutely, 168 hourly, 8 daily and 16
+day/night data points is used. A fixture is a saved Pirate Weather API response.
+"""
+
+import argparse
+import json
+from pathlib import Path
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from .forecast_models import Forecast, PirateWeatherDataPoint
+from .sensor import SENSOR_TYPES, PirateWeatherSensor, convert_to_camel
+from .weather import PirateWeather
+
+DEFAULT_UPDATES = 50
+FORECAST_DAYS = range(8)
+FORECAST_HOURS = range(48)
+START_TIME = 1714564800
+
+
+def _data_point(time_offset):
+    """Return a data point holding a value for every sensor type."""
+    data_point = {}
+    for key in SENSOR_TYPES:
+        if key.endswith("time"):
+            data_point[convert_to_camel(key)] = START_TIME + time_offset
+        else:
+            data_point[convert_to_camel(key)] = 0.5
+    data_point.update(
+        time=START_TIME + time_offset,
+        summary="Partly Cloudy",
+        icon="partly-cloudy-day",
+        sunriseTime=START_TIME + time_offset + 21600,
+        sunsetTime=START_TIME + time_offset + 64800,
+    )
+    return data_point
+
+
+def _block(count, step):
+    """Return a forecast block of count data points step seconds apart."""
+    return {
+        "summary": "Partly Cloudy",
+        "icon": "partly-cloudy-day",
+        "data": [_data_point(idx * step) for idx in range(count)],
+    }
+
+
+def synthetic_response():
+    """Return an API response with every block of an extended hourly forecast."""
+    return {
+        "latitude": 45.42,
+        "longitude": -75.69,
+        "timezone": "America/Toronto",
+        "offset": -4,
+        "currently": _data_point(0),
+        "minutely": _block(61, 60),
+        "hourly": _block(168, 3600),
+        "daily": _block(8, 86400),
+        "day_night": _block(16, 43200),
+        "alerts": [],
+        "flags": {
+            "sources": ["hrrr", "gfs", "gefs"],
+            "sourceTimes": {
+                "hrrr_0-18": "2024-05-01 10Z",
+                "hrrr_18-48": "2024-05-01 06Z",
+                "gfs": "2024-05-01 00Z",
+                "gefs": "2024-05-01 00Z",
+            },
+            "nearest-station": 0,
+            "units": "si",
+            "version": "V2.0",
+        },
+    }
+
+
+def _entities(coordinator):
+    """Return every sensor, for each forecast day and hour, and the weather entity."""
+    sensors = []
+    for condition, description in SENSOR_TYPES.items():
+        modes = description.forecast_mode
+        if not modes or "currently" in modes:
+            sensors.append((condition, description, None, None))
+        if "daily" in modes:
+            sensors.extend((condition, description, day, None) for day in FORECAST_DAYS)
+        if "hourly" in modes:
+            sensors.extend(
+                (condition, description, None, hour) for hour in FORECAST_HOURS
+            )
+
+    entities = [
+        PirateWeatherSensor(
+            coordinator,
+            condition,
+            "Benchmark",
+            f"benchmark-{condition}-{day}-{hour}",
+            forecast_day=day,
+            forecast_hour=hour,
+            description=description,
+            requestUnits="si",
+            outputRound="No",
+            service_id="benchmark",
+        )
+        for condition, description, day, hour in sensors
+    ]
+    weather = PirateWeather(
+        "Benchmark", "benchmark", "daily", coordinator, "No", "benchmark"
+    )
+    return entities, weather
+
+
+def _update(coordinator, response, sensors, weather):
+    """Publish a new forecast and read every entity like a state write does."""
+    coordinator.data = Forecast(json.loads(response), None, {})
+    for sensor in sensors:
+        sensor.native_value  # noqa: B018
+    weather.native_temperature  # noqa: B018
+    weather.humidity  # noqa: B018
+    weather.condition  # noqa: B018
+    weather._async_forecast_daily()  # noqa: SLF001
+    weather._async_forecast_twice_daily()  # noqa: SLF001
+    weather._async_forecast_hourly()  # noqa: SLF001
+
+
+def _count_data_points(coordinator, response, sensors, weather):
+    """Return the number of data points created by one update."""
+    created = 0
+    init = PirateWeatherDataPoint.__init__
+
+    def _counting_init(self, *args, **kwargs):
+        nonlocal created
+        created += 1
+        init(self, *args, **kwargs)
+
+    PirateWeatherDataPoint.__init__ = _counting_init
+    try:
+        _update(coordinator, response, sensors, weather)
+    finally:
+        PirateWeatherDataPoint.__init__ = init
+    return created
+
+
+def benchmark(response, updates, cached):
+    """Time updates in one mode.
+
+    Return the number of sensors, the time per update in ms, the number of data points
+    created by an update and its peak memory in KiB.
+    """
+    parse = Forecast._pirateweather_data  # noqa: SLF001
+    if not cached:
+        Forecast._pirateweather_data = Forecast._parse_pirateweather_data  # noqa: SLF001
+    try:
+        coordinator = SimpleNamespace(
+            data=Forecast(json.loads(response), None, {}), requested_units="si"
+        )
+        sensors, weather = _entities(coordinator)
+
+        start = time.perf_counter()
+        for _ in range(updates):
+            _update(coordinator, response, sensors, weather)
+        elapsed = (time.perf_counter() - start) / updates
+
+        data_points = _count_data_points(coordinator, response, sensors, weather)
+        tracemalloc.start()
+        _update(coordinator, response, sensors, weather)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        Forecast._pirateweather_data = parse  # noqa: SLF001
+    return len(sensors), elapsed * 1000, data_points, peak / 1024
+
+
+def main():
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--fixture", type=Path, help="saved Pirate Weather response")
+    parser.add_argument(
+        "--updates",
+        type=int,
+        default=DEFAULT_UPDATES,
+        help="number of coordinator updates to time",
+    )
+    args = parser.parse_args()
+
+    if args.fixture:
+        response = args.fixture.read_text(encoding="utf-8")
+    else:
+        response = json.dumps(synthetic_response())
+
+    print(
+        f"{'mode':<10}{'sensors':>9}{'update (ms)':>13}{'data points':>13}"
+        f"{'peak (KiB)':>12}"
+    )
+    results = {}
+    for mode in ("uncached", "cached"):
+        sensors, elapsed, data_points, peak = benchmark(
+            response, args.updates, mode == "cached"
+        )
+        results[mode] = elapsed
+        print(
+            f"{mode:<10}{sensors:>9}{elapsed:>13.2f}{data_points:>13}{peak:>12.0f}"
+        )
+    print(f"\ncached updates are {results['uncached'] / results['cached']:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
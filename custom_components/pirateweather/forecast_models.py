@@ -2,12 +2,14 @@
 
 import datetime
 
-import requests
+FORECAST_BLOCKS = ("minutely", "currently", "hourly", "daily", "flags", "day_night")
 
 
 class UnicodeMixin:
     """Provide string representation for Python 2/3 compatibility."""
 
+    __slots__ = ()
+
     def __str__(self):
         """Return the unicode representation of the object for Python 2/3 compatibility."""
         return self.__unicode__()
@@ -19,21 +21,31 @@ class UnicodeMixin:
 class Forecast(UnicodeMixin):
     """Represent the forecast data and provide methods to access weather blocks."""
 
-    def __init__(self, data, response, headers):
-        """Initialize the Forecast with data, HTTP response, and headers."""
+    def __init__(self, data, response, headers, on_missing_block=None):
+        """Initialize the Forecast with data, HTTP response, and headers.
+
+        on_missing_block is called with the forecast and the key of a block that is
+        read but missing from the response, so it can be fetched in the background.
+        """
         self.response = response
         self.http_headers = headers
         self.json = data
+        self._on_missing_block = on_missing_block
+        # Parsed blocks, shared by every sensor and the weather entity until the next update
+        self._blocks = {}
 
         self._alerts = []
         for alertJSON in self.json.get("alerts", []):
             self._alerts.append(Alert(alertJSON))
 
-    def update(self):
-        """Update the forecast data by making a new request to the same URL."""
-        r = requests.get(self.response.url)
-        self.json = r.json()
-        self.response = r
+    def missing_blocks(self):
+        """Return the forecast blocks that are not present in the response."""
+        return [key for key in FORECAST_BLOCKS if key not in self.json]
+
+    def add_block(self, key, data):
+        """Add a forecast block fetched separately from the main response."""
+        self.json[key] = data
+        self._blocks.pop(key, None)
 
     def currently(self):
         """Return the current weather data block."""
@@ -68,26 +80,28 @@ class Forecast(UnicodeMixin):
         return self._alerts
 
     def _pirateweather_data(self, key):
-        """Fetch and return specific weather data (currently, minutely, hourly, daily, flags and day_night)."""
-        keys = ["minutely", "currently", "hourly", "daily", "flags", "day_night"]
+        """Return specific weather data (currently, minutely, hourly, daily, flags and day_night), parsing it once."""
         try:
-            if key not in self.json:
-                keys.remove(key)
-                url = "{}&exclude={}{}".format(
-                    self.response.url.split("&")[0],
-                    ",".join(keys),
-                    ",alerts",
-                )
+            return self._blocks[key]
+        except KeyError:
+            block = self._blocks[key] = self._parse_pirateweather_data(key)
+            return block
 
-                response = requests.get(url).json()
-                self.json[key] = response[key]
+    def _parse_pirateweather_data(self, key):
+        """Parse specific weather data (currently, minutely, hourly, daily, flags and day_night).
 
+        A missing block is returned empty and reported to on_missing_block, the
+        coordinator then fetches it in the background and with every later update.
+        """
+        try:
             if key == "currently":
                 return PirateWeatherDataPoint(self.json[key])
             if key == "flags":
                 return PirateWeatherFlagsBlock(self.json[key])
             return PirateWeatherDataBlock(self.json[key])
         except KeyError:
+            if self._on_missing_block is not None:
+                self._on_missing_block(self, key)
             if key == "currently":
                 return PirateWeatherDataPoint()
             return PirateWeatherDataBlock()
@@ -135,6 +149,8 @@ class PirateWeatherFlagsBlock(UnicodeMixin):
 class PirateWeatherDataPoint(UnicodeMixin):
     """Represent a single data point in a weather forecast, such as an hourly or daily data point."""
 
+    __slots__ = ("d", "sunriseTime", "sunsetTime", "time", "utime")
+
     def __init__(self, d={}):
         """Initialize the data point with timestamp and weather information."""
         self.d = d
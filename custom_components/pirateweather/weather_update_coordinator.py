@@ -5,18 +5,21 @@ import logging
 
 from aiohttp import ClientError
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .const import (
     DOMAIN,
 )
-from .forecast_models import Forecast
+from .forecast_models import FORECAST_BLOCKS, Forecast
 
 _LOGGER = logging.getLogger(__name__)
 
 ATTRIBUTION = "Powered by Pirate Weather"
 
+MISSING_BLOCK_TIMEOUT = 10
+
 
 class WeatherUpdateCoordinator(DataUpdateCoordinator):
     """Weather data update coordinator."""
@@ -49,6 +52,10 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator):
         self.hourly = None
         self.daily = None
         self._connect_error = False
+        # Blocks missing from the main response that entities read, fetched separately,
+        # and blocks the API does not serve at all
+        self._wanted_blocks = set()
+        self._unserved_blocks = set()
 
         super().__init__(
             hass,
@@ -64,7 +71,7 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator):
         async with asyncio.timeout(60):
             try:
                 data = await self._get_pw_weather()
-            except ClientError as err:
+            except (ClientError, ValueError) as err:
                 raise UpdateFailed(f"Error communicating with API: {err}") from err
         return data
 
@@ -112,4 +119,70 @@ class WeatherUpdateCoordinator(DataUpdateCoordinator):
             jsonText = await resp.json()
             headers = resp.headers
             _LOGGER.debug("Pirate Weather data update from: %s", self.endpoint)
-            return Forecast(jsonText, resp, headers)
+            forecast = Forecast(
+                jsonText, resp, headers, on_missing_block=self._async_block_missing
+            )
+
+        await asyncio.gather(
+            *(
+                self._get_pw_missing_block(session, forecast, key)
+                for key in forecast.missing_blocks()
+                if key in self._wanted_blocks
+            )
+        )
+        return forecast
+
+    @callback
+    def _async_block_missing(self, forecast, key):
+        """Fetch a block an entity read that the response lacked, in the background."""
+        if (
+            key in self._wanted_blocks
+            or key in self._unserved_blocks
+            or key in (self.models or "").replace(" ", "").split(",")
+        ):
+            return
+        self._wanted_blocks.add(key)
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_fetch_missing_block(forecast, key),
+            f"Pirate Weather {key} block",
+        )
+
+    async def _async_fetch_missing_block(self, forecast, key):
+        """Fetch a missing block into the forecast and update the entities."""
+        session = async_get_clientsession(self.hass)
+        if await self._get_pw_missing_block(session, forecast, key) and (
+            forecast is self.data
+        ):
+            self.async_update_listeners()
+
+    async def _get_pw_missing_block(self, session, forecast, key):
+        """Fetch a block missing from the main response so entities never do I/O.
+
+        Return if the block was added to the forecast. A block the API does not return
+        is not requested again.
+        """
+        exclusions = [block for block in FORECAST_BLOCKS if block != key]
+        blockString = (
+            str(forecast.response.url).split("&")[0]
+            + "&exclude="
+            + ",".join(exclusions)
+            + ",alerts"
+        )
+        try:
+            async with asyncio.timeout(MISSING_BLOCK_TIMEOUT):
+                async with session.get(blockString) as resp:
+                    resp.raise_for_status()
+                    jsonText = await resp.json()
+        except (ClientError, TimeoutError, ValueError) as err:
+            _LOGGER.debug("Could not fetch Pirate Weather %s block: %s", key, err)
+            return False
+
+        if key not in jsonText:
+            _LOGGER.debug("Pirate Weather does not provide the %s block", key)
+            self._wanted_blocks.discard(key)
+            self._unserved_blocks.add(key)
+            return False
+
+        forecast.add_block(key, jsonText[key])
+        return True
@@ -8,9 +8,12 @@ https://github.com/custom-components/readme
 from __future__ import annotations
 
 import asyncio
+from dataclasses import dataclass
+import hashlib
 import json
 import os
 from shutil import copyfile
+import time
 from typing import Any
 
 import homeassistant.helpers.config_validation as cv
@@ -20,9 +23,24 @@ from homeassistant import config_entries
 from homeassistant.components.hassio import (  # type: ignore
     get_supervisor_info,
 )
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.components.sensor import (
+    DOMAIN as SENSOR_DOMAIN,
+    async_rounded_state,
+)
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT, STATE_UNKNOWN
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    State,
+    SupportsResponse,
+    callback,
+    valid_domain,
+    valid_entity_id,
+)
+from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.hassio import is_hassio
-from homeassistant.helpers.template import AllStates
+from homeassistant.helpers.template import TemplateState
 from homeassistant.loader import Integration, IntegrationNotFound, async_get_integration
 from homeassistant.setup import async_get_loaded_integrations
 from jinja2 import Template
@@ -148,38 +166,236 @@ async def write_file(
     await hass.async_add_executor_job(write)
 
 
+# Attributes Jinja looks up on callables, not domains
+_RESERVED_NAMES = {
+    "contextfunction",
+    "evalcontextfunction",
+    "environmentfunction",
+    "jinja_pass_arg",
+}
+
+
+class TemplateStateSnapshot(TemplateState):
+    """TemplateState of a snapshot, formatting without the entity registry.
+
+    The state rounded for presentation is taken when the snapshot is made, on the
+    event loop, so states("...", rounded=True) and state_with_unit work when the
+    template is rendered in the executor.
+    """
+
+    __slots__ = ("_rounded",)
+
+    def __init__(self, hass: HomeAssistant, state: State, rounded: str) -> None:
+        super().__init__(hass, state, collect=False)
+        self._rounded = rounded
+
+    def format_state(self, rounded: bool, with_unit: bool) -> str:
+        state = self._rounded if rounded else self._state.state
+        if with_unit and (unit := self._state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)):
+            return f"{state} {unit}"
+        return state
+
+
+def _get_state_if_valid(
+    states: dict[str, TemplateStateSnapshot], entity_id: str
+) -> TemplateStateSnapshot | None:
+    """Return the state of an entity, like states.<entity_id> in Home Assistant."""
+    state = states.get(entity_id)
+    if state is None and not valid_entity_id(entity_id):
+        raise TemplateError(f"Invalid entity ID '{entity_id}'")
+    return state
+
+
+class DomainStatesSnapshot:
+    """Snapshot of the states of a domain, as exposed by states.<domain>."""
+
+    def __init__(self, domain: str, states: dict[str, TemplateStateSnapshot]) -> None:
+        self._domain = domain
+        self._states = states
+
+    def __getattr__(self, name: str) -> TemplateStateSnapshot | None:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _get_state_if_valid(self._states, f"{self._domain}.{name}")
+
+    __getitem__ = __getattr__
+
+    def __iter__(self):
+        return iter(sorted(self._states.values(), key=lambda state: state.entity_id))
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+class StatesSnapshot:
+    """Snapshot of all states, usable like states in Home Assistant templates.
+
+    Supports states.<domain>.<object_id>, states.<entity_id>, states["<entity_id>"],
+    states("<entity_id>", rounded=..., with_unit=...) and iterating over all states,
+    with the same TemplateState objects, without touching the state machine or the
+    entity registry from the executor.
+    """
+
+    def __init__(self, hass: HomeAssistant, states: list[State]) -> None:
+        self._states: dict[str, TemplateStateSnapshot] = {}
+        self._domains: dict[str, dict[str, TemplateStateSnapshot]] = {}
+        for state in states:
+            rounded = (
+                async_rounded_state(hass, state.entity_id, state)
+                if state.domain == SENSOR_DOMAIN
+                else state.state
+            )
+            template_state = TemplateStateSnapshot(hass, state, rounded)
+            self._states[state.entity_id] = template_state
+            self._domains.setdefault(state.domain, {})[state.entity_id] = template_state
+
+    def __call__(
+        self,
+        entity_id: str,
+        rounded: bool | None = None,
+        with_unit: bool = False,
+    ) -> str:
+        state = self._states.get(entity_id)
+        if state is None:
+            return STATE_UNKNOWN
+        if rounded is None:
+            rounded = with_unit
+        if rounded or with_unit:
+            return state.format_state(rounded, with_unit)
+        return state.state
+
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if "." in name:
+            return _get_state_if_valid(self._states, name)
+        if name in _RESERVED_NAMES:
+            return None
+        if not valid_domain(name):
+            raise TemplateError(f"Invalid domain name '{name}'")
+        return DomainStatesSnapshot(name, self._domains.get(name, {}))
+
+    __getitem__ = __getattr__
+
+    def __iter__(self):
+        return iter(sorted(self._states.values(), key=lambda state: state.entity_id))
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+
+@dataclass
+class CompiledTemplate:
+    """A compiled README template and the source it was compiled from."""
+
+    mtime_ns: int
+    digest: str
+    template: Template
+
+
+def render_readme(
+    hass: HomeAssistant,
+    cache: dict[str, CompiledTemplate],
+    variables: dict[str, Any],
+) -> dict[str, Any]:
+    """Compile (if changed), render and write the README, blocking.
+
+    The compiled template is reused while the template file has the same
+    mtime or content hash. README.md is only written when its content changes.
+    """
+    template_path = hass.config.path("templates/README.j2")
+    readme_path = hass.config.path("README.md")
+    timing: dict[str, Any] = {}
+
+    start = time.perf_counter()
+    mtime_ns = os.stat(template_path).st_mtime_ns
+    compiled = cache.get(template_path)
+    template_cached = compiled is not None and compiled.mtime_ns == mtime_ns
+    if not template_cached:
+        with open(template_path) as open_file:
+            content = open_file.read()
+        digest = hashlib.sha256(content.encode()).hexdigest()
+        if compiled is not None and compiled.digest == digest:
+            compiled.mtime_ns = mtime_ns
+            template_cached = True
+        else:
+            compiled = cache[template_path] = CompiledTemplate(
+                mtime_ns, digest, Template(content)
+            )
+    timing["compile"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    render = compiled.template.render(variables)
+    timing["render"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    digest = hashlib.sha256(render.encode()).hexdigest()
+    current = None
+    if os.path.exists(readme_path):
+        with open(readme_path, "rb") as open_file:
+            current = hashlib.sha256(open_file.read()).hexdigest()
+    written = current != digest
+    if written:
+        with open(readme_path, "w") as open_file:
+            open_file.write(render)
+    timing["write"] = time.perf_counter() - start
+
+    return {"template_cached": template_cached, "written": written, **timing}
+
+
 async def add_services(hass: HomeAssistant):
     """Add services."""
     # Service registration
+    template_cache: dict[str, CompiledTemplate] = {}
 
-    async def service_generate(_call):
+    async def service_generate(call: ServiceCall) -> ServiceResponse:
         """Generate the files."""
+        total_start = time.perf_counter()
         if hass.data[DOMAIN_DATA].get("convert") or hass.data[DOMAIN_DATA].get(
             "convert_lovelace"
         ):
             await convert_lovelace(hass)
 
+        start = time.perf_counter()
         custom_components = await get_custom_integrations(hass)
         hacs_components = get_hacs_components(hass)
         installed_addons = get_ha_installed_addons(hass)
 
         variables = {
             "custom_components": custom_components,
-            "states": AllStates(hass),
+            "states": StatesSnapshot(hass, hass.states.async_all()),
             "hacs_components": hacs_components,
             "addons": installed_addons,
         }
+        collect = time.perf_counter() - start
 
-        content = await read_file(hass, "templates/README.j2")
-
-        template = Template(content)
+        result: dict[str, Any] = {}
         try:
-            render = template.render(variables)
-            await write_file(hass, "README.md", render)
+            result = await hass.async_add_executor_job(
+                render_readme, hass, template_cache, variables
+            )
         except Exception as exception:
             LOGGER.error(exception)
 
-    hass.services.async_register(DOMAIN, "generate", service_generate)
+        result = {
+            "collect": collect,
+            **result,
+            "total": time.perf_counter() - total_start,
+        }
+        LOGGER.debug("Generated README.md: %s", result)
+        if call.return_response:
+            return {
+                key: round(value, 4) if isinstance(value, float) else value
+                for key, value in result.items()
+            }
+        return None
+
+    hass.services.async_register(
+        DOMAIN,
+        "generate",
+        service_generate,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
 
 def get_hacs_components(hass: HomeAssistant):
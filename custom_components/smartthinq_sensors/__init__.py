@@ -53,7 +53,7 @@ from .wideq import (
     TemperatureUnit,
     get_lge_device,
 )
-from .wideq.core_async import ClientAsync
+from .wideq.core_async import ClientAsync, compare_devices_fingerprints
 from .wideq.core_exceptions import (
     AuthenticationError,
     InvalidCredentialError,
@@ -701,9 +701,27 @@ def start_devices_discovery(
     hass: HomeAssistant, entry: ConfigEntry, client: ClientAsync
 ) -> None:
     """Start devices discovery."""
+    last_fingerprints = client.devices_fingerprints
 
     async def _async_discover_devices(_):
         """Discover new devices."""
+        nonlocal last_fingerprints
+
+        fingerprints = client.devices_fingerprints
+        if fingerprints is not None and last_fingerprints is not None:
+            if fingerprints == last_fingerprints:
+                _LOGGER.debug("No changes in devices list, discovery skipped")
+                return
+            added, removed, changed = compare_devices_fingerprints(
+                last_fingerprints, fingerprints
+            )
+            _LOGGER.info(
+                "Devices list changed: %s added, %s removed, %s changed",
+                len(added),
+                len(removed),
+                len(changed),
+            )
+
         _LOGGER.debug("Discovering new devices...")
 
         old_devs = hass.data[DOMAIN][DISCOVERED_DEVICES]
@@ -711,6 +729,7 @@ def start_devices_discovery(
             hass, client, old_devs
         )
         hass.data[DOMAIN][DISCOVERED_DEVICES] = new_devs
+        last_fingerprints = client.devices_fingerprints
 
         # send signal to set up new entities
         if lge_devs:
@@ -0,0 +1,298 @@
+"""
+Benchmark of the ThinQ V1 monitor decoders.
+Decodes recorded monitor payloads with the compiled decoding plans
+of ModelInfoV1 and with the former protocol walking decoders,
+checks that both return identical data and reports the speedup.
+
+Run it from the Home Assistant configuration directory:
+
+    python -m custom_components.smartthinq_sensors.wideq.benchmark [--fixture FILE]
+
+Without a fixture, sample washer (BINARY(BYTE)), dryer (BINARY(HEX))
+and oven (XML) monitors are used. A fixture is a JSON list of monitors:
+
+    [{"name": ..., "Monitoring": {...}, "payloads": [...]}]
+
+with "Monitoring" as found in the model info and the payloads as
+polled from the device (BINARY(BYTE) payloads base64 encoded).
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+from pathlib import Path
+import timeit
+
+import xmltodict
+
+from .model_info import ModelInfoV1
+
+WASHER_PROTOCOL = [
+    {"value": "State", "startByte": 0, "length": 1},
+    {"value": "Remain_Time_H", "startByte": 1, "length": 1},
+    {"value": "Remain_Time_M", "startByte": 2, "length": 1},
+    {"value": "Initial_Time_H", "startByte": 3, "length": 1},
+    {"value": "Initial_Time_M", "startByte": 4, "length": 1},
+    {"value": "Course", "startByte": 5, "length": 1},
+    {"value": "Error", "startByte": 6, "length": 1},
+    {"value": "Wash", "startByte": 7, "length": 1},
+    {"value": "SpinSpeed", "startByte": 8, "length": 1},
+    {"value": "WaterTemp", "startByte": 9, "length": 1},
+    {"value": "RinseOption", "startByte": 10, "length": 1},
+    {"value": "DryLevel", "startByte": 11, "length": 1},
+    {"value": "Reserve_Time_H", "startByte": 12, "length": 1},
+    {"value": "Reserve_Time_M", "startByte": 13, "length": 1},
+    {"value": "Option1", "startByte": 14, "length": 1},
+    {"value": "Option2", "startByte": 15, "length": 1},
+    {"value": "Option3", "startByte": 16, "length": 1},
+    {"value": "PreState", "startByte": 17, "length": 1},
+    {"value": "SmartCourse", "startByte": 18, "length": 1},
+    {"value": "TCLCount", "startByte": 19, "length": 1},
+    {"value": "LoadItem", "startByte": 20, "length": 1},
+    {"value": "CourseType", "startByte": 21, "length": 1},
+    {"value": "Standby", "startByte": 22, "length": 1},
+    {"value": "Energy", "startByte": 24, "length": 2},
+    {"value": "Water", "startByte": 26, "length": 4},
+]
+
+DRYER_PROTOCOL = [
+    {"value": "State", "startByte": 0, "length": 1},
+    {"value": "Remain_Time_H", "startByte": 1, "length": 1},
+    {"value": "Remain_Time_M", "startByte": 2, "length": 1},
+    {"value": "Initial_Time_H", "startByte": 3, "length": 1},
+    {"value": "Initial_Time_M", "startByte": 4, "length": 1},
+    {"value": "Course", "startByte": 5, "length": 1},
+    {"value": "Error", "startByte": 6, "length": 1},
+    {"value": "DryLevel", "startByte": 7, "length": 1},
+    {"value": "TempControl", "startByte": 8, "length": 1},
+    {"value": "TimeDry", "startByte": 9, "length": 1},
+    {"value": "Option1", "startByte": 10, "length": 1},
+    {"value": "Option2", "startByte": 11, "length": 1},
+    {"value": "PreState", "startByte": 12, "length": 1},
+    {"value": "SmartCourse", "startByte": 13, "length": 1},
+    {"value": "Energy", "startByte": 14, "length": 3},
+]
+
+OVEN_PROTOCOL = [
+    {"value": "UpperOvenState", "tag": "UpperOven.State"},
+    {"value": "UpperOvenMode", "tag": "UpperOven.Mode"},
+    {"value": "UpperCurrentTemperatureF", "tag": "UpperOven.CurrentTemperatureF"},
+    {"value": "UpperTargetTemperatureF", "tag": "UpperOven.TargetTemperatureF"},
+    {"value": ["UpperTimerHour", "UpperTimerMinute"], "tag": "UpperOven.Timer"},
+    {"value": "LowerOvenState", "tag": "LowerOven.State"},
+    {"value": "LowerOvenMode", "tag": "LowerOven.Mode"},
+    {"value": ["LowerTimerHour", "LowerTimerMinute", 0], "tag": "LowerOven.Timer"},
+    {"value": "DoorLock", "tag": "DoorLock"},
+    {"value": "CooktopState", "tag": "CooktopState"},
+    {"value": "Unit", "tag": "Unit"},
+]
+
+
+def _oven_payload(state: str, temp: int, timer: str) -> str:
+    return (
+        "<ovenStatus>"
+        f"<UpperOven><State>{state}</State><Mode>BAKE</Mode>"
+        f"<CurrentTemperatureF>{temp}</CurrentTemperatureF>"
+        "<TargetTemperatureF>350</TargetTemperatureF>"
+        f"<Timer>{timer}</Timer></UpperOven>"
+        "<LowerOven><State>OFF</State><Mode>NONE</Mode>"
+        "<Timer>0,0</Timer></LowerOven>"
+        "<DoorLock>UNLOCK</DoorLock><CooktopState>OFF</CooktopState>"
+        "<Unit>F</Unit>"
+        "</ovenStatus>"
+    )
+
+
+SAMPLE_MONITORS = [
+    {
+        "name": "washer",
+        "Monitoring": {"type": "BINARY(BYTE)", "protocol": WASHER_PROTOCOL},
+        "payloads": [
+            base64.b64encode(bytes((idx * step) % 256 for idx in range(30))).decode()
+            for step in (1, 3, 7, 11)
+        ]
+        # short payload, missing the last values
+        + [base64.b64encode(bytes(range(25))).decode()],
+    },
+    {
+        "name": "dryer",
+        "Monitoring": {"type": "BINARY(HEX)", "protocol": DRYER_PROTOCOL},
+        "payloads": [
+            ",".join(f"{(idx * step) % 256:02X}" for idx in range(17))
+            for step in (1, 5, 13)
+        ],
+    },
+    {
+        "name": "oven",
+        "Monitoring": {"type": "XML", "tag": "ovenStatus", "protocol": OVEN_PROTOCOL},
+        "payloads": [
+            _oven_payload("PREHEATING", 180, "0,45"),
+            _oven_payload("COOKING", 350, "0,30"),
+            _oven_payload("OFF", 75, ""),
+        ],
+    },
+]
+
+
+def legacy_decode_byte(protocol: list[dict], data: bytes) -> dict:
+    """Former decoder of BINARY(BYTE) monitor data."""
+    decoded = {}
+    total_bytes = len(data)
+    for item in protocol:
+        key = item["value"]
+        value = 0
+        start_byte: int = item["startByte"]
+        end_byte: int = start_byte + item["length"]
+        if total_bytes >= end_byte:
+            for byte_data in data[start_byte:end_byte]:
+                value = (value << 8) + byte_data
+        decoded[key] = str(value)
+    return decoded
+
+
+def legacy_decode_hex(protocol: list[dict], data: bytes) -> dict:
+    """Former decoder of BINARY(HEX) monitor data."""
+    decoded = {}
+    hex_list = data.decode("utf8").split(",")
+    total_bytes = len(hex_list)
+    for item in protocol:
+        key = item["value"]
+        value = 0
+        start_byte: int = item["startByte"]
+        end_byte: int = start_byte + item["length"]
+        if total_bytes >= end_byte:
+            for i in range(start_byte, end_byte):
+                value = (value << 8) + int(hex_list[i], 16)
+        decoded[key] = str(value)
+    return decoded
+
+
+def legacy_decode_xml(protocol: list[dict], dev_vals: dict) -> dict:
+    """Former decoder of the main tag values of XML monitor data."""
+    decoded = {}
+    for item in protocol:
+        tags: str = item["tag"]
+        tag_list = tags.split(".")
+        tag_key = tag_list[0]
+        if len(tag_list) > 1:
+            value_dict: dict = dev_vals[tag_key]
+            tag_key = tag_list[1]
+        else:
+            value_dict: dict = dev_vals
+
+        if val := value_dict.get(tag_key):
+            key = item["value"]
+            if isinstance(key, list):
+                if isinstance(val, str):
+                    sub_val = val.split(",")
+                else:
+                    sub_val = []
+                for sub_idx, sub_key in enumerate(key):
+                    if not isinstance(sub_key, str):
+                        continue
+                    decoded[sub_key] = (
+                        sub_val[sub_idx] if len(sub_val) > sub_idx else ""
+                    )
+
+            elif isinstance(key, str):
+                decoded[key] = val
+
+    return decoded
+
+
+def _decoders(model_info: ModelInfoV1, payloads: list[bytes]):
+    """Return the former and the compiled decoder of a monitor, and their inputs."""
+    protocol = model_info.as_dict()["Monitoring"]["protocol"]
+    if model_info.byte_monitor_data:
+        return (
+            lambda data: legacy_decode_byte(protocol, data),
+            model_info.binary_monitor_plan.decode,
+            payloads,
+        )
+    if model_info.hex_monitor_data:
+        return (
+            lambda data: legacy_decode_hex(protocol, data),
+            model_info.binary_monitor_plan.decode_hex,
+            payloads,
+        )
+    # XML parsing is shared by both decoders, only decode the parsed values
+    plan = model_info.xml_monitor_plan
+    return (
+        lambda dev_vals: legacy_decode_xml(protocol, dev_vals),
+        plan.decode,
+        [xmltodict.parse(data.decode("utf8"))[plan.main_tag] for data in payloads],
+    )
+
+
+def _time_per_call(decode, inputs: list) -> float:
+    """Return the time to decode one input, in microseconds."""
+
+    def _run():
+        for data in inputs:
+            decode(data)
+
+    number, elapsed = timeit.Timer(_run).autorange()
+    best = min([elapsed, *timeit.Timer(_run).repeat(repeat=4, number=number)])
+    return best / number / len(inputs) * 1e6
+
+
+def benchmark_monitor(monitor: dict) -> bool:
+    """Benchmark the decoders of a monitor, return if their results are identical."""
+    model_info = ModelInfoV1({"Monitoring": monitor["Monitoring"], "Value": {}})
+    payloads = [
+        base64.b64decode(payload)
+        if model_info.byte_monitor_data
+        else payload.encode("utf8")
+        for payload in monitor["payloads"]
+    ]
+
+    identical = all(
+        model_info.decode_monitor(data) == _legacy_decode_monitor(model_info, data)
+        for data in payloads
+    )
+    legacy, compiled, inputs = _decoders(model_info, payloads)
+    legacy_time = _time_per_call(legacy, inputs)
+    compiled_time = _time_per_call(compiled, inputs)
+    print(
+        f"{monitor['name']:<12}{model_info.monitor_type:<14}{len(payloads):>9}"
+        f"{'yes' if identical else 'NO':>11}{legacy_time:>13.2f}"
+        f"{compiled_time:>15.2f}{legacy_time / compiled_time:>10.1f}x"
+    )
+    return identical
+
+
+def _legacy_decode_monitor(model_info: ModelInfoV1, data: bytes) -> dict | None:
+    """Decode monitor data with the former decoders."""
+    monitoring = model_info.as_dict()["Monitoring"]
+    if model_info.byte_monitor_data:
+        return legacy_decode_byte(monitoring["protocol"], data)
+    if model_info.hex_monitor_data:
+        return legacy_decode_hex(monitoring["protocol"], data)
+    xml_json = xmltodict.parse(data.decode("utf8"))
+    return legacy_decode_xml(monitoring["protocol"], xml_json[monitoring["tag"]])
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark ThinQ V1 monitor decoders")
+    parser.add_argument(
+        "--fixture", type=Path, help="JSON list of monitors with recorded payloads"
+    )
+    args = parser.parse_args()
+
+    monitors = SAMPLE_MONITORS
+    if args.fixture:
+        monitors = json.loads(args.fixture.read_text(encoding="utf-8"))
+
+    print(
+        f"{'monitor':<12}{'type':<14}{'payloads':>9}{'identical':>11}"
+        f"{'former (us)':>13}{'compiled (us)':>15}{'speedup':>11}"
+    )
+    if not all([benchmark_monitor(monitor) for monitor in monitors]):
+        raise SystemExit("Compiled decoders returned different data")
+
+
+if __name__ == "__main__":
+    main()
@@ -110,6 +110,9 @@ TOKEN_EXP_LIMIT = 60  # will expire within 60 seconds
 # minimum time between 2 consecutive call for device snapshot updates (in seconds)
 MIN_TIME_BETWEEN_UPDATE = 25
 
+# maximum number of homes devices requested at the same time
+MAX_CONCURRENT_HOME_REQUESTS = 4
+
 _LG_SSL_CIPHERS = (
     "DEFAULT:!aNULL:!eNULL:!MD5:!3DES:!DES:!RC4:!IDEA:!SEED:!aDSS:!SRP:!PSK"
 )
@@ -125,6 +128,20 @@ _HOME_CURRENT = "currentHomeYn"
 _LOGGER = logging.getLogger(__name__)
 
 
+def compare_devices_fingerprints(
+    old_fingerprints: dict[str, tuple], new_fingerprints: dict[str, tuple]
+) -> tuple[set[str], set[str], set[str]]:
+    """Return the ids of devices added, removed and changed between fingerprints."""
+    added = new_fingerprints.keys() - old_fingerprints.keys()
+    removed = old_fingerprints.keys() - new_fingerprints.keys()
+    changed = {
+        device_id
+        for device_id in new_fingerprints.keys() & old_fingerprints.keys()
+        if new_fingerprints[device_id] != old_fingerprints[device_id]
+    }
+    return added, removed, changed
+
+
 def _oauth_info_from_result(result_info: dict) -> dict:
     """Return authentication info using an OAuth callback URL."""
 
@@ -1244,10 +1261,20 @@ class Session:
             _LOGGER.warning("Not possible to determinate a valid home_id")
             return None
 
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_HOME_REQUESTS)
+
+        async def _get_devices(home_id: str) -> list[dict] | None:
+            async with semaphore:
+                return await self._get_home_devices(home_id)
+
+        homes_devices = await asyncio.gather(
+            *(_get_devices(home_id) for home_id in homes)
+        )
+
         valid_home = False
         devices_list = []
-        for home_id in homes:
-            if (devices := await self._get_home_devices(home_id)) is None:
+        for devices in homes_devices:
+            if devices is None:
                 continue
             valid_home = True
             devices_list.extend(devices)
@@ -1464,6 +1491,8 @@ class ClientAsync:
         # The last list of devices we got from the server. This is the
         # raw JSON list data describing the devices.
         self._devices = None
+        # The fingerprints of the last list of devices, by device id.
+        self._devices_fingerprints: dict[str, tuple] = {}
 
         # Cached model info data. This is a mapping from URLs to JSON
         # responses.
@@ -1506,6 +1535,22 @@ class ClientAsync:
                 d[KEY_DEVICE_ID]: d for d in new_devices if KEY_DEVICE_ID in d
             }
 
+            fingerprints = {
+                device_id: DeviceInfo(data).fingerprint
+                for device_id, data in self._devices.items()
+            }
+            if fingerprints != self._devices_fingerprints:
+                added, removed, changed = compare_devices_fingerprints(
+                    self._devices_fingerprints, fingerprints
+                )
+                _LOGGER.debug(
+                    "Devices list updated: %s added, %s removed, %s changed",
+                    len(added),
+                    len(removed),
+                    len(changed),
+                )
+                self._devices_fingerprints = fingerprints
+
     @property
     def api_version(self):
         """Return core API version."""
@@ -1538,6 +1583,13 @@ class ClientAsync:
         """Return True if there are devices associated."""
         return bool(self._devices)
 
+    @property
+    def devices_fingerprints(self) -> dict[str, tuple] | None:
+        """Return the fingerprint of each device, by device id."""
+        if self._devices is None:
+            return None
+        return self._devices_fingerprints
+
     @property
     def devices(self) -> list[DeviceInfo] | None:
         """Return list of DeviceInfo objects describing the user's devices."""
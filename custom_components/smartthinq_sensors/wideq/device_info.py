@@ -260,3 +260,18 @@ class DeviceInfo:
     def snapshot(self) -> dict[str, Any] | None:
         """Return the snapshot data associated to the device."""
         return self._data.get("snapshot")
+
+    @property
+    def snapshot_version(self) -> str | None:
+        """Return the version of the model info describing the snapshot."""
+        return self._data.get("modelJsonVer")
+
+    @property
+    def fingerprint(self) -> tuple:
+        """Return the device data that matter for discovery, ignoring its state."""
+        return (
+            self.device_id,
+            self.model_info_url,
+            self.isonline,
+            self.snapshot_version,
+        )
@@ -8,6 +8,8 @@ from copy import deepcopy
 import json
 import logging
 from numbers import Number
+import re
+import struct
 
 import xmltodict
 
@@ -29,6 +31,133 @@ RangeValue = namedtuple("RangeValue", ["min", "max", "step"])
 BitValue = namedtuple("BitValue", ["options"])
 ReferenceValue = namedtuple("ReferenceValue", ["reference"])
 
+# struct formats of big endian unsigned integers, by length in bytes
+_STRUCT_UINT_FORMATS = {1: "B", 2: "H", 4: "I", 8: "Q"}
+# BINARY(HEX) monitor data made of comma separated hex bytes only
+_HEX_BYTES_LIST = re.compile(r"[0-9A-Fa-f]{2}(?:,[0-9A-Fa-f]{2})*")
+
+
+class BinaryMonitorPlan:
+    """
+    Decoding plan of a BINARY(BYTE) or BINARY(HEX) monitor protocol.
+    Every value is a big endian unsigned integer of 'length' bytes
+    at 'startByte', the plan unpacks them with a single struct call
+    when the values do not overlap, or slices them otherwise.
+    Values of other lengths than a struct integer are unpacked
+    as bytes and converted with int.from_bytes.
+    """
+
+    def __init__(self, protocol: list[dict]):
+        """Compile the protocol."""
+        self._fields: tuple[tuple[str, int, int], ...] = tuple(
+            (item["value"], item["startByte"], item["startByte"] + item["length"])
+            for item in protocol
+        )
+        self._struct: struct.Struct | None = None
+        self._struct_keys: tuple[tuple[str, int], ...] = ()
+        self._struct_bytes_idx: tuple[int, ...] = ()
+
+        spans = sorted({(start, end) for _, start, end in self._fields})
+        fmt = ">"
+        offset = 0
+        for start, end in spans:
+            if start < offset:
+                return
+            fmt += "x" * (start - offset)
+            fmt += _STRUCT_UINT_FORMATS.get(end - start, f"{end - start}s")
+            offset = end
+        if spans:
+            index = {span: idx for idx, span in enumerate(spans)}
+            self._struct = struct.Struct(fmt)
+            self._struct_keys = tuple(
+                (key, index[(start, end)]) for key, start, end in self._fields
+            )
+            self._struct_bytes_idx = tuple(
+                idx
+                for (start, end), idx in index.items()
+                if (end - start) not in _STRUCT_UINT_FORMATS
+            )
+
+    def decode(self, data: bytes) -> dict[str, str]:
+        """Decode binary byte encoded status data."""
+        if self._struct is not None and len(data) >= self._struct.size:
+            values = self._struct.unpack_from(data)
+            if self._struct_bytes_idx:
+                values = list(values)
+                for idx in self._struct_bytes_idx:
+                    values[idx] = int.from_bytes(values[idx], "big")
+            return {key: str(values[idx]) for key, idx in self._struct_keys}
+
+        total_bytes = len(data)
+        return {
+            key: str(int.from_bytes(data[start:end], "big"))
+            if total_bytes >= end
+            else "0"
+            for key, start, end in self._fields
+        }
+
+    def decode_hex(self, data: bytes) -> dict[str, str]:
+        """Decode binary hex encoded status data."""
+        hex_data = data.decode("utf8")
+        if _HEX_BYTES_LIST.fullmatch(hex_data):
+            return self.decode(bytes.fromhex(hex_data.replace(",", "")))
+
+        # not a plain list of hex bytes, decode the values one by one
+        decoded = {}
+        hex_list = hex_data.split(",")
+        total_bytes = len(hex_list)
+        for key, start, end in self._fields:
+            value = 0
+            if total_bytes >= end:
+                for i in range(start, end):
+                    value = (value << 8) + int(hex_list[i], 16)
+            decoded[key] = str(value)
+        return decoded
+
+
+class XmlMonitorPlan:
+    """
+    Decoding plan of a XML monitor protocol.
+    Tag paths are split once, list values are reduced
+    to the index of their valid keys.
+    """
+
+    def __init__(self, main_tag: str | None, protocol: list[dict]):
+        """Compile the protocol."""
+        self.main_tag = main_tag
+        self._fields: list[tuple[str | None, str, str | tuple]] = []
+        for item in protocol:
+            tag_list = item["tag"].split(".")
+            parent_tag = tag_list[0] if len(tag_list) > 1 else None
+            tag_key = tag_list[1] if len(tag_list) > 1 else tag_list[0]
+            key = item["value"]
+            if isinstance(key, list):
+                key = tuple(
+                    (sub_idx, sub_key)
+                    for sub_idx, sub_key in enumerate(key)
+                    if isinstance(sub_key, str)
+                )
+            elif not isinstance(key, str):
+                continue
+            self._fields.append((parent_tag, tag_key, key))
+
+    def decode(self, dev_vals: dict) -> dict:
+        """Decode the values of the main tag of a XML status."""
+        decoded = {}
+        for parent_tag, tag_key, key in self._fields:
+            value_dict: dict = (
+                dev_vals if parent_tag is None else dev_vals[parent_tag]
+            )
+            if not (val := value_dict.get(tag_key)):
+                continue
+            if isinstance(key, str):
+                decoded[key] = val
+                continue
+            sub_val = val.split(",") if isinstance(val, str) else []
+            for sub_idx, sub_key in key:
+                decoded[sub_key] = sub_val[sub_idx] if len(sub_val) > sub_idx else ""
+        return decoded
+
 
 class ModelInfo(ABC):
     """The base abstract class for a device model's capabilities."""
@@ -231,6 +360,8 @@ class ModelInfoV1(ModelInfo):
         """Initialize the class."""
         super().__init__(data)
         self._monitor_type = None
+        self._binary_monitor_plan: BinaryMonitorPlan | None = None
+        self._xml_monitor_plan: XmlMonitorPlan | None = None
         self._bit_keys = {}
 
     @property
@@ -447,38 +578,32 @@ class ModelInfoV1(ModelInfo):
         """Check that type of monitoring is XML."""
         return self.monitor_type == "XML"
 
+    @property
+    def binary_monitor_plan(self) -> BinaryMonitorPlan:
+        """Return the decoding plan of binary monitor data."""
+        if self._binary_monitor_plan is None:
+            self._binary_monitor_plan = BinaryMonitorPlan(
+                self._data["Monitoring"]["protocol"]
+            )
+        return self._binary_monitor_plan
+
+    @property
+    def xml_monitor_plan(self) -> XmlMonitorPlan:
+        """Return the decoding plan of XML monitor data."""
+        if self._xml_monitor_plan is None:
+            self._xml_monitor_plan = XmlMonitorPlan(
+                self._data["Monitoring"].get("tag"),
+                self._data["Monitoring"]["protocol"],
+            )
+        return self._xml_monitor_plan
+
     def decode_monitor_byte(self, data):
         """Decode binary byte encoded status data."""
-
-        decoded = {}
-        total_bytes = len(data)
-        for item in self._data["Monitoring"]["protocol"]:
-            key = item["value"]
-            value = 0
-            start_byte: int = item["startByte"]
-            end_byte: int = start_byte + item["length"]
-            if total_bytes >= end_byte:
-                for byte_data in data[start_byte:end_byte]:
-                    value = (value << 8) + byte_data
-            decoded[key] = str(value)
-        return decoded
+        return self.binary_monitor_plan.decode(data)
 
     def decode_monitor_hex(self, data):
         """Decode binary hex encoded status data."""
-
-        decoded = {}
-        hex_list = data.decode("utf8").split(",")
-        total_bytes = len(hex_list)
-        for item in self._data["Monitoring"]["protocol"]:
-            key = item["value"]
-            value = 0
-            start_byte: int = item["startByte"]
-            end_byte: int = start_byte + item["length"]
-            if total_bytes >= end_byte:
-                for i in range(start_byte, end_byte):
-                    value = (value << 8) + int(hex_list[i], 16)
-            decoded[key] = str(value)
-        return decoded
+        return self.binary_monitor_plan.decode_hex(data)
 
     def decode_monitor_xml(self, data):
         """Decode a xml that encodes status data."""
@@ -489,43 +614,15 @@ class ModelInfoV1(ModelInfo):
             _LOGGER.warning("Failed to decode XML message: [%s] - error: %s", data, ex)
             return None
 
-        main_tag: str | None = self._data["Monitoring"].get("tag")
+        plan = self.xml_monitor_plan
+        main_tag = plan.main_tag
         if not main_tag or main_tag not in xml_json:
             _LOGGER.warning(
                 "Invalid root tag [%s] for XML message: [%s]", main_tag, xml_json
             )
             return None
 
-        decoded = {}
-        dev_vals = xml_json[main_tag]
-        for item in self._data["Monitoring"]["protocol"]:
-            tags: str = item["tag"]
-            tag_list = tags.split(".")
-            tag_key = tag_list[0]
-            if len(tag_list) > 1:
-                value_dict: dict = dev_vals[tag_key]
-                tag_key = tag_list[1]
-            else:
-                value_dict: dict = dev_vals
-
-            if val := value_dict.get(tag_key):
-                key = item["value"]
-                if isinstance(key, list):
-                    if isinstance(val, str):
-                        sub_val = val.split(",")
-                    else:
-                        sub_val = []
-                    for sub_idx, sub_key in enumerate(key):
-                        if not isinstance(sub_key, str):
-                            continue
-                        decoded[sub_key] = (
-                            sub_val[sub_idx] if len(sub_val) > sub_idx else ""
-                        )
-
-                elif isinstance(key, str):
-                    decoded[key] = val
-
-        return decoded
+        return plan.decode(xml_json[main_tag])
 
     @staticmethod
     def decode_monitor_json(data, mon_type):
@@ -0,0 +1,141 @@
+"""Spook - Your homie. Benchmark of the template entity extraction.
+
+Extracts the entity IDs referenced by the templates of automations, scripts and
+template entities, the way the unknown entity repairs do, with three extractors:
+
+- former: one scan per pattern of ENTITY_ID_TEMPLATE_PATTERNS, as before the
+  patterns were combined.
+- combined: a single scan with COMBINED_ENTITY_ID_TEMPLATE_PATTERN, uncached.
+- cached: the combined scan behind the template text LRU cache, as the repairs
+  run it on every inspection after the first.
+
+Checks that all extractors return identical entity IDs and reports the speedup.
+
+Run it from the Home Assistant configuration directory:
+
+    python -m custom_components.spook.benchmark [FILE ...]
+
+Without files, automations.yaml, scripts.yaml and template.yaml are used.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+import timeit
+from typing import TYPE_CHECKING
+
+from homeassistant.core import valid_entity_id
+from homeassistant.util.yaml import load_yaml
+
+from .entity_filtering import (
+    _STATES_DOMAIN_ENTITY_GROUPS,
+    COMPILED_ENTITY_ID_TEMPLATE_PATTERNS,
+    _extract_entities_from_template_text,
+    _is_concatenated_template_match,
+    _is_jinja_import_match,
+    _is_string_method_argument_match,
+    _strip_jinja_comments,
+    extract_template_strings_from_config,
+    split_comma_separated_entity_ids,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_FILES = ("automations.yaml", "scripts.yaml", "template.yaml")
+
+
+def legacy_extract(template_str: str) -> frozenset[str]:
+    """Former extractor, scanning the template once per pattern."""
+    template_without_comments = _strip_jinja_comments(template_str)
+    entities = set()
+    for pattern in COMPILED_ENTITY_ID_TEMPLATE_PATTERNS:
+        for match in pattern.finditer(template_without_comments):
+            groups = match.groups()
+            if len(groups) == _STATES_DOMAIN_ENTITY_GROUPS:
+                entity_id = f"{groups[0]}.{groups[1]}"
+            else:
+                span = match.span(1)
+                if (
+                    _is_concatenated_template_match(template_without_comments, span)
+                    or _is_jinja_import_match(template_without_comments, span)
+                    or _is_string_method_argument_match(
+                        template_without_comments, span
+                    )
+                ):
+                    continue
+                entity_id = groups[0]
+
+            for individual_id in split_comma_separated_entity_ids(entity_id):
+                if valid_entity_id(individual_id):
+                    entities.add(individual_id)
+    return frozenset(entities)
+
+
+def _time_per_template(
+    extract: Callable[[str], frozenset[str]], templates: list[str]
+) -> float:
+    """Return the time to extract the entity IDs of one template, in microseconds."""
+
+    def _run() -> None:
+        for template_str in templates:
+            extract(template_str)
+
+    number, elapsed = timeit.Timer(_run).autorange()
+    best = min([elapsed, *timeit.Timer(_run).repeat(repeat=4, number=number)])
+    return best / number / len(templates) * 1e6
+
+
+def benchmark_file(path: Path) -> bool:
+    """Benchmark the extractors on a file, return if their results are identical."""
+    templates = extract_template_strings_from_config(load_yaml(path))
+    if not templates:
+        print(f"{path.name:<20}{0:>11}")
+        return True
+
+    combined = _extract_entities_from_template_text.__wrapped__
+    former_entities = [legacy_extract(template_str) for template_str in templates]
+    identical = former_entities == [
+        combined(template_str) for template_str in templates
+    ] and former_entities == [
+        _extract_entities_from_template_text(template_str)
+        for template_str in templates
+    ]
+
+    former_time = _time_per_template(legacy_extract, templates)
+    combined_time = _time_per_template(combined, templates)
+    cached_time = _time_per_template(_extract_entities_from_template_text, templates)
+    print(
+        f"{path.name:<20}{len(templates):>11}"
+        f"{len(set().union(*former_entities)):>10}"
+        f"{'yes' if identical else 'NO':>11}{former_time:>13.2f}"
+        f"{combined_time:>15.2f}{cached_time:>13.2f}"
+        f"{former_time / combined_time:>11.1f}x{former_time / cached_time:>10.0f}x"
+    )
+    return identical
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "files",
+        nargs="*",
+        type=Path,
+        default=[Path(name) for name in DEFAULT_FILES],
+        help="YAML configuration files holding templates",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'file':<20}{'templates':>11}{'entities':>10}{'identical':>11}"
+        f"{'former (us)':>13}{'combined (us)':>15}{'cached (us)':>13}"
+        f"{'combined':>12}{'cached':>11}"
+    )
+    if not all([benchmark_file(path) for path in args.files]):
+        raise SystemExit("Combined extraction returned different entity IDs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Spook - Your homie. Diagnostics support."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .entity_filtering import async_get_all_entity_ids_cache_stats
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: ConfigEntry,  # noqa: ARG001
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    return {
+        "all_entity_ids_cache": async_get_all_entity_ids_cache_stats(),
+    }
@@ -36,10 +36,14 @@ class SpookRepair(AbstractSpookEntityComponentUnknownReferencesRepair):
         """Cache known area IDs for this inspection cycle."""
         self._known_area_ids = async_get_all_area_ids(self.hass)
 
-    async def _async_compute_unknown_references(self, entity: Any) -> set[str]:
-        """Return unknown area IDs referenced by ``entity``."""
+    async def _async_extract_references(self, entity: Any) -> set[str]:
+        """Return area IDs referenced by ``entity``."""
+        return set(entity.referenced_areas)
+
+    def _filter_unknown_references(self, references: frozenset[str]) -> set[str]:
+        """Return unknown area IDs out of ``references``."""
         return async_filter_known_area_ids(
             self.hass,
-            area_ids=entity.referenced_areas,
+            area_ids=set(references),
             known_area_ids=self._known_area_ids,
         )
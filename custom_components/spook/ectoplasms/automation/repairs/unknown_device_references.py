@@ -67,8 +67,8 @@ class SpookRepair(AbstractSpookEntityComponentUnknownReferencesRepair):
         """Cache known device IDs for this inspection cycle."""
         self._known_device_ids = async_get_all_device_ids(self.hass)
 
-    async def _async_compute_unknown_references(self, entity: Any) -> set[str]:
-        """Return unknown device IDs referenced by ``entity``."""
+    async def _async_extract_references(self, entity: Any) -> set[str]:
+        """Return device IDs referenced by ``entity``."""
         device_ids = set(entity.referenced_devices)
 
         if hasattr(entity, "raw_config") and entity.raw_config:
@@ -83,8 +83,12 @@ class SpookRepair(AbstractSpookEntityComponentUnknownReferencesRepair):
                 )
             )
 
+        return device_ids
+
+    def _filter_unknown_references(self, references: frozenset[str]) -> set[str]:
+        """Return unknown device IDs out of ``references``."""
         return async_filter_known_device_ids(
             self.hass,
-            device_ids=device_ids,
+            device_ids=set(references),
             known_device_ids=self._known_device_ids,
         )
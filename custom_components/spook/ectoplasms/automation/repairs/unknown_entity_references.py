@@ -17,12 +17,13 @@ from ....entity_filtering import (
     async_extract_entities_from_template_string,
     async_filter_known_entity_ids_with_templates,
     async_get_all_entity_ids,
+    async_get_all_services,
     is_template_string,
 )
 from ....repairs import AbstractSpookEntityComponentUnknownReferencesRepair
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Mapping, Set as AbstractSet
 
     from homeassistant.core import HomeAssistant
 
@@ -326,7 +327,8 @@ class SpookRepair(AbstractSpookEntityComponentUnknownReferencesRepair):
     reference_label = "entities"
     edit_url_pattern = "/config/automation/edit/{unique_id}"
 
-    _known_entity_ids: set[str]
+    _known_entity_ids: AbstractSet[str]
+    _known_services: frozenset[str] = frozenset()
 
     async def async_activate(self) -> None:
         """Activate the repair."""
@@ -341,8 +343,9 @@ class SpookRepair(AbstractSpookEntityComponentUnknownReferencesRepair):
             )
 
         @callback
-        def _async_call_inspect_debouncer(_: Event) -> None:
+        def _async_call_inspect_debouncer(event: Event) -> None:
             """Trigger an inspection when a state entity is added or removed."""
+            self._async_record_inspect_event(event)
             self.inspect_debouncer.async_schedule_call()
 
         self._event_subs.add(
@@ -358,13 +361,18 @@ class SpookRepair(AbstractSpookEntityComponentUnknownReferencesRepair):
         self._known_entity_ids = async_get_all_entity_ids(
             self.hass, include_all_none=True
         )
+        # Entities extracted from templates exclude known services.
+        known_services = frozenset(async_get_all_services(self.hass))
+        if known_services != self._known_services:
+            self._known_services = known_services
+            self.reference_graph.clear()
 
     def _should_inspect_entity(self, entity: Any) -> bool:
         """Skip disabled automations."""
         return entity.enabled
 
-    async def _async_compute_unknown_references(self, entity: Any) -> set[str]:
-        """Return unknown entity IDs referenced by ``entity`` (incl. templates)."""
+    async def _async_extract_references(self, entity: Any) -> set[str]:
+        """Return entity IDs referenced by ``entity`` (incl. templates)."""
         all_entities = set(entity.referenced_entities)
 
         # Also extract entities directly from raw configuration if available
@@ -384,8 +392,17 @@ class SpookRepair(AbstractSpookEntityComponentUnknownReferencesRepair):
             await extract_template_entities_from_automation_entity(self.hass, entity)
         )
 
+        # Without known entity IDs, this resolves templates to all entity IDs.
         return await async_filter_known_entity_ids_with_templates(
             self.hass,
             entity_ids=all_entities,
-            known_entity_ids=self._known_entity_ids,
+            known_entity_ids=frozenset(),
         )
+
+    def _filter_unknown_references(self, references: frozenset[str]) -> set[str]:
+        """Return unknown entity IDs out of ``references``."""
+        return {
+            entity_id
+            for entity_id in references
+            if entity_id not in self._known_entity_ids
+        }
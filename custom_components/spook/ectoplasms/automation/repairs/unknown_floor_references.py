@@ -35,10 +35,14 @@ class SpookRepair(AbstractSpookEntityComponentUnknownReferencesRepair):
         """Cache known floor IDs for this inspection cycle."""
         self._known_floor_ids = async_get_all_floor_ids(self.hass)
 
-    async def _async_compute_unknown_references(self, entity: Any) -> set[str]:
-        """Return unknown floor IDs referenced by ``entity``."""
+    async def _async_extract_references(self, entity: Any) -> set[str]:
+        """Return floor IDs referenced by ``entity``."""
+        return set(entity.referenced_floors)
+
+    def _filter_unknown_references(self, references: frozenset[str]) -> set[str]:
+        """Return unknown floor IDs out of ``references``."""
         return async_filter_known_floor_ids(
             self.hass,
-            floor_ids=entity.referenced_floors,
+            floor_ids=set(references),
             known_floor_ids=self._known_floor_ids,
         )
@@ -35,10 +35,14 @@ class SpookRepair(AbstractSpookEntityComponentUnknownReferencesRepair):
         """Cache known label IDs for this inspection cycle."""
         self._known_label_ids = async_get_all_label_ids(self.hass)
 
-    async def _async_compute_unknown_references(self, entity: Any) -> set[str]:
-        """Return unknown label IDs referenced by ``entity``."""
+    async def _async_extract_references(self, entity: Any) -> set[str]:
+        """Return label IDs referenced by ``entity``."""
+        return set(entity.referenced_labels)
+
+    def _filter_unknown_references(self, references: frozenset[str]) -> set[str]:
+        """Return unknown label IDs out of ``references``."""
         return async_filter_known_label_ids(
             self.hass,
-            label_ids=entity.referenced_labels,
+            label_ids=set(references),
             known_label_ids=self._known_label_ids,
         )
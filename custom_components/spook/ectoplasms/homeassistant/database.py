@@ -0,0 +1,221 @@
+"""Spook - Your homie."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import delete, select, update
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.db_schema import (
+    States,
+    StatesMeta,
+    Statistics,
+    StatisticsMeta,
+    StatisticsShortTerm,
+)
+from homeassistant.components.recorder.tasks import RecorderTask
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder import Recorder
+    from homeassistant.core import HomeAssistant
+
+# Number of rows fetched at once while scanning the database
+SCAN_BATCH_SIZE = 1000
+
+
+def _get_orphaned_entity_ids(
+    instance: Recorder, known_entity_ids: frozenset[str]
+) -> list[str]:
+    """Return entity IDs in the database that are not known entity IDs."""
+    with session_scope(session=instance.get_session(), read_only=True) as session:
+        return [
+            entity_id
+            for entity_id in session.scalars(
+                select(StatesMeta.entity_id)
+                .distinct()
+                .execution_options(yield_per=SCAN_BATCH_SIZE)
+            )
+            if entity_id not in known_entity_ids
+        ]
+
+
+async def async_get_orphaned_entity_ids(
+    hass: HomeAssistant, *, exclude_registered: bool = False
+) -> list[str]:
+    """Return entity IDs in the database that are unknown to the state machine.
+
+    With ``exclude_registered``, entities in the entity registry are not returned
+    either. Those belong to integrations that are disabled, not loaded yet or
+    failed to set up, and lose their history when purged.
+
+    The database is scanned using the executor and sessions of the recorder,
+    streaming the entity IDs instead of loading them all at once.
+    """
+    known_entity_ids = set(hass.states.async_entity_ids())
+    if exclude_registered:
+        known_entity_ids.update(er.async_get(hass).entities)
+    instance = get_instance(hass)
+    return await instance.async_add_executor_job(
+        _get_orphaned_entity_ids,
+        instance,
+        frozenset(known_entity_ids),
+    )
+
+
+def _purge_statistics_rows(
+    session: Session, metadata_ids: list[int], batch_size: int
+) -> int:
+    """Delete a batch of (short-term) statistics rows, return the number deleted."""
+    for table in (Statistics, StatisticsShortTerm):
+        if ids := list(
+            session.scalars(
+                select(table.id)
+                .where(table.metadata_id.in_(metadata_ids))
+                .limit(batch_size)
+            )
+        ):
+            return session.execute(
+                delete(table)
+                .where(table.id.in_(ids))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+    return 0
+
+
+def _purge_orphaned_entities_batch(
+    instance: Recorder, entity_ids: list[str], batch_size: int
+) -> dict[str, int]:
+    """Delete a batch of database rows of the given orphaned entities.
+
+    States and statistics are deleted first, at most ``batch_size`` rows at a
+    time. Once all of those are gone, the metadata of the entities is removed.
+    """
+    purged = {
+        "states": 0,
+        "statistics": 0,
+        "states_meta": 0,
+        "statistics_meta": 0,
+    }
+    with session_scope(session=instance.get_session()) as session:
+        states_metadata_ids = list(
+            session.scalars(
+                select(StatesMeta.metadata_id).where(
+                    StatesMeta.entity_id.in_(entity_ids)
+                )
+            )
+        )
+        if states_metadata_ids and (
+            state_ids := list(
+                session.scalars(
+                    select(States.state_id)
+                    .where(States.metadata_id.in_(states_metadata_ids))
+                    .limit(batch_size)
+                )
+            )
+        ):
+            # Disconnect states that refer to states about to be deleted
+            session.execute(
+                update(States)
+                .where(States.old_state_id.in_(state_ids))
+                .values(old_state_id=None)
+                .execution_options(synchronize_session=False)
+            )
+            purged["states"] = session.execute(
+                delete(States)
+                .where(States.state_id.in_(state_ids))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            instance.states_manager.evict_purged_state_ids(set(state_ids))
+            return purged
+
+        statistics_metadata_ids = list(
+            session.scalars(
+                select(StatisticsMeta.id).where(
+                    StatisticsMeta.statistic_id.in_(entity_ids)
+                )
+            )
+        )
+        if statistics_metadata_ids:
+            purged["statistics"] = _purge_statistics_rows(
+                session, statistics_metadata_ids, batch_size
+            )
+            if purged["statistics"]:
+                return purged
+
+        if states_metadata_ids:
+            purged["states_meta"] = session.execute(
+                delete(StatesMeta)
+                .where(StatesMeta.metadata_id.in_(states_metadata_ids))
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            instance.states_meta_manager.evict_purged(entity_ids)
+        if statistics_metadata_ids:
+            instance.statistics_meta_manager.delete(session, entity_ids)
+            purged["statistics_meta"] = len(statistics_metadata_ids)
+
+    return purged
+
+
+@callback
+def _async_set_future_result(future: asyncio.Future[Any], result: Any) -> None:
+    """Set the result of a future, unless it was cancelled."""
+    if not future.done():
+        future.set_result(result)
+
+
+@callback
+def _async_set_future_exception(
+    future: asyncio.Future[Any], exception: BaseException
+) -> None:
+    """Set the exception of a future, unless it was cancelled."""
+    if not future.done():
+        future.set_exception(exception)
+
+
+@dataclass(slots=True)
+class PurgeOrphanedEntitiesTask(RecorderTask):
+    """Recorder task to delete a batch of database rows of orphaned entities."""
+
+    entity_ids: list[str]
+    batch_size: int
+    loop: asyncio.AbstractEventLoop
+    future: asyncio.Future[dict[str, int]]
+
+    def run(self, instance: Recorder) -> None:
+        """Run the batch in the recorder thread."""
+        try:
+            purged = _purge_orphaned_entities_batch(
+                instance, self.entity_ids, self.batch_size
+            )
+        # pylint: disable-next=broad-exception-caught
+        except Exception as exception:  # noqa: BLE001
+            self.loop.call_soon_threadsafe(
+                _async_set_future_exception, self.future, exception
+            )
+        else:
+            self.loop.call_soon_threadsafe(
+                _async_set_future_result, self.future, purged
+            )
+
+
+async def async_purge_orphaned_entities_batch(
+    hass: HomeAssistant, entity_ids: list[str], batch_size: int
+) -> dict[str, int]:
+    """Delete a batch of database rows of orphaned entities in the recorder.
+
+    Returns the number of rows deleted per table. Once no states or statistics
+    rows were deleted, the entities have been purged completely.
+    """
+    future: asyncio.Future[dict[str, int]] = hass.loop.create_future()
+    get_instance(hass).queue_task(
+        PurgeOrphanedEntitiesTask(entity_ids, batch_size, hass.loop, future)
+    )
+    return await future
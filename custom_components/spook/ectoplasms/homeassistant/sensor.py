@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -27,6 +28,8 @@ from homeassistant.components.sensor import (
 from homeassistant.const import (
     EVENT_COMPONENT_LOADED,
     EVENT_HOMEASSISTANT_STARTED,
+    EVENT_STATE_CHANGED,
+    MATCH_ALL,
     EntityCategory,
     Platform,
 )
@@ -34,7 +37,6 @@ from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import (
     area_registry as ar,
     device_registry as dr,
-    entity_registry as er,
 )
 from homeassistant.helpers.event import async_call_later
 
@@ -43,10 +45,11 @@ from ...listeners import async_listen_once_tracked
 from .entity import HomeAssistantSpookEntity
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping
     from datetime import datetime  # Moved datetime here
 
     from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import EventStateChangedData, State
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
     from homeassistant.util.event_type import EventType
 
@@ -58,18 +61,122 @@ class HomeAssistantSpookSensorEntityDescription(
 ):
     """Class describing Spook Home Assistant sensor entities."""
 
-    value_fn: Callable[[HomeAssistant], int | None]
+    value_fn: Callable[[HomeAssistant], int | None] | None = None
     update_events: set[EventType[Any] | str] = field(default_factory=set)
+    # Domain to count states of using the shared counter, MATCH_ALL counts all
+    count_domain: str | None = None
+    # Whether to count restored placeholders of entities that are not loaded
+    count_restored: bool = True
 
 
-@callback
-def _count_active_domain_entities(hass: HomeAssistant, domain: str) -> int:
-    """Count domain entities that are not restored placeholders."""
-    return sum(
-        (state := hass.states.get(entity_id)) is not None
-        and not state.attributes.get("restored", False)
-        for entity_id in hass.states.async_entity_ids(domain)
-    )
+class DomainEntityCounter:
+    """Shared index of the number of states per domain.
+
+    Kept up to date from states being added and removed, so counts can be read
+    without going over the state machine. Listeners of changed domains are
+    notified in batches, to avoid writing states on every single change.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the counter."""
+        self.hass = hass
+        self._counts: defaultdict[str, int] = defaultdict(int)
+        self._restored_counts: defaultdict[str, int] = defaultdict(int)
+        self._restored: set[str] = set()
+        self._changed: set[str] = set()
+        self._listeners: dict[str, set[Callable[[], None]]] = {}
+        self._unsub_flush: Callable[[], None] | None = None
+        self._unsub_state_changed: Callable[[], None] | None = None
+
+    @callback
+    def async_setup(self) -> None:
+        """Index all current states and start tracking changes."""
+        for state in self.hass.states.async_all():
+            self._async_add(state)
+        self._changed.clear()
+        self._unsub_state_changed = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            self._async_state_changed,
+            event_filter=self._async_filter_state_changed,
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop tracking changes."""
+        if self._unsub_state_changed:
+            self._unsub_state_changed()
+            self._unsub_state_changed = None
+        if self._unsub_flush:
+            self._unsub_flush()
+            self._unsub_flush = None
+
+    def count(self, domain: str, *, include_restored: bool = True) -> int:
+        """Return the number of states in a domain, or all with MATCH_ALL."""
+        if include_restored:
+            return self._counts[domain]
+        return self._counts[domain] - self._restored_counts[domain]
+
+    @callback
+    def async_add_listener(
+        self, domain: str, listener: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Listen for changes of the count of a domain."""
+        self._listeners.setdefault(domain, set()).add(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            self._listeners[domain].discard(listener)
+
+        return _remove_listener
+
+    @callback
+    def _async_filter_state_changed(self, event_data: Mapping[str, Any]) -> bool:
+        """Return if a state was added, removed or stopped being restored."""
+        return (
+            event_data["old_state"] is None
+            or event_data["new_state"] is None
+            or event_data["entity_id"] in self._restored
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the counts for a state change."""
+        if (old_state := event.data["old_state"]) is not None:
+            self._async_remove(old_state)
+        if (new_state := event.data["new_state"]) is not None:
+            self._async_add(new_state)
+        if self._unsub_flush is None:
+            self._unsub_flush = async_call_later(self.hass, 5, self._async_flush)
+
+    @callback
+    def _async_add(self, state: State) -> None:
+        """Count a state."""
+        self._counts[state.domain] += 1
+        self._counts[MATCH_ALL] += 1
+        if state.attributes.get("restored", False):
+            self._restored.add(state.entity_id)
+            self._restored_counts[state.domain] += 1
+        self._changed.add(state.domain)
+
+    @callback
+    def _async_remove(self, state: State) -> None:
+        """Stop counting a state."""
+        self._counts[state.domain] -= 1
+        self._counts[MATCH_ALL] -= 1
+        if state.entity_id in self._restored:
+            self._restored.discard(state.entity_id)
+            self._restored_counts[state.domain] -= 1
+        self._changed.add(state.domain)
+
+    @callback
+    def _async_flush(self, _now: datetime | None = None) -> None:
+        """Notify listeners of all domains changed since the last flush."""
+        self._unsub_flush = None
+        changed, self._changed = self._changed, set()
+        changed.add(MATCH_ALL)
+        for domain in changed:
+            for listener in self._listeners.get(domain, set()).copy():
+                listener()
 
 
 SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
@@ -80,8 +187,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:air-filter",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.AIR_QUALITY)),
+        count_domain=Platform.AIR_QUALITY,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.ALARM_CONTROL_PANEL,
@@ -90,10 +196,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:alarm-panel",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(
-            hass.states.async_entity_ids(Platform.ALARM_CONTROL_PANEL),
-        ),
+        count_domain=Platform.ALARM_CONTROL_PANEL,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key="area",
@@ -112,8 +215,8 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:robot",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={automation.EVENT_AUTOMATION_RELOADED},
-        value_fn=lambda hass: _count_active_domain_entities(hass, automation.DOMAIN),
+        count_domain=automation.DOMAIN,
+        count_restored=False,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.BINARY_SENSOR,
@@ -122,8 +225,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:numeric-10",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.BINARY_SENSOR)),
+        count_domain=Platform.BINARY_SENSOR,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.BUTTON,
@@ -132,8 +234,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:gesture-tap",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.BUTTON)),
+        count_domain=Platform.BUTTON,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.CALENDAR,
@@ -142,8 +243,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:calendar",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.CALENDAR)),
+        count_domain=Platform.CALENDAR,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.CAMERA,
@@ -152,8 +252,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:cctv",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.CAMERA)),
+        count_domain=Platform.CAMERA,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.CLIMATE,
@@ -162,8 +261,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:thermostat",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.CLIMATE)),
+        count_domain=Platform.CLIMATE,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.COVER,
@@ -172,8 +270,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:blinds",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.COVER)),
+        count_domain=Platform.COVER,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.DATE,
@@ -182,8 +279,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:calendar-month-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.DATE)),
+        count_domain=Platform.DATE,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.DATETIME,
@@ -192,8 +288,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:calendar-clock",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.DATETIME)),
+        count_domain=Platform.DATETIME,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key="device",
@@ -212,10 +307,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:cellphone-marker",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(
-            hass.states.async_entity_ids(Platform.DEVICE_TRACKER),
-        ),
+        count_domain=Platform.DEVICE_TRACKER,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key="entities",
@@ -224,8 +316,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:counter",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids()),
+        count_domain=MATCH_ALL,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.FAN,
@@ -234,8 +325,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:fan",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.FAN)),
+        count_domain=Platform.FAN,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.HUMIDIFIER,
@@ -244,8 +334,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:air-humidifier",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.HUMIDIFIER)),
+        count_domain=Platform.HUMIDIFIER,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key="integration",
@@ -274,8 +363,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:toggle-switch-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(input_boolean.DOMAIN)),
+        count_domain=input_boolean.DOMAIN,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=input_button.DOMAIN,
@@ -284,8 +372,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:gesture-tap-button",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(input_button.DOMAIN)),
+        count_domain=input_button.DOMAIN,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=input_datetime.DOMAIN,
@@ -294,8 +381,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:clock",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(input_datetime.DOMAIN)),
+        count_domain=input_datetime.DOMAIN,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=input_number.DOMAIN,
@@ -304,8 +390,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:ray-vertex",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(input_number.DOMAIN)),
+        count_domain=input_number.DOMAIN,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=input_select.DOMAIN,
@@ -314,8 +399,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:form-dropdown",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(input_select.DOMAIN)),
+        count_domain=input_select.DOMAIN,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=input_text.DOMAIN,
@@ -324,8 +408,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:form-textbox",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(input_text.DOMAIN)),
+        count_domain=input_text.DOMAIN,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.IMAGE,
@@ -334,8 +417,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:image",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.IMAGE)),
+        count_domain=Platform.IMAGE,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.LIGHT,
@@ -344,8 +426,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:lightbulb",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.LIGHT)),
+        count_domain=Platform.LIGHT,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.LOCK,
@@ -354,8 +435,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:lock",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.LOCK)),
+        count_domain=Platform.LOCK,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.MEDIA_PLAYER,
@@ -364,8 +444,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:record-player",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.MEDIA_PLAYER)),
+        count_domain=Platform.MEDIA_PLAYER,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.NUMBER,
@@ -374,8 +453,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:ray-vertex",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.NUMBER)),
+        count_domain=Platform.NUMBER,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key="persistent_notification",
@@ -401,8 +479,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:account-group",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(person.DOMAIN)),
+        count_domain=person.DOMAIN,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.REMOTE,
@@ -411,8 +488,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:remote",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.REMOTE)),
+        count_domain=Platform.REMOTE,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.SCENE,
@@ -421,8 +497,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:palette",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.SCENE)),
+        count_domain=Platform.SCENE,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=script.DOMAIN,
@@ -431,8 +506,8 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:script-text",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: _count_active_domain_entities(hass, script.DOMAIN),
+        count_domain=script.DOMAIN,
+        count_restored=False,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.SELECT,
@@ -441,8 +516,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:format-list-bulleted",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.SELECT)),
+        count_domain=Platform.SELECT,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.SENSOR,
@@ -451,8 +525,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:eye",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.SENSOR)),
+        count_domain=Platform.SENSOR,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.SIREN,
@@ -461,8 +534,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:bullhorn",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.SIREN)),
+        count_domain=Platform.SIREN,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=sun.DOMAIN,
@@ -471,8 +543,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:emoticon-cool",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(sun.DOMAIN)),
+        count_domain=sun.DOMAIN,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.STT,
@@ -481,8 +552,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:microphone-message",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.STT)),
+        count_domain=Platform.STT,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.SWITCH,
@@ -491,8 +561,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:toggle-switch",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.SWITCH)),
+        count_domain=Platform.SWITCH,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.TEXT,
@@ -501,8 +570,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:form-textbox",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.TEXT)),
+        count_domain=Platform.TEXT,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.TIME,
@@ -511,8 +579,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:clock-time-eight-outline",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.TIME)),
+        count_domain=Platform.TIME,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.TODO,
@@ -521,8 +588,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:clipboard-list",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.TODO)),
+        count_domain=Platform.TODO,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.TTS,
@@ -531,8 +597,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:speaker-message",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.TTS)),
+        count_domain=Platform.TTS,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.VACUUM,
@@ -541,8 +606,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:vacuum",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.VACUUM)),
+        count_domain=Platform.VACUUM,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.UPDATE,
@@ -551,8 +615,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:cellphone-arrow-down",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.UPDATE)),
+        count_domain=Platform.UPDATE,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.WATER_HEATER,
@@ -561,8 +624,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:water-boiler",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.WATER_HEATER)),
+        count_domain=Platform.WATER_HEATER,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=Platform.WEATHER,
@@ -571,8 +633,7 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:weather-cloudy",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(Platform.WEATHER)),
+        count_domain=Platform.WEATHER,
     ),
     HomeAssistantSpookSensorEntityDescription(
         key=zone.DOMAIN,
@@ -581,20 +642,22 @@ SENSORS: tuple[HomeAssistantSpookSensorEntityDescription, ...] = (
         icon="mdi:selection-marker",
         entity_category=EntityCategory.DIAGNOSTIC,
         state_class=SensorStateClass.TOTAL,
-        update_events={EVENT_COMPONENT_LOADED, er.EVENT_ENTITY_REGISTRY_UPDATED},
-        value_fn=lambda hass: len(hass.states.async_entity_ids(zone.DOMAIN)),
+        count_domain=zone.DOMAIN,
     ),
 )
 
 
 async def async_setup_entry(
-    _hass: HomeAssistant,
-    _entry: ConfigEntry,
+    hass: HomeAssistant,
+    entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Spook sensor."""
+    counter = DomainEntityCounter(hass)
+    counter.async_setup()
+    entry.async_on_unload(counter.async_shutdown)
     async_add_entities(
-        HomeAssistantSpookSensorEntity(description) for description in SENSORS
+        HomeAssistantSpookSensorEntity(description, counter) for description in SENSORS
     )
 
 
@@ -604,8 +667,32 @@ class HomeAssistantSpookSensorEntity(HomeAssistantSpookEntity, SensorEntity):
     entity_description: HomeAssistantSpookSensorEntityDescription
     _unsub_debouncer: Callable[[], None] | None = None
 
+    def __init__(
+        self,
+        description: HomeAssistantSpookSensorEntityDescription,
+        counter: DomainEntityCounter,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(description)
+        self._counter = counter
+
     async def async_added_to_hass(self) -> None:
         """Register for sensor updates."""
+        if (domain := self.entity_description.count_domain) is not None:
+            self._attr_native_value = self._async_count()
+
+            @callback
+            def _count_changed() -> None:
+                """Write the state, if the count changed."""
+                if (value := self._async_count()) == self._attr_native_value:
+                    return
+                self._attr_native_value = value
+                self.async_write_ha_state()
+
+            self.async_on_remove(
+                self._counter.async_add_listener(domain, _count_changed)
+            )
+            return
 
         @callback
         def _debounced_update(
@@ -638,7 +725,17 @@ class HomeAssistantSpookSensorEntity(HomeAssistantSpookEntity, SensorEntity):
             self._unsub_debouncer = None
         await super().async_will_remove_from_hass()
 
+    @callback
+    def _async_count(self) -> int:
+        """Return the count of the domain of this sensor."""
+        return self._counter.count(
+            self.entity_description.count_domain,
+            include_restored=self.entity_description.count_restored,
+        )
+
     @property
     def native_value(self) -> int | None:
         """Return the sensor value."""
+        if self.entity_description.value_fn is None:
+            return self._attr_native_value
         return self.entity_description.value_fn(self.hass)
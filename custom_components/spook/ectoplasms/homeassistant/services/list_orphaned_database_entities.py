@@ -4,15 +4,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import create_engine, text
-
 from homeassistant.components.homeassistant import DOMAIN
-from homeassistant.components.recorder import (
-    get_instance,
-)
 from homeassistant.core import ServiceResponse, SupportsResponse
 
 from ....services import AbstractSpookService
+from ..database import async_get_orphaned_entity_ids
 
 if TYPE_CHECKING:
     from homeassistant.core import ServiceCall
@@ -27,21 +23,10 @@ class SpookService(AbstractSpookService):
 
     async def async_handle_service(self, call: ServiceCall) -> ServiceResponse:
         """Handle the service call."""
-        query = text(
-            """
-            SELECT DISTINCT(entity_id) FROM states_meta
-            """
-        )
-        db_url = get_instance(self.hass).db_url
-        engine = create_engine(db_url)
-        with engine.connect() as conn:
-            response = conn.execute(query)
-            db_list = [e[0] for e in response]
-        states_list = self.hass.states.async_entity_ids()
-        compared_list = set(db_list).difference(states_list)
+        orphaned_entity_ids = await async_get_orphaned_entity_ids(self.hass)
         if call.return_response:
             return {
-                "count": len(compared_list),
-                "entities": list(compared_list),
+                "count": len(orphaned_entity_ids),
+                "entities": orphaned_entity_ids,
             }
         return None
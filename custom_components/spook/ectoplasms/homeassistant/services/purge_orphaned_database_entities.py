@@ -0,0 +1,109 @@
+"""Spook - Your homie."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+
+from homeassistant.components.homeassistant import DOMAIN
+from homeassistant.core import ServiceResponse, SupportsResponse
+from homeassistant.helpers import config_validation as cv
+
+from ....const import LOGGER
+from ....services import AbstractSpookService
+from ..database import (
+    async_get_orphaned_entity_ids,
+    async_purge_orphaned_entities_batch,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import ServiceCall
+
+# Number of orphaned entities purged together
+ENTITY_CHUNK_SIZE = 100
+
+
+class SpookService(AbstractSpookService):
+    """Home Assistant Core integration service to purge orphaned database entities."""
+
+    domain = DOMAIN
+    service = "purge_orphaned_database_entities"
+    supports_response = SupportsResponse.OPTIONAL
+    schema = {
+        vol.Optional("batch_size", default=1000): vol.All(
+            vol.Coerce(int), vol.Range(min=100, max=50000)
+        ),
+        vol.Optional("entity_id"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("dry_run", default=False): cv.boolean,
+    }
+
+    async def async_handle_service(self, call: ServiceCall) -> ServiceResponse:
+        """Handle the service call."""
+        started = time.monotonic()
+        # Registered entities are only missing from the state machine while their
+        # integration is disabled, not loaded or failing, they are not orphaned.
+        entity_ids = await async_get_orphaned_entity_ids(
+            self.hass, exclude_registered=True
+        )
+        if "entity_id" in call.data:
+            requested = set(call.data["entity_id"])
+            entity_ids = [
+                entity_id for entity_id in entity_ids if entity_id in requested
+            ]
+
+        if call.data["dry_run"]:
+            LOGGER.info(
+                "Purging orphaned database entities (dry run): would purge %s",
+                entity_ids,
+            )
+            if call.return_response:
+                return {
+                    "entities": len(entity_ids),
+                    "entity_ids": entity_ids,
+                    "dry_run": True,
+                }
+            return None
+
+        rows = {
+            "states": 0,
+            "statistics": 0,
+            "states_meta": 0,
+            "statistics_meta": 0,
+        }
+
+        for offset in range(0, len(entity_ids), ENTITY_CHUNK_SIZE):
+            chunk = entity_ids[offset : offset + ENTITY_CHUNK_SIZE]
+            while True:
+                purged = await async_purge_orphaned_entities_batch(
+                    self.hass, chunk, call.data["batch_size"]
+                )
+                for table, count in purged.items():
+                    rows[table] += count
+                done = not purged["states"] and not purged["statistics"]
+                elapsed = time.monotonic() - started
+                LOGGER.info(
+                    "Purging orphaned database entities: %s of %s entities, "
+                    "%s rows deleted (%.0f rows/s)",
+                    offset + len(chunk) if done else offset,
+                    len(entity_ids),
+                    sum(rows.values()),
+                    sum(rows.values()) / elapsed if elapsed else 0,
+                )
+                if done:
+                    break
+
+        elapsed = time.monotonic() - started
+        if call.return_response:
+            return {
+                "entities": len(entity_ids),
+                "entity_ids": entity_ids,
+                "dry_run": False,
+                "rows": rows,
+                "duration": round(elapsed, 3),
+                "rows_per_second": round(sum(rows.values()) / elapsed, 1)
+                if elapsed
+                else 0.0,
+            }
+        return None
@@ -20,7 +20,7 @@ from ....entity_filtering import (
     async_get_all_entity_ids,
     split_comma_separated_entity_ids,
 )
-from ....repairs import AbstractSpookRepair
+from ....repairs import AbstractSpookRepair, SpookReferenceGraph
 
 if TYPE_CHECKING:
     from collections.abc import Mapping
@@ -30,6 +30,8 @@ if TYPE_CHECKING:
         LovelaceYAML,
     )
 
+    from ....entity_filtering import KnownEntityIdsView
+
 
 class SpookRepair(AbstractSpookRepair):
     """Spook repair tries to find unknown referenced entity in dashboards."""
@@ -47,9 +49,24 @@ class SpookRepair(AbstractSpookRepair):
 
     _dashboards: dict[str, LovelaceStorage | LovelaceYAML]
 
+    reference_graph: SpookReferenceGraph
+
+    _changed_entity_ids: set[str] | None
+    _dashboard_configs: dict[str, Any]
+    _dashboard_versions: dict[str, int]
+    _unknown_entities: dict[str, set[str]]
+    _view_paths: dict[str, dict[str, int | str]]
+
     async def async_activate(self) -> None:
         """Handle the activating a repair."""
         self._dashboards = self.hass.data["lovelace"].dashboards
+        self.reference_graph = SpookReferenceGraph()
+        # None means all dashboards have to be evaluated on the next inspection.
+        self._changed_entity_ids = None
+        self._dashboard_configs = {}
+        self._dashboard_versions = {}
+        self._unknown_entities = {}
+        self._view_paths = {}
         await super().async_activate()
 
         @callback
@@ -61,8 +78,9 @@ class SpookRepair(AbstractSpookRepair):
             )
 
         @callback
-        def _async_call_inspect_debouncer(_: Event) -> None:
+        def _async_call_inspect_debouncer(event: Event) -> None:
             """Trigger an inspection when a state entity is added or removed."""
+            self._async_record_inspect_event(event)
             self.inspect_debouncer.async_schedule_call()
 
         self._event_subs.add(
@@ -73,14 +91,102 @@ class SpookRepair(AbstractSpookRepair):
             ),
         )
 
+    @callback
+    def _async_record_inspect_event(self, event: Event | None) -> None:
+        """Record what changed with the event triggering an inspection.
+
+        Dashboard updates bump the version of that dashboard, causing its
+        config to be extracted again. State and entity registry events record
+        the entity IDs changed; any other trigger causes all cached references
+        to be evaluated again.
+        """
+        if event is not None and event.event_type == EVENT_LOVELACE_UPDATED:
+            url_path = event.data.get("url_path") or "lovelace"
+            self._dashboard_versions[url_path] = (
+                self._dashboard_versions.get(url_path, 0) + 1
+            )
+            return
+        if self._changed_entity_ids is None:
+            return
+        if event is None or event.event_type == EVENT_COMPONENT_LOADED:
+            self._changed_entity_ids = None
+            return
+        changed = {
+            value
+            for key in ("entity_id", "old_entity_id")
+            if isinstance(value := event.data.get(key), str)
+        }
+        if not changed:
+            self._changed_entity_ids = None
+            return
+        self._changed_entity_ids.update(changed)
+
+    @callback
+    def __async_get_unknown_entities(
+        self,
+        url_path: str,
+        config: dict[str, Any],
+        changed: set[str] | None,
+        known_entity_ids: KnownEntityIdsView,
+    ) -> set[str]:
+        """Return the unknown entities of a dashboard, using cached references.
+
+        The config is only extracted again when the dashboard has been updated
+        since, otherwise only the changed entity IDs it references are filtered
+        against the known entities.
+        """
+        version = self._dashboard_versions.get(url_path, 0)
+        cached = self.reference_graph.get(url_path)
+        if (
+            cached is None
+            or cached[0] != version
+            or self._dashboard_configs.get(url_path) is not config
+        ):
+            extracted_entities = self.__async_extract_entities(config)
+            self._view_paths[url_path] = extracted_entities
+            self._dashboard_configs[url_path] = config
+            references = self.reference_graph.set(
+                url_path, version, extracted_entities
+            )
+            self._unknown_entities[url_path] = async_filter_known_entity_ids(
+                self.hass,
+                entity_ids=references,
+                known_entity_ids=known_entity_ids,
+            )
+        elif changed is None:
+            self._unknown_entities[url_path] = async_filter_known_entity_ids(
+                self.hass,
+                entity_ids=cached[1],
+                known_entity_ids=known_entity_ids,
+            )
+        elif affected := changed & cached[1]:
+            self._unknown_entities[url_path] = (
+                self._unknown_entities[url_path] - affected
+            ) | async_filter_known_entity_ids(
+                self.hass,
+                entity_ids=affected,
+                known_entity_ids=known_entity_ids,
+            )
+        return self._unknown_entities[url_path]
+
+    @callback
+    def __async_forget_dashboard(self, url_path: str) -> None:
+        """Forget the cached references of a dashboard."""
+        self.reference_graph.discard(url_path)
+        self._dashboard_configs.pop(url_path, None)
+        self._unknown_entities.pop(url_path, None)
+        self._view_paths.pop(url_path, None)
+
     async def async_inspect(self) -> None:
         """Trigger a inspection."""
         LOGGER.debug("Spook is inspecting: %s", self.repair)
 
+        changed, self._changed_entity_ids = self._changed_entity_ids, set()
         known_entity_ids = async_get_all_entity_ids(self.hass, include_all_none=True)
 
         # Loop over all dashboards and check if there are unknown entities
         # referenced in the dashboards.
+        url_paths: set[str] = set()
         for dashboard in self._dashboards.values():
             url_path = dashboard.url_path or "lovelace"
             self.possible_issue_ids.add(url_path)
@@ -88,18 +194,17 @@ class SpookRepair(AbstractSpookRepair):
                 config = await dashboard.async_load(force=False)
             except ConfigNotFound:
                 LOGGER.debug("Config for dashboard %s not found, skipping", url_path)
+                self.__async_forget_dashboard(url_path)
                 continue
 
-            extracted_entities = self.__async_extract_entities(config)
-            if unknown_entities := async_filter_known_entity_ids(
-                self.hass,
-                entity_ids=set(extracted_entities.keys()),
-                known_entity_ids=known_entity_ids,
+            url_paths.add(url_path)
+            if unknown_entities := self.__async_get_unknown_entities(
+                url_path, config, changed, known_entity_ids
             ):
                 # Get the view path of the first unknown entity (by view order)
                 first_view_path = next(
                     path
-                    for entity_id, path in extracted_entities.items()
+                    for entity_id, path in self._view_paths[url_path].items()
                     if entity_id in unknown_entities
                 )
                 title = "Overview"
@@ -124,6 +229,10 @@ class SpookRepair(AbstractSpookRepair):
                     ", ".join(unknown_entities),
                 )
 
+        # Forget dashboards that have been removed
+        for url_path in set(self._view_paths) - url_paths:
+            self.__async_forget_dashboard(url_path)
+
     @callback
     def __async_extract_entities(self, config: dict[str, Any]) -> dict[str, int | str]:
         """Extract entities from a dashboard config."""
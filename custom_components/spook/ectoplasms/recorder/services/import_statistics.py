@@ -2,24 +2,108 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import csv
+import json
+from operator import itemgetter
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 
-from homeassistant.components.recorder import DOMAIN
+from homeassistant.components.recorder import DOMAIN, get_instance
 from homeassistant.components.recorder.models import StatisticMeanType
 from homeassistant.components.recorder.statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
     async_add_external_statistics,
     async_import_statistics,
+    get_last_statistics,
 )
 from homeassistant.core import ServiceCall, valid_entity_id
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
 
+from ....const import LOGGER
 from ....services import AbstractSpookAdminService
 
 if TYPE_CHECKING:
-    from homeassistant.components.recorder.models import StatisticMetaData
+    from collections.abc import Iterator, Mapping
+    from datetime import datetime
+    from typing import IO
+
+    from homeassistant.components.recorder.models import (
+        StatisticData,
+        StatisticMetaData,
+    )
+
+# Columns of a statistics row holding a number
+STATISTIC_VALUE_COLUMNS = ("mean", "min", "max", "state", "sum")
+# Number of rows submitted to the recorder at once, when importing a file
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def _parse_datetime(value: Any) -> datetime:
+    """Parse a datetime of a statistics row."""
+    if (parsed := dt_util.parse_datetime(str(value))) is None:
+        message = f"invalid datetime {value!r}"
+        raise ValueError(message)
+    return dt_util.as_utc(parsed)
+
+
+def _parse_statistics_row(row: Mapping[str, Any], number: int) -> StatisticData:
+    """Parse and validate a single row of a statistics file."""
+    try:
+        data: StatisticData = {"start": _parse_datetime(row["start"])}
+        for column in STATISTIC_VALUE_COLUMNS:
+            if (value := row.get(column)) not in (None, ""):
+                data[column] = float(value)
+        if (value := row.get("last_reset")) not in (None, ""):
+            data["last_reset"] = _parse_datetime(value)
+    except (KeyError, TypeError, ValueError) as err:
+        message = f"Invalid statistics in row {number}: {err}"
+        raise HomeAssistantError(message) from err
+    return data
+
+
+class StatisticsFileReader:
+    """Streaming reader of statistics rows from a CSV or JSONL file."""
+
+    def __init__(self, path: Path) -> None:
+        """Open the file, blocking."""
+        self.rows = 0
+        self.skipped = 0
+        self._file: IO[str] = path.open(encoding="utf-8", newline="")
+        self._reader: Iterator[Mapping[str, Any]]
+        if path.suffix.lower() == ".csv":
+            self._reader = csv.DictReader(self._file)
+        else:
+            self._reader = (json.loads(line) for line in self._file if line.strip())
+
+    def read_chunk(self, size: int, after: datetime | None) -> list[StatisticData]:
+        """Read, validate and time order the next chunk of rows, blocking.
+
+        Rows starting at or before ``after`` are skipped.
+        """
+        chunk: list[StatisticData] = []
+        try:
+            for row in self._reader:
+                self.rows += 1
+                data = _parse_statistics_row(row, self.rows)
+                if after is not None and data["start"] <= after:
+                    self.skipped += 1
+                    continue
+                chunk.append(data)
+                if len(chunk) >= size:
+                    break
+        except (csv.Error, json.JSONDecodeError) as err:
+            message = f"Invalid statistics in row {self.rows}: {err}"
+            raise HomeAssistantError(message) from err
+        chunk.sort(key=itemgetter("start"))
+        return chunk
+
+    def close(self) -> None:
+        """Close the file, blocking."""
+        self._file.close()
 
 
 class SpookService(AbstractSpookAdminService):
@@ -34,7 +118,7 @@ class SpookService(AbstractSpookAdminService):
         vol.Required("source"): str,
         vol.Required("statistic_id"): str,
         vol.Optional("unit_of_measurement", default=None): vol.Any(None, str),
-        vol.Required("stats"): [
+        vol.Exclusive("stats", "stats"): [
             {
                 vol.Required("start"): cv.datetime,
                 vol.Optional("mean"): vol.Any(float, int),
@@ -45,6 +129,11 @@ class SpookService(AbstractSpookAdminService):
                 vol.Optional("sum"): vol.Any(float, int),
             },
         ],
+        vol.Exclusive("file", "stats"): str,
+        vol.Optional("chunk_size", default=DEFAULT_CHUNK_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100000)
+        ),
+        vol.Optional("resume", default=False): bool,
     }
 
     async def async_handle_service(self, call: ServiceCall) -> None:
@@ -67,7 +156,83 @@ class SpookService(AbstractSpookAdminService):
             "unit_of_measurement": call.data["unit_of_measurement"],
         }
 
-        if valid_entity_id(call.data["statistic_id"]):
-            async_import_statistics(self.hass, metadata, call.data["stats"])
+        if "file" in call.data:
+            await self._async_import_file(call, metadata)
+        elif "stats" in call.data:
+            self._async_import(metadata, call.data["stats"])
         else:
-            async_add_external_statistics(self.hass, metadata, call.data["stats"])
+            message = "Either stats or a file to import statistics from is required"
+            raise HomeAssistantError(message)
+
+    def _async_import(
+        self, metadata: StatisticMetaData, stats: list[StatisticData]
+    ) -> None:
+        """Submit statistics to the recorder."""
+        if valid_entity_id(metadata["statistic_id"]):
+            async_import_statistics(self.hass, metadata, stats)
+        else:
+            async_add_external_statistics(self.hass, metadata, stats)
+
+    async def _async_get_last_start(self, statistic_id: str) -> datetime | None:
+        """Return the start of the last statistics stored in the recorder."""
+        last = await get_instance(self.hass).async_add_executor_job(
+            get_last_statistics, self.hass, 1, statistic_id, False, set()
+        )
+        if not (rows := last.get(statistic_id)):
+            return None
+        return dt_util.utc_from_timestamp(rows[0]["start"])
+
+    async def _async_import_file(
+        self, call: ServiceCall, metadata: StatisticMetaData
+    ) -> None:
+        """Stream statistics from a CSV or JSONL file to the recorder.
+
+        Rows are submitted in time ordered chunks, waiting for the recorder to
+        process each chunk before reading the next. When resuming, rows up to
+        the last statistics already stored in the recorder are skipped.
+        """
+        path = Path(call.data["file"])
+        if not self.hass.config.is_allowed_path(str(path)):
+            message = f"Access to {path} is not allowed"
+            raise HomeAssistantError(message)
+
+        after = None
+        if call.data["resume"]:
+            after = await self._async_get_last_start(metadata["statistic_id"])
+
+        try:
+            reader = await self.hass.async_add_executor_job(
+                StatisticsFileReader, path
+            )
+        except OSError as err:
+            message = f"Could not open statistics file {path}: {err}"
+            raise HomeAssistantError(message) from err
+
+        instance = get_instance(self.hass)
+        last_start = after
+        imported = 0
+        try:
+            while chunk := await self.hass.async_add_executor_job(
+                reader.read_chunk, call.data["chunk_size"], after
+            ):
+                if last_start is not None and chunk[0]["start"] <= last_start:
+                    message = (
+                        f"Statistics in {path} are not in time order "
+                        f"around row {reader.rows}"
+                    )
+                    raise HomeAssistantError(message)
+                self._async_import(metadata, chunk)
+                imported += len(chunk)
+                last_start = chunk[-1]["start"]
+                LOGGER.info(
+                    "Importing statistics for %s: %s rows imported up to %s, "
+                    "%s rows skipped",
+                    metadata["statistic_id"],
+                    imported,
+                    last_start.isoformat(),
+                    reader.skipped,
+                )
+                # Let the recorder catch up, before submitting the next chunk
+                await instance.async_block_till_done()
+        finally:
+            await self.hass.async_add_executor_job(reader.close)
@@ -46,10 +46,14 @@ class SpookRepair(AbstractSpookEntityComponentUnknownReferencesRepair):
         """Cache known services for this inspection cycle."""
         self._known_services = async_get_all_services(self.hass)
 
-    async def _async_compute_unknown_references(self, entity: Any) -> set[str]:
-        """Return unknown services called by ``entity``."""
+    async def _async_extract_references(self, entity: Any) -> set[str]:
+        """Return services called by ``entity``."""
+        return async_find_services_in_sequence(entity.script.sequence)
+
+    def _filter_unknown_references(self, references: frozenset[str]) -> set[str]:
+        """Return unknown services out of ``references``."""
         return async_filter_known_services(
             self.hass,
-            services=async_find_services_in_sequence(entity.script.sequence),
+            services=set(references),
             known_services=self._known_services,
         )
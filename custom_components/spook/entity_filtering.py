@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Set as AbstractSet
+from functools import lru_cache
+from itertools import accumulate
 import re
 from typing import TYPE_CHECKING, Any
 
@@ -17,7 +20,6 @@ from homeassistant.const import (
     CONF_THEN,
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
-    EVENT_COMPONENT_LOADED,
     EVENT_HOMEASSISTANT_START,
     EVENT_STATE_CHANGED,
     Platform,
@@ -40,9 +42,9 @@ from .const import LOGGER
 from .listeners import async_listen_once_tracked
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable, Mapping, Sequence
+    from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant
 
 
 # Entity domains to ignore when filtering unknown entities
@@ -137,10 +139,59 @@ ENTITY_ID_TEMPLATE_PATTERNS = [
 COMPILED_ENTITY_ID_TEMPLATE_PATTERNS = tuple(
     re.compile(pattern, re.IGNORECASE) for pattern in ENTITY_ID_TEMPLATE_PATTERNS
 )
+# All patterns combined into a single scanner, so templates are scanned once
+COMBINED_ENTITY_ID_TEMPLATE_PATTERN = re.compile(
+    "|".join(f"(?:{pattern})" for pattern in ENTITY_ID_TEMPLATE_PATTERNS),
+    re.IGNORECASE,
+)
+# Maps the last group of each alternative to the first group of its pattern
+_COMBINED_PATTERN_FIRST_GROUPS = {
+    last_group: last_group - pattern.groups + 1
+    for last_group, pattern in zip(
+        accumulate(pattern.groups for pattern in COMPILED_ENTITY_ID_TEMPLATE_PATTERNS),
+        COMPILED_ENTITY_ID_TEMPLATE_PATTERNS,
+        strict=True,
+    )
+}
+# Maximum number of template strings to keep extracted entity IDs cached for
+TEMPLATE_ENTITY_CACHE_SIZE = 2048
 JINJA_COMMENT_PATTERN = re.compile(r"\{#.*?#\}", re.DOTALL)
 
 _CACHED_ALL_ENTITY_IDS: set[str] | None = None
 _UNSUB_CACHE_INVALIDATION: Callable[[], None] | None = None
+_CACHE_STATS = {"rebuilds": 0, "deltas": 0}
+_ALL_NONE_ENTITY_IDS = frozenset({ENTITY_MATCH_ALL, ENTITY_MATCH_NONE})
+
+
+class KnownEntityIdsView(AbstractSet[str]):
+    """Read-only, live view on the known entity IDs index."""
+
+    __slots__ = ("_entity_ids", "_extra")
+
+    def __init__(
+        self, entity_ids: set[str], extra: frozenset[str] = frozenset()
+    ) -> None:
+        """Initialize the view."""
+        self._entity_ids = entity_ids
+        self._extra = extra
+
+    @classmethod
+    def _from_iterable(cls, iterable: Iterable[str]) -> set[str]:
+        """Return results of set operations as plain sets."""
+        return set(iterable)
+
+    def __contains__(self, entity_id: object) -> bool:
+        """Return if an entity ID is known."""
+        return entity_id in self._entity_ids or entity_id in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the known entity IDs."""
+        yield from self._entity_ids
+        yield from self._extra.difference(self._entity_ids)
+
+    def __len__(self) -> int:
+        """Return the number of known entity IDs."""
+        return len(self._entity_ids) + len(self._extra.difference(self._entity_ids))
 
 
 @callback
@@ -152,11 +203,43 @@ def _clear_all_entity_ids_cache(*_args: Any) -> None:
     _CACHED_ALL_ENTITY_IDS = None
 
 
+@callback
+def _async_add_known_entity_id(entity_id: str) -> None:
+    """Add an entity ID to the cache, if it is populated."""
+    if _CACHED_ALL_ENTITY_IDS is None or entity_id.startswith(IGNORED_ENTITY_DOMAINS):
+        return
+    _CACHED_ALL_ENTITY_IDS.add(entity_id)
+
+
+@callback
+def _async_discard_known_entity_id(hass: HomeAssistant, entity_id: str) -> None:
+    """Remove an entity ID from the cache, unless it is still known elsewhere."""
+    if (
+        _CACHED_ALL_ENTITY_IDS is None
+        or entity_id in KNOWN_TIME_DATE_ENTITY_IDS
+        or hass.states.get(entity_id) is not None
+        or er.async_get(hass).async_is_registered(entity_id)
+    ):
+        return
+    _CACHED_ALL_ENTITY_IDS.discard(entity_id)
+
+
+@callback
+def async_get_all_entity_ids_cache_stats() -> dict[str, int]:
+    """Return how often the all_entity_ids cache was rebuilt or updated in place."""
+    return {
+        **_CACHE_STATS,
+        "size": len(_CACHED_ALL_ENTITY_IDS) if _CACHED_ALL_ENTITY_IDS else 0,
+    }
+
+
 def async_setup_all_entity_ids_cache_invalidation(
     hass: HomeAssistant,
 ) -> Callable[[], None]:
-    """Set up event listeners to invalidate the all_entity_ids cache.
+    """Set up event listeners to keep the all_entity_ids cache up to date.
 
+    Registry and state add/remove/rename events are applied to the cache as
+    deltas, it is only rebuilt from scratch when Home Assistant has started.
     Returns a callable to unsubscribe the listeners.
     """
     # pylint: disable-next=global-statement
@@ -177,22 +260,45 @@ def async_setup_all_entity_ids_cache_invalidation(
             event_data.get("old_state") is None or event_data.get("new_state") is None
         )
 
+    @callback
+    def _async_entity_registry_updated(event: Event) -> None:
+        """Apply an entity registry create/remove/rename to the cache."""
+        if _CACHED_ALL_ENTITY_IDS is None:
+            return
+        _CACHE_STATS["deltas"] += 1
+        action = event.data["action"]
+        entity_id = event.data["entity_id"]
+        if action == "create":
+            _async_add_known_entity_id(entity_id)
+        elif action == "remove":
+            _async_discard_known_entity_id(hass, entity_id)
+        elif old_entity_id := event.data.get("old_entity_id"):
+            _async_discard_known_entity_id(hass, old_entity_id)
+            _async_add_known_entity_id(entity_id)
+
+    @callback
+    def _async_state_entity_changed(event: Event) -> None:
+        """Apply a state-only entity being added or removed to the cache."""
+        if _CACHED_ALL_ENTITY_IDS is None:
+            return
+        _CACHE_STATS["deltas"] += 1
+        if event.data.get("new_state") is None:
+            _async_discard_known_entity_id(hass, event.data["entity_id"])
+        else:
+            _async_add_known_entity_id(event.data["entity_id"])
+
     # Listen for entity registry updates
     unsub_registry_update = hass.bus.async_listen(
-        er.EVENT_ENTITY_REGISTRY_UPDATED, _clear_all_entity_ids_cache
+        er.EVENT_ENTITY_REGISTRY_UPDATED, _async_entity_registry_updated
     )
     # Listen for Home Assistant start to ensure cache is clear then
     unsub_hass_start = async_listen_once_tracked(
         hass, EVENT_HOMEASSISTANT_START, _clear_all_entity_ids_cache
     )
-    # Listen for components loading
-    unsub_component_loaded = hass.bus.async_listen(
-        EVENT_COMPONENT_LOADED, _clear_all_entity_ids_cache
-    )
     # Listen for state-only entities being added or removed.
     unsub_state_changed = hass.bus.async_listen(
         EVENT_STATE_CHANGED,
-        _clear_all_entity_ids_cache,
+        _async_state_entity_changed,
         event_filter=_state_entity_changed,
     )
 
@@ -207,8 +313,8 @@ def async_setup_all_entity_ids_cache_invalidation(
         )
         unsub_registry_update()
         unsub_hass_start()
-        unsub_component_loaded()
         unsub_state_changed()
+        _clear_all_entity_ids_cache()
         _UNSUB_CACHE_INVALIDATION = None  # Mark as unsubscribed
 
     _UNSUB_CACHE_INVALIDATION = _unsubscribe_listeners
@@ -218,8 +324,11 @@ def async_setup_all_entity_ids_cache_invalidation(
 @callback
 def async_get_all_entity_ids(
     hass: HomeAssistant, *, include_all_none: bool = False
-) -> set[str]:
-    """Return entity IDs known to Home Assistant or treated as known by Spook."""
+) -> KnownEntityIdsView:
+    """Return entity IDs known to Home Assistant or treated as known by Spook.
+
+    The result is a read-only view on the cache, it reflects later changes.
+    """
     # pylint: disable-next=global-statement
     global _CACHED_ALL_ENTITY_IDS  # noqa: PLW0603
 
@@ -244,15 +353,16 @@ def async_get_all_entity_ids(
             for entity_id in combined_entity_ids
             if not entity_id.startswith(IGNORED_ENTITY_DOMAINS)
         }
+        _CACHE_STATS["rebuilds"] += 1
         LOGGER.debug(
             "Spook's all_entity_ids cache populated with %s entities",
             len(_CACHED_ALL_ENTITY_IDS),
         )
 
-    # Return a copy from the cache, optionally adding ALL/NONE
+    # Return a view on the cache, optionally adding ALL/NONE
     if include_all_none:
-        return _CACHED_ALL_ENTITY_IDS.union({ENTITY_MATCH_ALL, ENTITY_MATCH_NONE})
-    return _CACHED_ALL_ENTITY_IDS.copy()
+        return KnownEntityIdsView(_CACHED_ALL_ENTITY_IDS, _ALL_NONE_ENTITY_IDS)
+    return KnownEntityIdsView(_CACHED_ALL_ENTITY_IDS)
 
 
 @callback
@@ -302,7 +412,7 @@ def async_filter_known_device_ids(
 def async_filter_known_entity_ids(
     hass: HomeAssistant,
     entity_ids: Iterable[str],
-    known_entity_ids: set[str] | None = None,
+    known_entity_ids: AbstractSet[str] | None = None,
 ) -> set[str]:
     """Filter out known entity IDs.
 
@@ -447,13 +557,11 @@ def _strip_jinja_comments(template_str: str) -> str:
     return JINJA_COMMENT_PATTERN.sub("", template_str)
 
 
-def _is_concatenated_template_match(template_str: str, match: re.Match[str]) -> bool:
+def _is_concatenated_template_match(
+    template_str: str, span: tuple[int, int]
+) -> bool:
     """Return if a quoted entity ID literal is part of a concatenated string."""
-    groups = match.groups()
-    if len(groups) == _STATES_DOMAIN_ENTITY_GROUPS:
-        return False
-
-    entity_start, entity_end = match.span(1)
+    entity_start, entity_end = span
     before_entity = template_str[:entity_start].rstrip()
     after_entity = template_str[entity_end:].lstrip()
 
@@ -465,13 +573,9 @@ def _is_concatenated_template_match(template_str: str, match: re.Match[str]) ->
     return before_literal.endswith("~") or after_literal.startswith("~")
 
 
-def _is_jinja_import_match(template_str: str, match: re.Match[str]) -> bool:
+def _is_jinja_import_match(template_str: str, span: tuple[int, int]) -> bool:
     """Return if a quoted entity-like literal is a Jinja import filename."""
-    groups = match.groups()
-    if len(groups) == _STATES_DOMAIN_ENTITY_GROUPS:
-        return False
-
-    entity_start, entity_end = match.span(1)
+    entity_start, entity_end = span
     block_start = template_str.rfind("{%", 0, entity_start)
     expression_start = template_str.rfind("{{", 0, entity_start)
     if block_start == -1 or expression_start > block_start:
@@ -491,13 +595,11 @@ def _is_jinja_import_match(template_str: str, match: re.Match[str]) -> bool:
     )
 
 
-def _is_string_method_argument_match(template_str: str, match: re.Match[str]) -> bool:
+def _is_string_method_argument_match(
+    template_str: str, span: tuple[int, int]
+) -> bool:
     """Return if an entity-like literal is used as a string method argument."""
-    groups = match.groups()
-    if len(groups) == _STATES_DOMAIN_ENTITY_GROUPS:
-        return False
-
-    entity_start = match.span(1)[0]
+    entity_start = span[0]
     before_entity = template_str[:entity_start].rstrip()
     if not before_entity.endswith(("'", '"')):
         return False
@@ -518,15 +620,38 @@ def _is_string_method_argument_match(template_str: str, match: re.Match[str]) ->
     return False
 
 
-def _entity_id_from_template_match(match: re.Match[str]) -> str:
-    """Return the entity ID captured by a template regex match."""
-    groups = match.groups()
+def _iter_template_entity_ids(template_str: str) -> Iterator[str]:
+    """Yield the entity IDs matched by the combined template scanner."""
+    for match in COMBINED_ENTITY_ID_TEMPLATE_PATTERN.finditer(template_str):
+        last_group = match.lastindex or 0
+        first_group = _COMBINED_PATTERN_FIRST_GROUPS[last_group]
 
-    # Handle the states.domain.entity pattern that captures (domain, object_id)
-    if len(groups) == _STATES_DOMAIN_ENTITY_GROUPS:
-        return f"{groups[0]}.{groups[1]}"
+        # Handle the states.domain.entity pattern that captures (domain, object_id)
+        if last_group - first_group + 1 == _STATES_DOMAIN_ENTITY_GROUPS:
+            yield f"{match[first_group]}.{match[last_group]}"
+            continue
+
+        span = match.span(first_group)
+        if (
+            _is_concatenated_template_match(template_str, span)
+            or _is_jinja_import_match(template_str, span)
+            or _is_string_method_argument_match(template_str, span)
+        ):
+            continue
+
+        yield match[first_group]
 
-    return groups[0]
+
+@lru_cache(maxsize=TEMPLATE_ENTITY_CACHE_SIZE)
+def _extract_entities_from_template_text(template_str: str) -> frozenset[str]:
+    """Extract entity IDs from template text, cached by the text."""
+    entities = set()
+    for entity_id in _iter_template_entity_ids(_strip_jinja_comments(template_str)):
+        # For each entity ID (which might be comma-separated), add all valid ones
+        for individual_id in split_comma_separated_entity_ids(entity_id):
+            if valid_entity_id(individual_id):
+                entities.add(individual_id)
+    return frozenset(entities)
 
 
 def extract_entities_from_template_regex(
@@ -539,41 +664,23 @@ def extract_entities_from_template_regex(
     This function uses regex patterns based on Home Assistant's core validation
     patterns to find entity IDs referenced in template functions. It's designed
     to complement the RenderInfo analysis by catching entities that might be
-    missed by template parsing.
+    missed by template parsing. Results are cached per template string.
     """
     if not isinstance(template_str, str):
         return set()
 
-    template_without_comments = _strip_jinja_comments(template_str)
-
-    entities = set()
-
-    for pattern in COMPILED_ENTITY_ID_TEMPLATE_PATTERNS:
-        for match in pattern.finditer(template_without_comments):
-            if (
-                _is_concatenated_template_match(template_without_comments, match)
-                or _is_jinja_import_match(template_without_comments, match)
-                or _is_string_method_argument_match(template_without_comments, match)
-            ):
-                continue
-
-            entity_id = _entity_id_from_template_match(match)
-
-            # For each entity ID (which might be comma-separated), add all valid ones
-            for individual_id in split_comma_separated_entity_ids(entity_id):
-                if valid_entity_id(individual_id):
-                    entities.add(individual_id)
+    entities = _extract_entities_from_template_text(template_str)
 
     # Filter out known services to avoid false positives
     if known_services is None:
         known_services = async_get_all_services(hass)
-    return entities - known_services
+    return set(entities - known_services)
 
 
 async def _process_template_object(
     hass: HomeAssistant,
     template: Template,
-    known_entity_ids: set[str],
+    known_entity_ids: AbstractSet[str],
     known_services: set[str],
     unknown_entities: set[str],
 ) -> None:
@@ -600,7 +707,7 @@ async def _process_template_object(
 async def _process_template_string(
     hass: HomeAssistant,
     template_str: str,
-    known_entity_ids: set[str],
+    known_entity_ids: AbstractSet[str],
     known_services: set[str],
     unknown_entities: set[str],
 ) -> None:
@@ -623,7 +730,7 @@ async def _process_template_string(
 async def async_filter_known_entity_ids_with_templates(
     hass: HomeAssistant,
     entity_ids: Iterable[str],
-    known_entity_ids: set[str] | None = None,
+    known_entity_ids: AbstractSet[str] | None = None,
 ) -> set[str]:
     """Async version that can process templates to extract entity dependencies.
 
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .const import DOMAIN, LOGGER
+from .setup_helpers import get_ectoplasm_manifest
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -16,16 +17,16 @@ def link_sub_integrations(hass: HomeAssistant) -> bool:
     LOGGER.debug("Linking up Spook sub integrations")
 
     changes = False
-    for manifest in Path(__file__).parent.rglob("integrations/*/manifest.json"):
-        LOGGER.debug("Linking Spook sub integration: %s", manifest.parent.name)
-        dest = Path(hass.config.config_dir) / "custom_components" / manifest.parent.name
+    for name in get_ectoplasm_manifest().sub_integrations:
+        LOGGER.debug("Linking Spook sub integration: %s", name)
+        dest = Path(hass.config.config_dir) / "custom_components" / name
         if not dest.exists():
             src = (
                 Path(hass.config.config_dir)
                 / "custom_components"
                 / DOMAIN
                 / "integrations"
-                / manifest.parent.name
+                / name
             )
             dest.symlink_to(src)
             changes = True
@@ -35,8 +36,8 @@ def link_sub_integrations(hass: HomeAssistant) -> bool:
 def unlink_sub_integrations(hass: HomeAssistant) -> None:
     """Unlink Spook sub integrations."""
     LOGGER.debug("Unlinking Spook sub integrations")
-    for manifest in Path(__file__).parent.rglob("integrations/*/manifest.json"):
-        LOGGER.debug("Unlinking Spook sub integration: %s", manifest.parent.name)
-        dest = Path(hass.config.config_dir) / "custom_components" / manifest.parent.name
+    for name in get_ectoplasm_manifest().sub_integrations:
+        LOGGER.debug("Unlinking Spook sub integration: %s", name)
+        dest = Path(hass.config.config_dir) / "custom_components" / name
         if dest.exists():
             dest.unlink()
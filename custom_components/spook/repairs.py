@@ -5,8 +5,6 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 import asyncio
 from dataclasses import dataclass, field
-import importlib
-from pathlib import Path
 from typing import TYPE_CHECKING, Any, final
 
 from homeassistant.components.homeassistant import SERVICE_HOMEASSISTANT_RESTART
@@ -31,9 +29,16 @@ from homeassistant.util.async_ import create_eager_task
 
 from .const import DOMAIN, LOGGER
 from .entity_filtering import async_get_all_entity_ids
+from .setup_helpers import ECTOPLASM_REPAIRS, async_setup_ectoplasm_modules
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Coroutine, Mapping
+    from collections.abc import (
+        Callable,
+        Coroutine,
+        Iterable,
+        Mapping,
+        Set as AbstractSet,
+    )
     from types import ModuleType
 
     from homeassistant.data_entry_flow import FlowResult
@@ -188,8 +193,9 @@ class AbstractSpookRepair(AbstractSpookRepairBase):
         if self.inspect_events is None:
             return
 
-        async def _async_call_inspect_debouncer(_: Event) -> None:
+        async def _async_call_inspect_debouncer(event: Event) -> None:
             # Trigger an inspection when an event is received from the event bus.
+            self._async_record_inspect_event(event)
             await self.inspect_debouncer.async_call()
 
         for event in self.inspect_events:
@@ -234,6 +240,7 @@ class AbstractSpookRepair(AbstractSpookRepairBase):
                     and entry.domain != self.inspect_config_entry_changed
                 ):
                     return
+                self._async_record_inspect_event(None)
                 await self.inspect_debouncer.async_call()
 
             self._event_subs.add(
@@ -244,6 +251,14 @@ class AbstractSpookRepair(AbstractSpookRepairBase):
                 ),
             )
 
+    # pylint: disable-next=unused-argument
+    @callback
+    def _async_record_inspect_event(self, event: Event | None) -> None:  # noqa: ARG002
+        """Record the event triggering an upcoming inspection.
+
+        ``None`` is passed for triggers not coming from the event bus.
+        """
+
     async def async_deactivate(self) -> None:
         """Unregister the repair."""
         for sub in self._event_subs.copy():
@@ -253,15 +268,94 @@ class AbstractSpookRepair(AbstractSpookRepairBase):
         await super().async_deactivate()
 
 
+#: Event data keys holding the registry or state IDs an event is about.
+REFERENCE_EVENT_DATA_KEYS = (
+    "entity_id",
+    "old_entity_id",
+    "device_id",
+    "area_id",
+    "floor_id",
+    "label_id",
+)
+
+
+class SpookReferenceGraph:
+    """Graph of the references extracted from each referrer.
+
+    Holds the references extracted from each referrer (e.g. an automation),
+    together with a hash of the configuration they were extracted from, and a
+    reverse index from each reference to the referrers using it. This allows
+    for re-evaluating only the referrers affected by a registry change.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the reference graph."""
+        self._references: dict[str, tuple[int, frozenset[str]]] = {}
+        self._referrers: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of referrers in the graph."""
+        return len(self._references)
+
+    def get(self, referrer: str) -> tuple[int, frozenset[str]] | None:
+        """Return the configuration hash and references of a referrer."""
+        return self._references.get(referrer)
+
+    def set(
+        self, referrer: str, config_hash: int, references: Iterable[str]
+    ) -> frozenset[str]:
+        """Store the references of a referrer and update the reverse index."""
+        self.discard(referrer)
+        frozen = frozenset(references)
+        self._references[referrer] = (config_hash, frozen)
+        for reference in frozen:
+            self._referrers.setdefault(reference, set()).add(referrer)
+        return frozen
+
+    def discard(self, referrer: str) -> None:
+        """Remove a referrer from the graph."""
+        if (cached := self._references.pop(referrer, None)) is None:
+            return
+        for reference in cached[1]:
+            if (referrers := self._referrers.get(reference)) is None:
+                continue
+            referrers.discard(referrer)
+            if not referrers:
+                del self._referrers[reference]
+
+    def retain(self, referrers: AbstractSet[str]) -> None:
+        """Remove all referrers from the graph, except the given ones."""
+        for referrer in self._references.keys() - referrers:
+            self.discard(referrer)
+
+    def referrers(self, references: Iterable[str]) -> set[str]:
+        """Return the referrers using any of the given references."""
+        result: set[str] = set()
+        for reference in references:
+            if referrers := self._referrers.get(reference):
+                result.update(referrers)
+        return result
+
+    def clear(self) -> None:
+        """Clear the graph."""
+        self._references.clear()
+        self._referrers.clear()
+
+
 class AbstractSpookEntityComponentUnknownReferencesRepair(AbstractSpookRepair, ABC):
     """Base class for repairs that find unknown references in component entities.
 
     Handles the shared boilerplate for inspecting entities loaded via
     `EntityComponent` (e.g. automations, scripts): iterating the component's
     entities, skipping unavailable ones, computing per-entity unknown references
-    via a subclass hook, and creating an issue with the standard translation
+    via subclass hooks, and creating an issue with the standard translation
     placeholders (``<reference_label>``, ``<entity_label>``, ``edit``,
     ``entity_id``).
+
+    References extracted from an entity are kept in a `SpookReferenceGraph`
+    until its configuration changes. When an inspection is triggered by
+    registry or state events only, just the entities referencing the changed
+    IDs are evaluated again; all others re-use their previous outcome.
     """
 
     automatically_clean_up_issues = True
@@ -283,6 +377,41 @@ class AbstractSpookEntityComponentUnknownReferencesRepair(AbstractSpookRepair, A
     #: ``{unique_id}`` field (e.g. ``"/config/automation/edit/{unique_id}"``).
     edit_url_pattern: str
 
+    reference_graph: SpookReferenceGraph
+
+    _changed_references: set[str] | None
+    _unknown_references: dict[str, set[str]]
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the repair."""
+        super().__init__(hass)
+        self.reference_graph = SpookReferenceGraph()
+        # None means everything has to be evaluated on the next inspection.
+        self._changed_references = None
+        self._unknown_references = {}
+
+    @callback
+    def _async_record_inspect_event(self, event: Event | None) -> None:
+        """Record the IDs changed by the event triggering an inspection.
+
+        Events not about a registry or state ID (e.g. reloads or loaded
+        components) cause all entities to be evaluated again.
+        """
+        if self._changed_references is None:
+            return
+        if event is None:
+            self._changed_references = None
+            return
+        changed = {
+            value
+            for key in REFERENCE_EVENT_DATA_KEYS
+            if isinstance(value := event.data.get(key), str)
+        }
+        if not changed:
+            self._changed_references = None
+            return
+        self._changed_references.update(changed)
+
     async def _async_setup_inspection(self) -> None:
         """Prepare per-inspection state (called once per inspection cycle).
 
@@ -300,14 +429,44 @@ class AbstractSpookEntityComponentUnknownReferencesRepair(AbstractSpookRepair, A
         return True
 
     @abstractmethod
-    async def _async_compute_unknown_references(self, entity: Any) -> set[str]:
-        """Return the set of unknown referenced IDs for a single entity."""
+    async def _async_extract_references(self, entity: Any) -> set[str]:
+        """Return all IDs referenced by the configuration of a single entity."""
+
+    @abstractmethod
+    def _filter_unknown_references(self, references: frozenset[str]) -> set[str]:
+        """Return the unknown IDs out of the references of a single entity."""
+
+    def _config_hash(self, entity: Any) -> int:
+        """Return a hash identifying the configuration of an entity.
+
+        Entities are recreated on reload, so the entity itself is part of it.
+        """
+        return hash((id(entity), repr(getattr(entity, "raw_config", None))))
+
+    async def _async_get_references(
+        self, entity: Any, *, verify: bool
+    ) -> frozenset[str]:
+        """Return the references of an entity, extracting them if needed."""
+        cached = self.reference_graph.get(entity.entity_id)
+        if cached is not None and not verify:
+            return cached[1]
+        config_hash = self._config_hash(entity)
+        if cached is not None and cached[0] == config_hash:
+            return cached[1]
+        return self.reference_graph.set(
+            entity.entity_id,
+            config_hash,
+            await self._async_extract_references(entity),
+        )
 
     async def async_inspect(self) -> None:
         """Trigger an inspection."""
         self.possible_issue_ids.clear()
+        changed, self._changed_references = self._changed_references, set()
 
         if self.domain not in (instances := self.hass.data.get(DATA_INSTANCES, {})):
+            self.reference_graph.clear()
+            self._unknown_references.clear()
             return
 
         entity_component = instances[self.domain]
@@ -316,16 +475,32 @@ class AbstractSpookEntityComponentUnknownReferencesRepair(AbstractSpookRepair, A
 
         await self._async_setup_inspection()
 
+        affected = None if changed is None else self.reference_graph.referrers(changed)
+        inspected: set[str] = set()
+
         for entity in entity_component.entities:
             self.possible_issue_ids.add(entity.entity_id)
 
-            if isinstance(entity, self.unavailable_entity_class):
+            if isinstance(
+                entity, self.unavailable_entity_class
+            ) or not self._should_inspect_entity(entity):
+                # Skipped entities could miss changes, so forget their outcome.
+                self._unknown_references.pop(entity.entity_id, None)
                 continue
 
-            if not self._should_inspect_entity(entity):
-                continue
+            inspected.add(entity.entity_id)
+            unknown = (
+                None
+                if affected is None or entity.entity_id in affected
+                else self._unknown_references.get(entity.entity_id)
+            )
+            if unknown is None:
+                references = await self._async_get_references(
+                    entity, verify=affected is None
+                )
+                unknown = self._filter_unknown_references(references)
+                self._unknown_references[entity.entity_id] = unknown
 
-            unknown = await self._async_compute_unknown_references(entity)
             if not unknown:
                 continue
 
@@ -350,6 +525,11 @@ class AbstractSpookEntityComponentUnknownReferencesRepair(AbstractSpookRepair, A
                 ", ".join(sorted_unknown),
             )
 
+        if affected is None:
+            self.reference_graph.retain(inspected)
+            for entity_id in self._unknown_references.keys() - inspected:
+                del self._unknown_references[entity_id]
+
 
 class AbstractSpookEntityPlatformUnknownSourceRepair(AbstractSpookRepair, ABC):
     """Base class for repairs that find unknown source entities on helpers.
@@ -434,6 +614,7 @@ class SpookRepairManager:
     hass: HomeAssistant
 
     _repairs: set[AbstractSpookRepair] = field(default_factory=set)
+    _unsub_modules: Callable[[], None] | None = None
 
     def __post_init__(self) -> None:
         """Post initialization."""
@@ -444,24 +625,22 @@ class SpookRepairManager:
         """Set up the Spook repairs."""
         LOGGER.debug("Setting up Spook repairs")
 
-        modules: list[ModuleType] = []
-
-        def _load_all_repair_modules() -> None:
-            """Load all repair modules."""
-            for module_file in Path(__file__).parent.rglob("ectoplasms/*/repairs/*.py"):
-                if module_file.name == "__init__.py":
-                    continue
-                module_path = str(module_file.relative_to(Path(__file__).parent))[
-                    :-3
-                ].replace("/", ".")
-                modules.append(importlib.import_module(f".{module_path}", __package__))
-
-        await self.hass.async_add_import_executor_job(_load_all_repair_modules)
-        await asyncio.gather(
-            *(
-                create_eager_task(self.async_activate(module.SpookRepair(self.hass)))
-                for module in modules
+        async def _async_setup_repair_modules(modules: list[ModuleType]) -> None:
+            """Activate the repairs of ectoplasm repair modules."""
+            await asyncio.gather(
+                *(
+                    create_eager_task(
+                        self.async_activate(module.SpookRepair(self.hass))
+                    )
+                    for module in modules
+                )
             )
+
+        self._unsub_modules = await async_setup_ectoplasm_modules(
+            self.hass,
+            ECTOPLASM_REPAIRS,
+            _async_setup_repair_modules,
+            defer=True,
         )
 
     async def async_activate(self, repair: AbstractSpookRepair) -> None:
@@ -477,6 +656,9 @@ class SpookRepairManager:
     async def async_on_unload(self) -> None:
         """Tear down the Spook reapris."""
         LOGGER.debug("Tearing down Spook repairs")
+        if self._unsub_modules:
+            self._unsub_modules()
+            self._unsub_modules = None
         for repair in self._repairs:
             LOGGER.debug(
                 "Unregistering Spook repair: %s.%s",
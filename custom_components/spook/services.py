@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-import importlib
-from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, final
 
 from awesomeversion import AwesomeVersion
@@ -41,6 +39,7 @@ from homeassistant.helpers.translation import (
 from homeassistant.loader import async_get_integration
 
 from .const import DOMAIN, LOGGER
+from .setup_helpers import ECTOPLASM_SERVICES, async_setup_ectoplasm_modules
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -268,6 +267,7 @@ class SpookServiceManager:
         default_factory=dict
     )
     _translation_listener: Callable[[], None] | None = None
+    _unsub_modules: Callable[[], None] | None = None
 
     def __post_init__(self) -> None:
         """Post initialization."""
@@ -300,22 +300,21 @@ class SpookServiceManager:
                 ),
             )
 
-        modules: list[ModuleType] = []
-
-        def _load_all_service_modules() -> None:
-            """Load all service modules."""
-            for module_file in Path(__file__).parent.rglob(
-                "ectoplasms/*/services/*.py"
-            ):
-                if module_file.name == "__init__.py":
-                    continue
-                module_path = str(module_file.relative_to(Path(__file__).parent))[
-                    :-3
-                ].replace("/", ".")
-                modules.append(importlib.import_module(f".{module_path}", __package__))
+        self._unsub_modules = await async_setup_ectoplasm_modules(
+            self.hass,
+            ECTOPLASM_SERVICES,
+            self._async_setup_service_modules,
+            defer=True,
+        )
 
-        await self.hass.async_add_import_executor_job(_load_all_service_modules)
+        await self.async_inject_service_translations()
+        self._translation_listener = self.hass.bus.async_listen(
+            EVENT_CORE_CONFIG_UPDATE,
+            self._async_core_config_updated,
+        )
 
+    async def _async_setup_service_modules(self, modules: list[ModuleType]) -> None:
+        """Register the services of ectoplasm service modules."""
         for module in modules:
             service = module.SpookService(self.hass)
             if isinstance(
@@ -334,11 +333,9 @@ class SpookServiceManager:
 
             self.async_register_service(service)
 
-        await self.async_inject_service_translations()
-        self._translation_listener = self.hass.bus.async_listen(
-            EVENT_CORE_CONFIG_UPDATE,
-            self._async_core_config_updated,
-        )
+        # Services of integrations loaded after set up need their translations
+        if self._translation_listener is not None:
+            await self.async_inject_service_translations()
 
     @callback
     def async_register_service(self, service: AbstractSpookService) -> None:
@@ -523,6 +520,9 @@ class SpookServiceManager:
     def async_on_unload(self) -> None:
         """Tear down the Spook services."""
         LOGGER.debug("Tearing down Spook services")
+        if self._unsub_modules:
+            self._unsub_modules()
+            self._unsub_modules = None
         if self._translation_listener:
             self._translation_listener()
             self._translation_listener = None
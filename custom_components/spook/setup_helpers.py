@@ -3,20 +3,215 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import cache
 import importlib
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+import time
+from typing import TYPE_CHECKING, Any
 
-from .const import LOGGER
+from homeassistant.const import EVENT_COMPONENT_LOADED
+from homeassistant.core import callback
+from homeassistant.util.async_ import create_eager_task
+
+from .const import DOMAIN, LOGGER, PLATFORMS
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterable, Mapping
     from types import ModuleType
 
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.const import Platform
-    from homeassistant.core import HomeAssistant
+    from homeassistant.core import Event, HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+# Kinds of ectoplasm modules, next to the platforms in PLATFORMS
+ECTOPLASM_SETUP = "setup"
+ECTOPLASM_SERVICES = "services"
+ECTOPLASM_REPAIRS = "repairs"
+
+
+@dataclass(frozen=True, slots=True)
+class EctoplasmManifest:
+    """Manifest of all Spook ectoplasm modules.
+
+    Modules are listed per kind (setup, services, repairs or a platform), keyed
+    by the domain of the ectoplasm they belong to, which is the domain of the
+    integration they target.
+    """
+
+    modules: Mapping[str, Mapping[str, tuple[str, ...]]]
+    sub_integrations: tuple[str, ...]
+
+    def modules_of(self, kind: str) -> Mapping[str, tuple[str, ...]]:
+        """Return the module paths of a kind, keyed by ectoplasm domain."""
+        return self.modules.get(kind, {})
+
+
+@cache
+def get_ectoplasm_manifest() -> EctoplasmManifest:
+    """Return the manifest of all Spook ectoplasm modules, blocking.
+
+    The ectoplasms are walked once, after which the manifest is cached for the
+    lifetime of the process.
+    """
+    start = time.perf_counter()
+    base = Path(__file__).parent
+    modules: defaultdict[str, defaultdict[str, list[str]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+
+    with os.scandir(base / "ectoplasms") as ectoplasms:
+        for ectoplasm in sorted(ectoplasms, key=lambda entry: entry.name):
+            if not ectoplasm.is_dir() or ectoplasm.name.startswith("__"):
+                continue
+            domain = ectoplasm.name
+            with os.scandir(ectoplasm.path) as entries:
+                for entry in sorted(entries, key=lambda entry: entry.name):
+                    name = entry.name
+                    if name in (ECTOPLASM_SERVICES, ECTOPLASM_REPAIRS):
+                        with os.scandir(entry.path) as kind_entries:
+                            modules[name][domain].extend(
+                                f"ectoplasms.{domain}.{name}.{module.name[:-3]}"
+                                for module in sorted(
+                                    kind_entries, key=lambda entry: entry.name
+                                )
+                                if module.name.endswith(".py")
+                                and module.name != "__init__.py"
+                            )
+                    elif name == "__init__.py":
+                        # Imported once the integration is loaded, and only set up
+                        # when the package provides async_setup_entry
+                        modules[ECTOPLASM_SETUP][domain].append(f"ectoplasms.{domain}")
+                    elif name.endswith(".py") and name[:-3] in PLATFORMS:
+                        modules[name[:-3]][domain].append(
+                            f"ectoplasms.{domain}.{name[:-3]}"
+                        )
+
+    manifest = EctoplasmManifest(
+        modules={
+            kind: {domain: tuple(paths) for domain, paths in domains.items()}
+            for kind, domains in modules.items()
+        },
+        sub_integrations=tuple(
+            sorted(
+                path.parent.name
+                for path in (base / "integrations").glob("*/manifest.json")
+            )
+        ),
+    )
+    LOGGER.debug(
+        "Built Spook ectoplasm manifest in %.3f seconds",
+        time.perf_counter() - start,
+    )
+    return manifest
+
+
+@callback
+def async_is_ectoplasm_domain_loaded(hass: HomeAssistant, domain: str) -> bool:
+    """Return if the integration targeted by an ectoplasm is loaded."""
+    return domain == DOMAIN or domain in hass.config.components
+
+
+def _import_ectoplasm_modules(
+    paths: Mapping[str, Iterable[str]],
+) -> dict[str, list[ModuleType]]:
+    """Import ectoplasm modules, keyed by ectoplasm domain, blocking."""
+    modules: dict[str, list[ModuleType]] = {}
+    for domain, domain_paths in paths.items():
+        for path in domain_paths:
+            start = time.perf_counter()
+            modules.setdefault(domain, []).append(
+                importlib.import_module(f".{path}", __package__)
+            )
+            LOGGER.debug(
+                "Loaded Spook module %s in %.3f seconds",
+                path,
+                time.perf_counter() - start,
+            )
+    return modules
+
+
+async def _async_setup_ectoplasm(
+    kind: str,
+    domain: str,
+    modules: list[ModuleType],
+    setup: Callable[[list[ModuleType]], Coroutine[Any, Any, None]],
+) -> None:
+    """Set up the modules of a single ectoplasm and report its timing."""
+    start = time.perf_counter()
+    await setup(modules)
+    LOGGER.debug(
+        "Set up Spook ectoplasm %s (%s) in %.3f seconds",
+        domain,
+        kind,
+        time.perf_counter() - start,
+    )
+
+
+async def async_setup_ectoplasm_modules(
+    hass: HomeAssistant,
+    kind: str,
+    setup: Callable[[list[ModuleType]], Coroutine[Any, Any, None]],
+    *,
+    defer: bool = False,
+) -> Callable[[], None]:
+    """Set up the modules of a kind, for ectoplasms with a loaded integration.
+
+    Modules of ectoplasms targeting an integration that is not loaded are not
+    imported. When ``defer`` is set, those are imported and set up once their
+    integration gets loaded. Returns a callback to stop waiting for those.
+    """
+    manifest = await hass.async_add_executor_job(get_ectoplasm_manifest)
+    pending = dict(manifest.modules_of(kind))
+
+    async def _async_setup_domains(domains: list[str]) -> None:
+        """Import and set up the modules of the given ectoplasms."""
+        modules = await hass.async_add_import_executor_job(
+            _import_ectoplasm_modules,
+            {domain: pending.pop(domain) for domain in domains},
+        )
+        await asyncio.gather(
+            *(
+                create_eager_task(
+                    _async_setup_ectoplasm(kind, domain, domain_modules, setup)
+                )
+                for domain, domain_modules in modules.items()
+            )
+        )
+
+    if loaded := [
+        domain for domain in pending if async_is_ectoplasm_domain_loaded(hass, domain)
+    ]:
+        await _async_setup_domains(loaded)
+
+    if not defer or not pending:
+        if pending:
+            LOGGER.debug(
+                "Skipped Spook ectoplasms (%s) for integrations not loaded: %s",
+                kind,
+                ", ".join(sorted(pending)),
+            )
+        return lambda: None
+
+    @callback
+    def _filter_component_loaded(event_data: Mapping[str, Any]) -> bool:
+        """Return if a component with pending ectoplasm modules was loaded."""
+        return event_data["component"] in pending
+
+    async def _async_component_loaded(event: Event) -> None:
+        """Set up the pending modules of a newly loaded integration."""
+        if event.data["component"] in pending:
+            await _async_setup_domains([event.data["component"]])
+
+    return hass.bus.async_listen(
+        EVENT_COMPONENT_LOADED,
+        _async_component_loaded,
+        event_filter=_filter_component_loaded,
+    )
+
 
 async def async_forward_setup_entry(
     hass: HomeAssistant,
@@ -25,25 +220,21 @@ async def async_forward_setup_entry(
     """Set up Spook ectoplasms."""
     LOGGER.debug("Setting up Spook ectoplasms")
 
-    modules: list[ModuleType] = []
-
-    def _load_all_ectoplasm_modules() -> None:
-        """Load all Spook ectoplasm modules."""
-        for module_file in Path(__file__).parent.rglob("ectoplasms/*/__init__.py"):
-            module_path = str(module_file.relative_to(Path(__file__).parent))[
-                :-3
-            ].replace(
-                "/",
-                ".",
+    async def _async_setup(modules: list[ModuleType]) -> None:
+        """Set up ectoplasm modules."""
+        await asyncio.gather(
+            *(
+                module.async_setup_entry(hass, entry)
+                for module in modules
+                if hasattr(module, "async_setup_entry")
             )
-            LOGGER.debug("Loading Spook ectoplasm: %s", module_path)
-            module = importlib.import_module(f".{module_path}", __package__)
-            if hasattr(module, "async_setup_entry"):
-                modules.append(module)
-                LOGGER.debug("Setting up Spook ectoplasm: %s", module_path)
+        )
 
-    await hass.async_add_import_executor_job(_load_all_ectoplasm_modules)
-    await asyncio.gather(*(module.async_setup_entry(hass, entry) for module in modules))
+    entry.async_on_unload(
+        await async_setup_ectoplasm_modules(
+            hass, ECTOPLASM_SETUP, _async_setup, defer=True
+        )
+    )
 
 
 async def async_forward_platform_entry_setups_to_ectoplasm(
@@ -55,25 +246,15 @@ async def async_forward_platform_entry_setups_to_ectoplasm(
     """Set up Spook ectoplasm platform."""
     LOGGER.debug("Setting up Spook ectoplasm platform: %s", platform)
 
-    modules: list[ModuleType] = []
-
-    def _load_all_ectoplasm_platform_modules() -> None:
-        """Load all Spook ectoplasm platform modules."""
-        for module_file in Path(__file__).parent.rglob(f"ectoplasms/*/{platform}.py"):
-            module_path = str(module_file.relative_to(Path(__file__).parent))[
-                :-3
-            ].replace(
-                "/",
-                ".",
+    async def _async_setup(modules: list[ModuleType]) -> None:
+        """Set up ectoplasm platform modules."""
+        await asyncio.gather(
+            *(
+                module.async_setup_entry(hass, entry, async_add_entities)
+                for module in modules
             )
-            LOGGER.debug("Loading Spook %s from ectoplasm: %s", platform, module_path)
-            modules.append(importlib.import_module(f".{module_path}", __package__))
-            LOGGER.debug("Setting up Spook ectoplasm %s: %s", platform, module_path)
-
-    await hass.async_add_import_executor_job(_load_all_ectoplasm_platform_modules)
-    await asyncio.gather(
-        *(
-            module.async_setup_entry(hass, entry, async_add_entities)
-            for module in modules
         )
+
+    entry.async_on_unload(
+        await async_setup_ectoplasm_modules(hass, platform, _async_setup, defer=True)
     )
@@ -0,0 +1,421 @@
+"""Offline replay benchmark of the X-Sense MQTT message pipeline.
+
+Replays recorded MQTT traffic through the real message path:
+XSenseMQTT._async_mqtt_on_message -> XSenseDataUpdateCoordinator.async_event_received
+-> XSenseBase.parse_get_state -> coordinator listeners, one per sensor entity.
+
+Home Assistant is replaced by a minimal stub, cloud API calls are answered from the
+fixture and no MQTT connection is made, so the benchmark runs entirely offline.
+Run it from the Home Assistant configuration directory:
+
+    python -m custom_components.xsense.benchmark FIXTURE [--iterations N]
+
+custom_components/xsense/benchmark_fixture.json is a small example fixture.
+
+The fixture is a JSON file holding the API responses used to build the account and
+the recorded MQTT messages:
+
+    {
+        "houses": [{"houseId": ..., "houseName": ..., "houseRegion": ...,
+                    "mqttRegion": ..., "mqttServer": ...}],
+        "rooms": {"<houseId>": {"houseRooms": {...}, "roomSort": [...]}},
+        "stations": {"<houseId>": {"stations": [...], "stationSort": [...]}},
+        "api": {"<biz code>": ...},
+        "messages": [{"topic": "$aws/things/.../update", "payload": {...}}]
+    }
+
+A payload is either the decoded JSON document or the raw payload as a string. The
+optional "api" responses answer other biz codes; read-only biz codes missing from
+the fixture get an empty answer. API calls go through AsyncXSense.api_call, with its
+response cache, as they do in Home Assistant.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import json
+import logging
+from pathlib import Path
+import statistics
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+import paho.mqtt.client as mqtt
+
+from homeassistant import config_entries
+from homeassistant.helpers import frame
+
+from .coordinator import XSenseDataUpdateCoordinator
+from .entity import coordinator_devices, coordinator_stations
+from .mqtt import XSenseMQTT
+from .python_xsense import AsyncXSense
+from .python_xsense.async_xsense import READ_ONLY_API_CODES
+from .sensor import SENSORS
+
+STAGES = ("total", "route", "parse", "listeners")
+PERCENTILES = (50, 90, 99)
+DEFAULT_ITERATIONS = 100
+DEFAULT_TOP_ALLOCATIONS = 10
+
+
+class _StubBus:
+    """Event bus recording the events fired by the pipeline."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, dict[str, Any]]] = []
+
+    def async_fire(
+        self, event_type: str, event_data: dict | None = None, *_args, **_kwargs
+    ) -> None:
+        self.events.append((event_type, event_data or {}))
+
+    async_fire_internal = async_fire
+
+    def async_listen_once(self, *_args, **_kwargs) -> Callable[[], None]:
+        return lambda: None
+
+
+class _StubHass:
+    """Just enough of Home Assistant for the coordinator and MQTT client."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.bus = _StubBus()
+        self.data: dict[str, Any] = {}
+        self.config = SimpleNamespace(config_dir=str(Path.cwd()))
+        self.is_running = True
+
+    def async_create_task(self, target, name: str | None = None, *_args, **_kwargs):
+        return self.loop.create_task(target, name=name)
+
+    async_create_background_task = async_create_task
+
+
+class _StubConfigEntry:
+    """Config entry of the benchmarked account."""
+
+    entry_id = "benchmark"
+    domain = "xsense"
+    title = "X-Sense benchmark"
+    data = {"email": "benchmark@example.com", "password": ""}
+    options: dict[str, Any] = {}
+    pref_disable_polling = True
+
+    def async_on_unload(self, _func) -> None:
+        """Ignore unload callbacks, nothing is unloaded."""
+
+    def async_create_task(
+        self, hass: _StubHass, target, name: str | None = None, *_args, **_kwargs
+    ):
+        return hass.async_create_task(target, name)
+
+
+@dataclass
+class _StageTimer:
+    """Per-message stage timings, in seconds."""
+
+    parse: float = 0.0
+    listeners: float = 0.0
+    samples: dict[str, list[float]] = field(
+        default_factory=lambda: {stage: [] for stage in STAGES}
+    )
+
+    def wrap(self, stage: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Return func, adding its run time to a stage of the current message."""
+
+        def _timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                setattr(self, stage, getattr(self, stage) + time.perf_counter() - start)
+
+        return _timed
+
+    def record(self, total: float) -> None:
+        """Store the timings of the current message and start the next one."""
+        self.samples["total"].append(total)
+        self.samples["parse"].append(self.parse)
+        self.samples["listeners"].append(self.listeners)
+        self.samples["route"].append(max(total - self.parse - self.listeners, 0.0))
+        self.parse = self.listeners = 0.0
+
+
+def _load_fixture(path: Path) -> dict[str, Any]:
+    """Return the fixture and the MQTT messages in it, encoded as received."""
+    fixture = json.loads(path.read_text(encoding="utf-8"))
+    messages = []
+    for item in fixture.get("messages") or []:
+        payload = item["payload"]
+        if not isinstance(payload, str):
+            payload = json.dumps(payload)
+        message = mqtt.MQTTMessage(topic=item["topic"].encode())
+        message.payload = payload.encode()
+        messages.append(message)
+    if not messages:
+        raise SystemExit(f"{path} has no messages to replay")
+    fixture["messages"] = messages
+    return fixture
+
+
+def _fixture_api(fixture: dict[str, Any]) -> Callable[..., Any]:
+    """Return an AsyncXSense._api_request answering from the fixture.
+
+    Houses, rooms and stations are answered per house, other biz codes from the
+    "api" responses of the fixture. Read-only biz codes missing from the fixture
+    get an empty answer, anything else ends the benchmark.
+    """
+    responses = {
+        code: lambda _params, response=response: response
+        for code, response in (fixture.get("api") or {}).items()
+    }
+    responses |= {
+        "102007": lambda _params: fixture.get("houses") or [],
+        "102008": lambda params: (fixture.get("rooms") or {}).get(params["houseId"]),
+        "103007": lambda params: (fixture.get("stations") or {}).get(params["houseId"]),
+    }
+
+    async def _api_request(code, unauth=False, **kwargs):
+        if code in responses:
+            return responses[code](kwargs)
+        if code in READ_ONLY_API_CODES:
+            return None
+        raise SystemExit(f"API call {code} is not available offline")
+
+    return _api_request
+
+
+def _sensor_listeners(
+    coordinator: XSenseDataUpdateCoordinator,
+) -> list[Callable[[], None]]:
+    """Return listeners reading the value of each sensor entity, like entities do."""
+
+    def _listener(entity, description) -> Callable[[], None]:
+        def _update() -> None:
+            try:
+                description.value_fn(entity)
+            except (KeyError, TypeError, ValueError):
+                pass
+
+        return _update
+
+    entities = [
+        *coordinator_stations(coordinator).values(),
+        *coordinator_devices(coordinator).values(),
+    ]
+    return [
+        _listener(entity, description)
+        for entity in entities
+        for description in SENSORS
+        if description.exists_fn(entity)
+    ]
+
+
+async def _async_setup(
+    hass: _StubHass, fixture: dict[str, Any]
+) -> tuple[XSenseDataUpdateCoordinator, XSenseMQTT, int]:
+    """Set up the coordinator, MQTT client and sensor listeners of the fixture."""
+    entry = _StubConfigEntry()
+    frame.async_setup(hass)
+    config_entries.current_entry.set(entry)
+    coordinator = XSenseDataUpdateCoordinator(hass, entry)
+    coordinator.update_interval = None
+
+    xsense = AsyncXSense()
+    xsense._api_request = _fixture_api(fixture)  # noqa: SLF001
+    await xsense.load_all()
+    coordinator.xsense = xsense
+    coordinator.data = {"stations": {}, "devices": {}}
+    for house in xsense.houses.values():
+        coordinator.data["stations"].update(house.stations)
+        for station in house.stations.values():
+            coordinator.data["devices"].update(station.devices)
+
+    listeners = _sensor_listeners(coordinator)
+    for listener in listeners:
+        coordinator.async_add_listener(listener)
+
+    house = next(iter(xsense.houses.values()), None)
+    if house is None:
+        raise SystemExit("The fixture has no houses")
+    mqtt_client = XSenseMQTT(hass, entry, house.mqtt)
+    mqtt_client.on_data = coordinator.async_event_received
+    return coordinator, mqtt_client, len(listeners)
+
+
+def _replay(
+    mqtt_client: XSenseMQTT, messages: list[mqtt.MQTTMessage], iterations: int
+) -> float:
+    """Replay the messages, return the elapsed time."""
+    on_message = mqtt_client._async_mqtt_on_message
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for message in messages:
+            on_message(None, None, message)
+    return time.perf_counter() - start
+
+
+def _replay_timed(
+    coordinator: XSenseDataUpdateCoordinator,
+    mqtt_client: XSenseMQTT,
+    messages: list[mqtt.MQTTMessage],
+    iterations: int,
+) -> dict[str, list[float]]:
+    """Replay the messages, return the timings per stage."""
+    timer = _StageTimer()
+    parse_get_state = coordinator.xsense.parse_get_state
+    update_listeners = coordinator.async_update_listeners
+    coordinator.xsense.parse_get_state = timer.wrap("parse", parse_get_state)
+    coordinator.async_update_listeners = timer.wrap("listeners", update_listeners)
+    on_message = mqtt_client._async_mqtt_on_message
+    try:
+        for _ in range(iterations):
+            for message in messages:
+                start = time.perf_counter()
+                on_message(None, None, message)
+                timer.record(time.perf_counter() - start)
+    finally:
+        coordinator.xsense.parse_get_state = parse_get_state
+        coordinator.async_update_listeners = update_listeners
+    return timer.samples
+
+
+def _replay_traced(
+    mqtt_client: XSenseMQTT, messages: list[mqtt.MQTTMessage], top: int
+) -> dict[str, Any]:
+    """Replay the messages once with tracemalloc, return the allocations."""
+    on_message = mqtt_client._async_mqtt_on_message
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        for message in messages:
+            on_message(None, None, message)
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    package = str(Path(__file__).parent)
+
+    def _location(stat: tracemalloc.StatisticDiff) -> str:
+        origin = stat.traceback[0]
+        return f"{Path(origin.filename).relative_to(package)}:{origin.lineno}"
+
+    stats = [
+        stat
+        for stat in after.compare_to(before, "lineno")
+        if stat.traceback[0].filename.startswith(package)
+    ]
+    return {
+        "peak_bytes": peak,
+        "retained_bytes": sum(stat.size_diff for stat in stats),
+        "retained_blocks": sum(stat.count_diff for stat in stats),
+        "top": [
+            (_location(stat), stat.size_diff, stat.count_diff)
+            for stat in sorted(
+                stats, key=lambda stat: abs(stat.size_diff), reverse=True
+            )[:top]
+        ],
+    }
+
+
+def _percentile(samples: list[float], percentile: int) -> float:
+    """Return a percentile of the samples, by nearest rank."""
+    ordered = sorted(samples)
+    rank = round(percentile / 100 * len(ordered)) - 1
+    return ordered[min(len(ordered) - 1, max(0, rank))]
+
+
+def _report(
+    fixture: Path,
+    messages: int,
+    listeners: int,
+    iterations: int,
+    elapsed: float,
+    samples: dict[str, list[float]],
+    allocations: dict[str, Any],
+) -> None:
+    """Print the benchmark results."""
+    replayed = messages * iterations
+    print(f"Fixture:     {fixture} ({messages} messages, {listeners} sensor listeners)")
+    print(f"Replayed:    {replayed} messages in {elapsed:.3f} s")
+    print(f"Throughput:  {replayed / elapsed:,.0f} messages/s")
+    print()
+    columns = [f"p{percentile} (us)" for percentile in PERCENTILES]
+    columns += ["mean (us)", "max (us)"]
+    print(f"{'stage':<10}" + "".join(f"{column:>12}" for column in columns))
+    for stage in STAGES:
+        values = samples[stage]
+        print(
+            f"{stage:<10}"
+            + "".join(f"{_percentile(values, p) * 1e6:>12.1f}" for p in PERCENTILES)
+            + f"{statistics.fmean(values) * 1e6:>12.1f}{max(values) * 1e6:>12.1f}"
+        )
+    print()
+    print("Allocations over one replay of the fixture (tracemalloc):")
+    print(f"  peak:     {allocations['peak_bytes']:,} bytes")
+    print(
+        f"  retained: {allocations['retained_bytes']:,} bytes"
+        f" in {allocations['retained_blocks']:,} blocks"
+    )
+    for location, size, count in allocations["top"]:
+        print(f"  {size:>+10,} bytes {count:>+7,} blocks  {location}")
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    fixture = _load_fixture(args.fixture)
+    messages = fixture["messages"]
+    hass = _StubHass(asyncio.get_running_loop())
+    coordinator, mqtt_client, listeners = await _async_setup(hass, fixture)
+
+    # Warm up caches (topic matching, compiled mappers, ...) before measuring
+    _replay(mqtt_client, messages, 1)
+    elapsed = _replay(mqtt_client, messages, args.iterations)
+    samples = _replay_timed(coordinator, mqtt_client, messages, args.iterations)
+    allocations = _replay_traced(mqtt_client, messages, args.top)
+
+    _report(
+        args.fixture,
+        len(messages),
+        listeners,
+        args.iterations,
+        elapsed,
+        samples,
+        allocations,
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "fixture", type=Path, help="JSON fixture of recorded MQTT traffic"
+    )
+    parser.add_argument(
+        "--iterations",
+        type=int,
+        default=DEFAULT_ITERATIONS,
+        help="number of times the fixture messages are replayed",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP_ALLOCATIONS,
+        help="number of allocation sites to report",
+    )
+    parser.add_argument(
+        "--debug", action="store_true", help="enable debug logging of the pipeline"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.debug else logging.WARNING)
+    asyncio.run(_async_main(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+"""Benchmark of the X-Sense state ingest with the station and child device indexes.
+
+Builds a house of stations with 100+ child devices and light groups each through
+House.set_stations, like load_all does, and feeds synthetic shadow payloads through
+XSenseBase.parse_get_state, the way MQTT messages and state polls are ingested:
+
+- station devs: a station shadow with the state of every child in "devs".
+- apk records: a station shadow with child states keyed by serial at the top level,
+  merged by _merge_top_level_child_state.
+- light group: a light group state, resolved with Station.get_group_device.
+- house state: the shadow of the house, resolved with House.get_station_by_sn.
+
+Each payload is ingested with the indexes and with the former lookups: scans over
+all stations and child devices, and _state_child_device resolving its getter for
+every identifier. Checks that both leave every device with the same data. The
+station and light group lookups are also timed on their own.
+
+Run it from the Home Assistant configuration directory:
+
+    python -m custom_components.xsense.benchmark_lookup [--stations N] [--devices N]
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Iterator
+import contextlib
+import time
+import timeit
+from typing import Any
+
+from .python_xsense import AsyncXSense, base
+from .python_xsense.aws_signer import AWSSigner
+from .python_xsense.house import House
+from .python_xsense.station import Station, _java_string
+
+DEFAULT_STATIONS = 4
+DEFAULT_DEVICES = 128
+GROUPS_PER_STATION = 4
+REPEAT = 15
+
+
+def legacy_get_station_by_sn(house: House, sn: str):
+    """Former station lookup, scanning the stations of the house."""
+    return next((i for _, i in house.stations.items() if i.sn == sn), None)
+
+
+def legacy_get_group_device(station: Station, group_id):
+    """Former light group lookup, scanning the child devices of the station."""
+    group_id = _java_string(group_id)
+    for dev in station.devices.values():
+        if dev.type == "group-L" and _java_string(dev.data.get("groupId")) == group_id:
+            return dev
+    return None
+
+
+def legacy_state_child_device(station: Station, child_key, child_state):
+    """Former child resolution, looking up the getter for every identifier."""
+    for value in base._child_state_identifiers(child_key, child_state):  # noqa: SLF001
+        getter = getattr(station, "get_device_by_identifier", None)
+        if getter is not None:
+            if dev := getter(value):
+                return dev
+        if dev := station.get_device_by_sn(value):
+            return dev
+    return None
+
+
+@contextlib.contextmanager
+def legacy_lookups() -> Iterator[None]:
+    """Ingest with the former lookups."""
+    patches = [
+        (House, "get_station_by_sn", legacy_get_station_by_sn),
+        (Station, "get_group_device", legacy_get_group_device),
+        (base, "_state_child_device", legacy_state_child_device),
+    ]
+    originals = [(owner, name, getattr(owner, name)) for owner, name, _ in patches]
+    for owner, name, value in patches:
+        setattr(owner, name, value)
+    try:
+        yield
+    finally:
+        for owner, name, value in originals:
+            setattr(owner, name, value)
+
+
+def synthetic_house(stations: int, devices: int) -> House:
+    """Return a house of stations with child devices and light groups."""
+    house = House(
+        AWSSigner("benchmark", "", ""),
+        "0123456789ABCDEF0123456789ABCDEF",
+        "Benchmark",
+        "us-east-1",
+        "us-east-1",
+        "benchmark.iot.us-east-1.amazonaws.com",
+    )
+    station_data = []
+    for idx in range(stations):
+        station_data.append(
+            {
+                "stationId": f"STATION{idx}",
+                "stationName": f"Base station {idx}",
+                "stationSn": f"{14998680 + idx}",
+                "category": "SBS50",
+                "devices": [
+                    {
+                        "deviceId": f"DEVICE{idx}-{dev}",
+                        "deviceName": f"Device {dev}",
+                        "deviceSn": f"{idx:04d}{dev:04d}",
+                        "deviceType": "XS01-M",
+                        "mac": f"a4:c1:38:{idx:02x}:{dev >> 8:02x}:{dev & 255:02x}",
+                    }
+                    for dev in range(devices)
+                ],
+                "groupList": [
+                    {"groupId": idx * 100 + group, "groupName": f"Group {group}"}
+                    for group in range(GROUPS_PER_STATION)
+                ],
+            }
+        )
+    house.set_stations({"stations": station_data})
+    return house
+
+
+def _child_state(dev: int) -> dict[str, Any]:
+    return {
+        "type": "XS01-M",
+        "batInfo": str(dev % 4),
+        "rfLevel": str(dev % 3),
+        "online": "1",
+        "alarmStatus": "0",
+        "muteStatus": "0",
+    }
+
+
+def synthetic_payloads(
+    house: House, devices: int
+) -> dict[str, list[tuple[Callable[[AsyncXSense, House], None], int]]]:
+    """Return the payloads of each kind, as ingest calls and their child states."""
+
+    def _station(station_idx: int, state: dict[str, Any]):
+        station_id = f"STATION{station_idx}"
+        return lambda xsense, house: xsense.parse_get_state(
+            house.stations[station_id], state
+        )
+
+    def _house(state: dict[str, Any]):
+        return lambda xsense, house: xsense._parse_get_house_state(  # noqa: SLF001
+            house, state
+        )
+
+    stations = range(len(house.stations))
+    devs = {
+        idx: {f"{idx:04d}{dev:04d}": _child_state(dev) for dev in range(devices)}
+        for idx in stations
+    }
+    return {
+        "station devs": [
+            (_station(idx, {"wifiRssi": "-55", "devs": devs[idx]}), devices)
+            for idx in stations
+        ],
+        "apk records": [
+            (_station(idx, {"wifiRssi": "-55", **devs[idx]}), devices)
+            for idx in stations
+        ],
+        "light group": [
+            (_station(idx, {"groupId": idx * 100 + group, "isOn": "1"}), 1)
+            for idx in stations
+            for group in range(GROUPS_PER_STATION)
+        ],
+        "house state": [
+            (
+                _house(
+                    {
+                        house.stations[f"STATION{idx}"].sn: {"devs": devs[idx]}
+                        for idx in stations
+                    }
+                ),
+                devices * len(house.stations),
+            )
+        ],
+    }
+
+
+def _device_data(house: House) -> dict[str, Any]:
+    """Return the data and online state of every station and child device."""
+    return {
+        dev.entity_id: (dev.data, dev.online)
+        for station in house.stations.values()
+        for dev in (station, *station.devices.values())
+    }
+
+
+def _identical(stations: int, devices: int) -> bool:
+    """Return if both lookups leave the devices with the same data after ingest."""
+    results = []
+    for legacy in (True, False):
+        house = synthetic_house(stations, devices)
+        payloads = synthetic_payloads(house, devices)
+        with legacy_lookups() if legacy else contextlib.nullcontext():
+            for ingests in payloads.values():
+                for ingest, _ in ingests:
+                    ingest(AsyncXSense(), house)
+        results.append(_device_data(house))
+    return results[0] == results[1]
+
+
+def _time_per_call(funcs: list[Callable[[], Any]], calls: int) -> list[float]:
+    """Return the time of one call of each function, in microseconds.
+
+    Runs of the functions are interleaved, so they are measured under the same load.
+    """
+    timers = [timeit.Timer(func) for func in funcs]
+    numbers = [timer.autorange()[0] for timer in timers]
+    best = [float("inf")] * len(timers)
+    for _ in range(REPEAT):
+        for idx, timer in enumerate(timers):
+            best[idx] = min(best[idx], timer.timeit(numbers[idx]) / numbers[idx])
+    return [elapsed / calls * 1e6 for elapsed in best]
+
+
+def _ingest(xsense: AsyncXSense, house: House, ingests: list, legacy: bool):
+    """Return a function ingesting the payloads with the former or indexed lookups."""
+
+    def _run() -> None:
+        for ingest, _ in ingests:
+            ingest(xsense, house)
+
+    def _run_legacy() -> None:
+        with legacy_lookups():
+            _run()
+
+    return _run_legacy if legacy else _run
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--stations", type=int, default=DEFAULT_STATIONS, help="stations in the house"
+    )
+    parser.add_argument(
+        "--devices",
+        type=int,
+        default=DEFAULT_DEVICES,
+        help="child devices per station, next to its light groups",
+    )
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    house = synthetic_house(args.stations, args.devices)
+    build_time = time.perf_counter() - start
+    payloads = synthetic_payloads(house, args.devices)
+    identical = _identical(args.stations, args.devices)
+    xsense = AsyncXSense()
+
+    children = args.devices + GROUPS_PER_STATION
+    print(
+        f"House of {args.stations} stations with {children} child devices each,"
+        f" built in {build_time * 1000:.1f} ms"
+    )
+    print(
+        f"{'ingest':<15}{'children':>9}{'identical':>11}{'former (us)':>13}"
+        f"{'indexed (us)':>14}{'speedup':>9}"
+    )
+    for name, ingests in payloads.items():
+        legacy_time, indexed_time = _time_per_call(
+            [
+                _ingest(xsense, house, ingests, legacy=True),
+                _ingest(xsense, house, ingests, legacy=False),
+            ],
+            len(ingests),
+        )
+        per_payload = sum(count for _, count in ingests) / len(ingests)
+        print(
+            f"{name:<15}{per_payload:>9.0f}{'yes' if identical else 'NO':>11}"
+            f"{legacy_time:>13.1f}{indexed_time:>14.1f}"
+            f"{legacy_time / indexed_time:>8.2f}x"
+        )
+
+    serials = [station.sn for station in house.stations.values()]
+    groups = [
+        (station, dev.data["groupId"])
+        for station in house.stations.values()
+        for dev in station.devices.values()
+        if dev.type == "group-L"
+    ]
+    lookups = {
+        "station by sn": (
+            lambda: [legacy_get_station_by_sn(house, sn) for sn in serials],
+            lambda: [house.get_station_by_sn(sn) for sn in serials],
+            len(serials),
+        ),
+        "group device": (
+            lambda: [
+                legacy_get_group_device(station, group_id)
+                for station, group_id in groups
+            ],
+            lambda: [
+                station.get_group_device(group_id) for station, group_id in groups
+            ],
+            len(groups),
+        ),
+    }
+    print()
+    print(f"{'lookup':<15}{'former (us)':>13}{'indexed (us)':>14}{'speedup':>9}")
+    for name, (legacy, indexed, calls) in lookups.items():
+        legacy_time, indexed_time = _time_per_call([legacy, indexed], calls)
+        print(
+            f"{name:<15}{legacy_time:>13.3f}{indexed_time:>14.3f}"
+            f"{legacy_time / indexed_time:>8.1f}x"
+        )
+    if not identical:
+        raise SystemExit("Indexed lookups left devices with different data")
+
+
+if __name__ == "__main__":
+    main()
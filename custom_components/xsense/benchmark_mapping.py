@@ -0,0 +1,225 @@
+"""Benchmark of the X-Sense property mappers in shadow state ingestion.
+
+Replays device payloads through Entity.set_data of Device and Station entities, the
+way shadow states are ingested, with the compiled mapper tables of compile_mapper
+and with the former mapper patched in, which merged the property mappings of the
+device type and looked up the converter of every key on each call. set_data also
+handles the online flags, nested status records and copies the data into the
+entity. Checks that both leave the entities with identical data and reports the
+speedup, and that of map_values alone. The one-off cost of compiling the table of
+a device type is reported as well.
+
+Run it from the Home Assistant configuration directory:
+
+    python -m custom_components.xsense.benchmark_mapping [--fixture FILE]
+
+Without a fixture, a payload is built for every device type with property mappings,
+plus a smoke detector and a base station. A fixture is the JSON fixture of the MQTT
+benchmark, the device states in its messages are mapped.
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Iterator
+import contextlib
+import json
+from pathlib import Path
+import timeit
+from typing import Any
+
+from .python_xsense import entity, mapping
+from .python_xsense.device import Device
+from .python_xsense.entity import Entity
+from .python_xsense.mapping import compile_mapper, map_values, property_mapper
+from .python_xsense.station import Station
+
+# Values of every kind the converters see in MQTT and API payloads
+SAMPLE_VALUES = ("1", "0", "21.4", "-55", "on", "", None, "10,35")
+UNMAPPED_TYPES = ("XS01-M", "SBS50")
+UNMAPPED_KEYS = ("online", "deviceSN", "sw", "swMain", "lastUpdate")
+# Device types of the payloads ingested by a Station, None for station shadows
+STATION_TYPES = (None, "SBS50")
+REPEAT = 15
+
+
+def legacy_map_values(device_type: str | None, data: dict[str, Any]) -> dict[str, Any]:
+    """Former mapper, merging the property mappings on every call."""
+    mapper = property_mapper.get("*", {}) | property_mapper.get(device_type, {})
+    return {
+        mapper.get(k, k): mapping.map_type(mapper.get(k, k), v) for k, v in data.items()
+    }
+
+
+@contextlib.contextmanager
+def legacy_mapper() -> Iterator[None]:
+    """Ingest with the former mapper."""
+    entity.map_values = legacy_map_values
+    try:
+        yield
+    finally:
+        entity.map_values = map_values
+
+
+def _entities(payloads: list[tuple[str | None, dict[str, Any]]]) -> list[Entity]:
+    """Return a Device or Station entity for each payload."""
+    result = []
+    for idx, (device_type, _) in enumerate(payloads):
+        if device_type in STATION_TYPES:
+            result.append(
+                Station(None, stationId=f"STATION{idx}", category=device_type)
+            )
+        else:
+            result.append(
+                Device(None, deviceId=f"DEVICE{idx}", deviceType=device_type)
+            )
+    return result
+
+
+def _ingest(
+    entities: list[Entity], payloads: list[tuple[str | None, dict[str, Any]]]
+) -> None:
+    """Ingest each payload into its entity."""
+    for ent, (_, data) in zip(entities, payloads):
+        ent.set_data(data)
+
+
+def _ingested_data(payloads: list[tuple[str | None, dict[str, Any]]], legacy: bool):
+    """Return the data and online state of entities after ingesting the payloads."""
+    entities = _entities(payloads)
+    with legacy_mapper() if legacy else contextlib.nullcontext():
+        _ingest(entities, payloads)
+    return [(ent.data, ent.online) for ent in entities]
+
+
+def sample_payloads() -> list[tuple[str | None, dict[str, Any]]]:
+    """Return a payload per device type, using all of its mapped keys."""
+    payloads = []
+    converted = list(mapping.type_mapping)
+    mapped_types = [key for key in property_mapper if key != "*"]
+    for device_type in (*mapped_types, *UNMAPPED_TYPES):
+        keys = [
+            *property_mapper["*"],
+            *property_mapper.get(device_type, {}),
+            *converted[::7],
+            *UNMAPPED_KEYS,
+        ]
+        payloads.append(
+            (
+                device_type,
+                {
+                    key: SAMPLE_VALUES[idx % len(SAMPLE_VALUES)]
+                    for idx, key in enumerate(keys)
+                },
+            )
+        )
+    return payloads
+
+
+def fixture_payloads(path: Path) -> list[tuple[str | None, dict[str, Any]]]:
+    """Return the device states of the messages of a MQTT benchmark fixture."""
+    fixture = json.loads(path.read_text(encoding="utf-8"))
+    payloads = []
+    for message in fixture.get("messages") or []:
+        payload = message["payload"]
+        if isinstance(payload, str):
+            payload = json.loads(payload)
+        reported = (payload.get("state") or {}).get("reported") or {}
+        if not reported:
+            continue
+        devices = reported.get("devs") or {}
+        payloads.extend(
+            (state.get("type"), state)
+            for state in devices.values()
+            if isinstance(state, dict)
+        )
+        payloads.append(
+            (None, {key: value for key, value in reported.items() if key != "devs"})
+        )
+    if not payloads:
+        raise SystemExit(f"{path} has no device states to map")
+    return payloads
+
+
+def _time_per_payload(funcs: list[Callable[[], None]], payloads: int) -> list[float]:
+    """Return the time of each function to handle one payload, in microseconds.
+
+    Runs of the functions are interleaved, so they are measured under the same load.
+    """
+    timers = [timeit.Timer(func) for func in funcs]
+    number = max(timer.autorange()[0] for timer in timers)
+    best = [float("inf")] * len(timers)
+    for _ in range(REPEAT):
+        for idx, timer in enumerate(timers):
+            best[idx] = min(best[idx], timer.timeit(number))
+    return [elapsed / number / payloads * 1e6 for elapsed in best]
+
+
+def _compile_time(device_types: set[str | None]) -> float:
+    """Return the time to compile the table of one device type, in microseconds."""
+
+    def _run() -> None:
+        mapping._compiled_mappers.clear()  # noqa: SLF001
+        for device_type in device_types:
+            compile_mapper(device_type)
+
+    number, elapsed = timeit.Timer(_run).autorange()
+    best = min([elapsed, *timeit.Timer(_run).repeat(repeat=REPEAT, number=number)])
+    return best / number / len(device_types) * 1e6
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--fixture", type=Path, help="JSON fixture of the MQTT benchmark"
+    )
+    args = parser.parse_args()
+
+    payloads = fixture_payloads(args.fixture) if args.fixture else sample_payloads()
+    device_types = {device_type for device_type, _ in payloads}
+
+    identical = _ingested_data(payloads, legacy=True) == _ingested_data(
+        payloads, legacy=False
+    ) and all(
+        map_values(device_type, data) == legacy_map_values(device_type, data)
+        for device_type, data in payloads
+    )
+    keys = sum(len(data) for _, data in payloads) / len(payloads)
+    entities = _entities(payloads)
+
+    def _legacy_ingest() -> None:
+        with legacy_mapper():
+            _ingest(entities, payloads)
+
+    timings = {
+        "set_data": _time_per_payload(
+            [_legacy_ingest, lambda: _ingest(entities, payloads)], len(payloads)
+        ),
+        "map_values": _time_per_payload(
+            [
+                lambda: [legacy_map_values(t, data) for t, data in payloads],
+                lambda: [map_values(t, data) for t, data in payloads],
+            ],
+            len(payloads),
+        ),
+    }
+    compile_time = _compile_time(device_types)
+
+    print(
+        f"{len(payloads)} payloads of {len(device_types)} device types,"
+        f" {keys:.1f} keys each, identical data: {'yes' if identical else 'NO'}"
+    )
+    print(f"{'path':<12}{'former (us)':>13}{'compiled (us)':>15}{'speedup':>9}")
+    for name, (legacy_time, compiled_time) in timings.items():
+        print(
+            f"{name:<12}{legacy_time:>13.2f}{compiled_time:>15.2f}"
+            f"{legacy_time / compiled_time:>8.2f}x"
+        )
+    print(f"Compiling the table of a device type: {compile_time:.2f} us")
+    if not identical:
+        raise SystemExit("Compiled mappers ingested different data")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+"""Offline check of the X-Sense MQTT publish window.
+
+Publishes messages through XSenseMQTT to a fake paho client, which ACKs every
+publish after a random delay, so ACKs arrive out of order like they do from the
+broker. Messages are published one at a time with async_publish, and pipelined
+with async_publish_many for several publish windows.
+
+For each run the number of publishes in flight at the fake client is tracked. The
+check fails when it ever exceeds the publish window, or when a publish is not ACKed.
+Run it from the Home Assistant configuration directory:
+
+    python -m custom_components.xsense.benchmark_publish [--messages N] [--ack-ms MS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from types import SimpleNamespace
+from typing import Any
+
+from .benchmark import _StubConfigEntry, _StubHass
+from .mqtt import PUBLISH_WINDOW, XSenseMQTT
+
+DEFAULT_MESSAGES = 200
+DEFAULT_ACK_MS = 20.0
+WINDOWS = (1, 4, PUBLISH_WINDOW, 64)
+
+
+class _FakePahoClient:
+    """Paho client ACKing every publish after a random delay."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, ack_delay: float) -> None:
+        self.loop = loop
+        self.ack_delay = ack_delay
+        self.random = random.Random(0)
+        self.mqtt: XSenseMQTT | None = None
+        self.mid = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.acked = 0
+
+    def publish(self, topic: str, payload: Any, qos: int, retain: bool):
+        """Send a message, ACKed after 0.5 to 1.5 times the ACK delay."""
+        self.mid += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.loop.call_later(
+            self.ack_delay * self.random.uniform(0.5, 1.5), self._ack, self.mid
+        )
+        return SimpleNamespace(mid=self.mid, rc=0)
+
+    def _ack(self, mid: int) -> None:
+        """Deliver the PUBACK of a mid, like the paho network loop does."""
+        self.in_flight -= 1
+        self.acked += 1
+        self.mqtt._async_mqtt_on_callback(self, None, mid)  # noqa: SLF001
+
+
+class _StubBackgroundConfigEntry(_StubConfigEntry):
+    """Config entry running background tasks, used for the publish ACKs."""
+
+    def async_create_background_task(
+        self, hass: _StubHass, target, name: str | None = None, *_args, **_kwargs
+    ):
+        return hass.async_create_task(target, name)
+
+
+async def _async_run(
+    messages: int, ack_delay: float, window: int, pipelined: bool
+) -> dict[str, Any]:
+    """Publish the messages through a fresh client, return the measurements."""
+    hass = _StubHass(asyncio.get_running_loop())
+    client = _FakePahoClient(hass.loop, ack_delay)
+    mqtt = XSenseMQTT(
+        hass,
+        _StubBackgroundConfigEntry(),
+        SimpleNamespace(client=client),
+        publish_window=window,
+    )
+    client.mqtt = mqtt
+    batch = [
+        (f"$aws/things/SBS50{idx:08d}/shadow/update", "{}", 0, False)
+        for idx in range(messages)
+    ]
+
+    start = time.perf_counter()
+    if pipelined:
+        await mqtt.async_publish_many(batch)
+    else:
+        for topic, payload, qos, retain in batch:
+            await mqtt.async_publish(topic, payload, qos, retain)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "mode": "many" if pipelined else "one by one",
+        "window": window,
+        "elapsed": elapsed,
+        "max_in_flight": client.max_in_flight,
+        "acked": client.acked,
+        "pending": len(mqtt._pending_operations),  # noqa: SLF001
+    }
+
+
+async def _async_main(args: argparse.Namespace) -> bool:
+    """Run all modes, print the results and return if the window held."""
+    ack_delay = args.ack_ms / 1000
+    runs = [await _async_run(args.messages, ack_delay, PUBLISH_WINDOW, False)]
+    runs.extend(
+        [
+            await _async_run(args.messages, ack_delay, window, True)
+            for window in WINDOWS
+        ]
+    )
+
+    print(
+        f"Published {args.messages} messages per run, ACKs after"
+        f" {args.ack_ms / 2:g}-{args.ack_ms * 1.5:g} ms"
+    )
+    print(
+        f"{'mode':<12}{'window':>7}{'elapsed (s)':>13}{'messages/s':>12}"
+        f"{'max in flight':>15}{'acked':>7}{'ok':>5}"
+    )
+    passed = True
+    for run in runs:
+        bound = 1 if run["mode"] == "one by one" else run["window"]
+        ok = (
+            run["max_in_flight"] <= bound
+            and run["acked"] == args.messages
+            and not run["pending"]
+        )
+        passed &= ok
+        print(
+            f"{run['mode']:<12}{run['window']:>7}{run['elapsed']:>13.3f}"
+            f"{args.messages / run['elapsed']:>12,.0f}{run['max_in_flight']:>15}"
+            f"{run['acked']:>7}{'yes' if ok else 'NO':>5}"
+        )
+    return passed
+
+
+def main() -> None:
+    """Run the check."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--messages",
+        type=int,
+        default=DEFAULT_MESSAGES,
+        help="number of messages published per run",
+    )
+    parser.add_argument(
+        "--ack-ms",
+        type=float,
+        default=DEFAULT_ACK_MS,
+        help="mean delay of the ACKs of the fake broker, in ms",
+    )
+    args = parser.parse_args()
+    if not asyncio.run(_async_main(args)):
+        raise SystemExit("More publishes were in flight than the publish window")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""Micro-benchmark of the X-Sense SigV4 signing caches.
+
+Signs thing shadow requests and presigns MQTT websocket URLs with AWSSigner, with
+and without the cached signing key of the day and region. Presigned URLs are also
+fetched through get_presigned_url, which reuses a URL until shortly before its
+maximum age, as the MQTT helper does on every (re)connect.
+
+Checks that the cached and the derived signing key give identical signatures and
+reports the time per call.
+Run it from the Home Assistant configuration directory:
+
+    python -m custom_components.xsense.benchmark_signer
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import json
+import timeit
+from urllib.parse import urlsplit
+
+from .python_xsense.aws_signer import AWSSigner
+
+REGION = "us-east-1"
+SHADOW_URL = (
+    "https://benchmark.iot.us-east-1.amazonaws.com"
+    "/things/SBS5014998680/shadow?name=2nd_cfg_00000002"
+)
+MQTT_URL = "wss://benchmark.iot.us-east-1.amazonaws.com/mqtt"
+SHADOW_BODY = json.dumps(
+    {"state": {"desired": {"shadow": "infoDev", "deviceSN": "00000002", "mute": "0"}}}
+)
+REPEAT = 15
+
+
+def _signer() -> AWSSigner:
+    """Return a signer with credentials shaped like those of Cognito."""
+    return AWSSigner("ASIA" + "A" * 16, "s" * 40, "t" * 900)
+
+
+def _uncached(signer: AWSSigner) -> AWSSigner:
+    """Make the signer derive the signing key on every signature, as before."""
+    signer.get_signing_key = signer._derive_signing_key  # noqa: SLF001
+    return signer
+
+
+def _identical() -> bool:
+    """Return if the cached and derived signing keys give identical signatures."""
+    url = urlsplit(SHADOW_URL)
+    headers = [("host", url.netloc), ("x-amz-date", "20240501T120000Z")]
+    args = ("20240501/us-east-1/iotdata/aws4_request", "POST", url, headers, "0" * 64)
+    cached, uncached = _signer(), _uncached(_signer())
+    return all(
+        cached.compute_signature(*args, date_stamp, "", REGION)
+        == uncached.compute_signature(*args, date_stamp, "", REGION)
+        for date_stamp in ("20240501", "20240501", "20240502")
+    )
+
+
+def _time_per_call(funcs: list[Callable[[], object]]) -> list[float]:
+    """Return the time of a call of each function, in microseconds.
+
+    Runs of the functions are interleaved, so they are measured under the same load.
+    """
+    timers = [timeit.Timer(func) for func in funcs]
+    numbers = [timer.autorange()[0] for timer in timers]
+    best = [float("inf")] * len(timers)
+    for _ in range(REPEAT):
+        for idx, timer in enumerate(timers):
+            best[idx] = min(best[idx], timer.timeit(numbers[idx]) / numbers[idx])
+    return [elapsed * 1e6 for elapsed in best]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.parse_args()
+
+    cached, uncached = _signer(), _uncached(_signer())
+    operations = {
+        "shadow request": lambda signer: lambda: signer.sign_headers(
+            "POST", SHADOW_URL, REGION, {}, SHADOW_BODY
+        ),
+        "presign url": lambda signer: lambda: signer.presign_url(MQTT_URL, REGION),
+    }
+
+    print(f"{'operation':<18}{'derived (us)':>14}{'cached (us)':>13}{'speedup':>9}")
+    for name, operation in operations.items():
+        derived_time, cached_time = _time_per_call(
+            [operation(uncached), operation(cached)]
+        )
+        print(
+            f"{name:<18}{derived_time:>14.2f}{cached_time:>13.2f}"
+            f"{derived_time / cached_time:>8.1f}x"
+        )
+    presign_time, reuse_time = _time_per_call(
+        [
+            lambda: cached.presign_url(MQTT_URL, REGION),
+            lambda: cached.get_presigned_url(MQTT_URL, REGION),
+        ]
+    )
+    print(
+        f"{'reused url':<18}{presign_time:>14.2f}{reuse_time:>13.2f}"
+        f"{presign_time / reuse_time:>8.1f}x"
+    )
+
+    if not _identical():
+        raise SystemExit("Cached signing keys gave different signatures")
+
+
+if __name__ == "__main__":
+    main()
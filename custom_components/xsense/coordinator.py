@@ -883,6 +883,7 @@ class XSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def request_device_updates(self, mqtt, house):
         """Ask MQTT server for updates for all realtime devices."""
+        messages = []
         for s in house.stations.values():
             updatable_devices = [
                 dev.sn
@@ -908,13 +909,18 @@ class XSenseDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                     }
                 }
             }
-            await mqtt.async_publish(
-                f"$aws/things/{s.shadow_name}/shadow/name/2nd_apptempdata/update",
-                json.dumps(msg, ensure_ascii=False, separators=(",", ":")),
-                0,
-                False,
+            messages.append(
+                (
+                    f"$aws/things/{s.shadow_name}/shadow/name/2nd_apptempdata/update",
+                    json.dumps(msg, ensure_ascii=False, separators=(",", ":")),
+                    0,
+                    False,
+                )
             )
 
+        # Publish to all stations at once, instead of one broker round trip each
+        await mqtt.async_publish_many(messages)
+
 
 def _apply_safe_mode(station, safe_mode: str) -> None:
     """Store safeMode consistently for HTTP polling and MQTT updates."""
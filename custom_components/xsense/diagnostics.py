@@ -321,6 +321,7 @@ def coordinator_diagnostics(
                     getattr(mqtt, "_simple_subscriptions", {})
                 )
                 + len(getattr(mqtt, "_wildcard_subscriptions", set())),
+                "subscription_matching": getattr(mqtt, "subscription_stats", {}),
             }
             for server, mqtt in sorted(coordinator.mqtt_servers.items())
         },
@@ -1,10 +1,16 @@
 """XsenseMQTT is a MQTT client for the XSense server."""
 
 import asyncio
-from collections import defaultdict
-from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
+from collections import OrderedDict, defaultdict
+from collections.abc import (
+    AsyncGenerator,
+    Callable,
+    Coroutine,
+    Iterable,
+    Iterator,
+)
 import contextlib
-from functools import lru_cache, partial
+from functools import partial
 from itertools import chain
 import inspect
 import logging
@@ -44,6 +50,12 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# Number of publishes awaiting their ACK before publishing waits for a slot
+PUBLISH_WINDOW = 16
+
+# Number of recent topic -> matching subscriptions results kept, 0 to disable
+MATCH_CACHE_SIZE = 256
+
 type SocketType = mqtt.WebsocketWrapper | Any
 type PublishPayloadType = str | bytes | int | float | None
 
@@ -62,6 +74,99 @@ def _subscription_accepts_id() -> bool:
         return False
 
 
+class _TopicNode:
+    """Node of a subscription topic trie, one per topic level."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TopicNode] = {}
+        self.subscriptions: set[Subscription] = set()
+
+
+class SubscriptionTrie:
+    """Trie of subscriptions keyed by topic level, aware of + and # wildcards."""
+
+    def __init__(self) -> None:
+        self._root = _TopicNode()
+        self._node_count = 1
+        self._subscription_count = 0
+
+    def __len__(self) -> int:
+        return self._subscription_count
+
+    def __iter__(self) -> Iterator[Subscription]:
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            yield from node.subscriptions
+            stack.extend(node.children.values())
+
+    @property
+    def node_count(self) -> int:
+        """Return the number of nodes in the trie."""
+        return self._node_count
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicNode()
+                self._node_count += 1
+            node = child
+        if subscription not in node.subscriptions:
+            node.subscriptions.add(subscription)
+            self._subscription_count += 1
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription, pruning nodes left empty.
+
+        Raises KeyError when the subscription is not in the trie.
+        """
+        path = [self._root]
+        levels = subscription.topic.split("/")
+        for level in levels:
+            path.append(path[-1].children[level])
+        path[-1].subscriptions.remove(subscription)
+        self._subscription_count -= 1
+        for depth in range(len(levels), 0, -1):
+            node = path[depth]
+            if node.subscriptions or node.children:
+                break
+            del path[depth - 1].children[levels[depth - 1]]
+            self._node_count -= 1
+
+    def has_filter(self, topic: str) -> bool:
+        """Return if there is a subscription to exactly this topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (node := node.children.get(level)) is None:
+                return False
+        return bool(node.subscriptions)
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching a topic."""
+        levels = topic.split("/")
+        # Wildcards at the first level don't match topics starting with $
+        skip_wildcards = topic.startswith("$")
+        matches: list[Subscription] = []
+        stack = [(self._root, 0)]
+        while stack:
+            node, depth = stack.pop()
+            wildcards = not (skip_wildcards and depth == 0)
+            if wildcards and (multi := node.children.get("#")) is not None:
+                matches.extend(multi.subscriptions)
+            if depth == len(levels):
+                matches.extend(node.subscriptions)
+                continue
+            if (child := node.children.get(levels[depth])) is not None:
+                stack.append((child, depth + 1))
+            if wildcards and (single := node.children.get("+")) is not None:
+                stack.append((single, depth + 1))
+        return matches
+
+
 class XSenseMQTT:
     """XSenseMQTT is a MQTT client for xsense, copied from the Home Assistant MQTT client."""
 
@@ -70,6 +175,7 @@ class XSenseMQTT:
         hass: HomeAssistant,
         config_entry: ConfigEntry[Any],
         mqtt_helper: MQTTHelper,
+        publish_window: int = PUBLISH_WINDOW,
     ) -> None:
         """Initialize XSense MQTT client."""
         self.hass = hass
@@ -81,7 +187,10 @@ class XSenseMQTT:
         self._simple_subscriptions: defaultdict[str, set[Subscription]] = defaultdict(
             set
         )
-        self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscriptions = SubscriptionTrie()
+        self._match_cache: OrderedDict[str, list[Subscription]] = OrderedDict()
+        self._match_cache_hits = 0
+        self._match_cache_misses = 0
         self._retained_topics: defaultdict[Subscription, set[str]] = defaultdict(set)
 
         self._subscribe_debouncer = EnsureJobAfterCooldown(
@@ -101,6 +210,7 @@ class XSenseMQTT:
         self.connected = False
         self._connection_lock = asyncio.Lock()
         self._pending_operations: dict[int, asyncio.Future[None]] = {}
+        self._publish_window = asyncio.Semaphore(max(1, publish_window))
 
         self._misc_timer: asyncio.TimerHandle | None = None
         self._reconnect_task: asyncio.Task | None = None
@@ -268,16 +378,32 @@ class XSenseMQTT:
     # unchanged
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions
+            or self._wildcard_subscriptions.has_filter(topic)
         )
 
-    # unchanged
     async def async_publish(
         self, topic: str, payload: PublishPayloadType, qos: int, retain: bool
     ) -> None:
         """Publish a MQTT message."""
-        msg_info = self._mqttc.publish(topic, payload, qos, retain)
+        await (await self.async_publish_pipelined(topic, payload, qos, retain))
+
+    async def async_publish_pipelined(
+        self, topic: str, payload: PublishPayloadType, qos: int, retain: bool
+    ) -> asyncio.Future[None]:
+        """Publish a MQTT message without waiting for the broker to ACK it.
+
+        Returns a future resolved once the mid is ACKed or timed out. At most
+        the publish window of messages is in flight, publishing waits for a
+        slot to free up when the window is full.
+        """
+        await self._publish_window.acquire()
+        try:
+            msg_info = self._mqttc.publish(topic, payload, qos, retain)
+        except BaseException:
+            self._publish_window.release()
+            raise
         _LOGGER.debug(
             "Transmitting%s message on %s: '%s', mid: %s, qos: %s",
             " retained" if retain else "",
@@ -286,7 +412,29 @@ class XSenseMQTT:
             msg_info.mid,
             qos,
         )
-        await self._async_wait_for_mid_or_raise(msg_info.mid, msg_info.rc)
+        future = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_wait_for_mid_or_raise(msg_info.mid, msg_info.rc),
+            name="xsense-mqtt publish ack",
+        )
+        future.add_done_callback(lambda _: self._publish_window.release())
+        return future
+
+    async def async_publish_many(
+        self, messages: Iterable[tuple[str, PublishPayloadType, int, bool]]
+    ) -> None:
+        """Publish MQTT messages pipelined and wait for all of them to be ACKed.
+
+        Settings are not written over MQTT but through the shadow REST API, which
+        takes several settings in one desired document.
+        """
+        futures = [
+            await self.async_publish_pipelined(topic, payload, qos, retain)
+            for topic, payload, qos, retain in messages
+        ]
+        for result in await asyncio.gather(*futures, return_exceptions=True):
+            if isinstance(result, BaseException):
+                raise result
 
     async def _async_prepare_connection(self) -> None:
         """Prepare MQTT connection settings without blocking the event loop."""
@@ -402,7 +550,7 @@ class XSenseMQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._match_cache.clear()
 
     # unchanged
     @callback
@@ -411,7 +559,7 @@ class XSenseMQTT:
 
         This method does not send a SUBSCRIBE message to the broker.
 
-        The caller is responsible clearing the cache of _matching_subscriptions.
+        The caller is responsible clearing the cache of matching subscriptions.
         """
         if subscription.is_simple_match:
             self._simple_subscriptions[subscription.topic].add(subscription)
@@ -425,7 +573,7 @@ class XSenseMQTT:
 
         This method does not send an UNSUBSCRIBE message to the broker.
 
-        The caller is responsible clearing the cache of _matching_subscriptions.
+        The caller is responsible clearing the cache of matching subscriptions.
         """
         topic = subscription.topic
         try:
@@ -520,7 +668,7 @@ class XSenseMQTT:
         )
 
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._match_cache.clear()
 
         if self.connected:
             self.config_entry.async_create_background_task(
@@ -536,7 +684,7 @@ class XSenseMQTT:
     def _async_remove(self, subscription: Subscription) -> None:
         """Remove subscription."""
         self._async_untrack_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._match_cache.clear()
         if subscription in self._retained_topics:
             del self._retained_topics[subscription]
         # Only unsubscribe if currently connected
@@ -649,20 +797,34 @@ class XSenseMQTT:
         self._async_connection_result(True)
 
     # def _async_queue_resubscribe
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
+        if (cached := self._match_cache.get(topic)) is not None:
+            self._match_cache.move_to_end(topic)
+            self._match_cache_hits += 1
+            return cached
+        self._match_cache_misses += 1
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_subscriptions.match(topic))
+        if MATCH_CACHE_SIZE:
+            self._match_cache[topic] = subscriptions
+            if len(self._match_cache) > MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
         return subscriptions
 
+    @property
+    def subscription_stats(self) -> dict[str, int]:
+        """Return subscription matching statistics for diagnostics."""
+        return {
+            "simple_topics": len(self._simple_subscriptions),
+            "wildcard_subscriptions": len(self._wildcard_subscriptions),
+            "trie_nodes": self._wildcard_subscriptions.node_count,
+            "match_cache_size": len(self._match_cache),
+            "match_cache_hits": self._match_cache_hits,
+            "match_cache_misses": self._match_cache_misses,
+        }
+
     @callback
     def _async_mqtt_on_message(
         self, _mqttc: mqtt.Client, _userdata: None, msg: mqtt.MQTTMessage
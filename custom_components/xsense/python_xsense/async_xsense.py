@@ -1,6 +1,8 @@
 import asyncio
+import copy
 import json
 import logging
+import time
 from datetime import datetime, timezone
 from typing import Any, Dict
 
@@ -18,6 +20,36 @@ from .station import Station
 LOGGER = logging.getLogger(__name__)
 
 CAMERA_TYPES = {"SSC0A", "SSC0B"}
+# Biz codes that only read data; identical concurrent calls share one request
+READ_ONLY_API_CODES = {
+    "101001",
+    "101003",
+    "102007",
+    "102008",
+    "103007",
+    "104001",
+    "104006",
+    "104007",
+    "104008",
+    "104009",
+    "104010",
+    "104014",
+    "104015",
+    "104020",
+    "405001",
+    "405105",
+    "505001",
+}
+# Seconds the responses of read-only biz codes are reused, per biz code
+API_CACHE_TTL = {
+    "102007": 10.0,
+    "102008": 10.0,
+    "103007": 10.0,
+    "405001": 5.0,
+    "405105": 5.0,
+}
+# Request parameters identifying what a mutating biz code touches
+_API_SCOPE_KEYS = ("stationId", "houseId")
 CAMERA_LIVE_URL_MAX_AGE_SECONDS = 240
 _CAMERA_VIDEO_RESOLUTIONS = {
     "auto",
@@ -160,6 +192,15 @@ def _debug_data_shape(value: Any) -> dict[str, Any]:
     return {"type": type(value).__name__}
 
 
+def _api_call_key(code: str, unauth: bool, params: Dict) -> tuple[str, bool, str]:
+    """Return the key identifying identical API calls."""
+    return (
+        code,
+        unauth,
+        json.dumps(params, sort_keys=True, separators=(",", ":"), default=str),
+    )
+
+
 def _station_state_shadow_names(station: Station) -> tuple[str, ...]:
     if station.type in _HOUSE_STATE_DEVICE_TYPES:
         return ()
@@ -376,6 +417,10 @@ class AsyncXSense(XSenseBase):
         self._owns_session = session is None
         self.language = _ipc_language(language)
         self._sbs50_child_info_loaded: set[tuple[str, str]] = set()
+        self._api_inflight: dict[tuple[str, bool, str], asyncio.Future] = {}
+        # call key -> (expiry as monotonic time, scope, response)
+        self._api_cache: dict[tuple[str, bool, str], tuple[float, dict, Any]] = {}
+        self._api_cache_generation = 0
 
     async def _get_session(self):
         if self.session is None or self.session.closed:
@@ -395,6 +440,63 @@ class AsyncXSense(XSenseBase):
         await self.close()
 
     async def api_call(self, code, unauth=False, **kwargs):
+        """Call the X-Sense API.
+
+        Identical concurrent calls of read-only biz codes share one request,
+        and responses of biz codes in API_CACHE_TTL are reused until their TTL
+        expires. Every caller gets its own copy of a shared response, so callers
+        can not change what others see. Mutating calls drop the cached responses
+        of their station.
+        """
+        if code not in READ_ONLY_API_CODES:
+            try:
+                return await self._api_request(code, unauth, **kwargs)
+            finally:
+                self.invalidate_api_cache(
+                    {key: kwargs[key] for key in _API_SCOPE_KEYS if key in kwargs}
+                )
+
+        key = _api_call_key(code, unauth, kwargs)
+        if (cached := self._api_cache.get(key)) is not None:
+            if cached[0] > time.monotonic():
+                return copy.deepcopy(cached[2])
+            del self._api_cache[key]
+
+        if (future := self._api_inflight.get(key)) is None:
+            generation = self._api_cache_generation
+            future = asyncio.ensure_future(self._api_request(code, unauth, **kwargs))
+            self._api_inflight[key] = future
+
+            def _done(done: asyncio.Future) -> None:
+                if self._api_inflight.get(key) is done:
+                    del self._api_inflight[key]
+                if (
+                    (ttl := API_CACHE_TTL.get(code))
+                    and not done.cancelled()
+                    and done.exception() is None
+                    and generation == self._api_cache_generation
+                ):
+                    self._api_cache[key] = (
+                        time.monotonic() + ttl,
+                        kwargs,
+                        done.result(),
+                    )
+
+            future.add_done_callback(_done)
+
+        return copy.deepcopy(await asyncio.shield(future))
+
+    def invalidate_api_cache(self, scope: Dict | None = None) -> None:
+        """Drop cached API responses of a station or house, or all of them."""
+        self._api_cache_generation += 1
+        if not scope:
+            self._api_cache.clear()
+            return
+        for key, (_, params, _) in list(self._api_cache.items()):
+            if any(params.get(name) == value for name, value in scope.items()):
+                del self._api_cache[key]
+
+    async def _api_request(self, code, unauth=False, **kwargs):
         data = {**kwargs}
 
         if unauth:
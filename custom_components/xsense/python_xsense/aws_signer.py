@@ -2,10 +2,16 @@ import hashlib
 import datetime
 import hmac
 import json
+import time
 import urllib
 from typing import Dict
 from urllib.parse import parse_qsl, quote, urlencode, urlsplit
 
+# Seconds a presigned URL is reused by default
+PRESIGNED_URL_MAX_AGE = 300
+# Seconds before the end of its age a presigned URL is no longer handed out
+PRESIGNED_URL_SAFETY_MARGIN = 30
+
 
 class AWSSigner:
     algorithm = 'AWS4-HMAC-SHA256'
@@ -20,11 +26,27 @@ class AWSSigner:
         self.client_id = client_id
         self.client_secret = client_secret
         self.token = token
+        # (date_stamp, region) -> signing key, for the current day only
+        self._signing_keys: Dict[tuple[str, str], bytes] = {}
+        # (url, region) -> (monotonic time signed, presigned url)
+        self._presigned_urls: Dict[tuple[str, str], tuple[float, str]] = {}
 
     def _sign(self, key, msg):
         return hmac.new(key, msg.encode('utf-8'), hashlib.sha256).digest()
 
     def get_signing_key(self, date_stamp, region):
+        """Return the signing key of a day and region, derived once per day."""
+        key = (date_stamp, region)
+        if (k_signing := self._signing_keys.get(key)) is not None:
+            return k_signing
+        if any(stamp != date_stamp for stamp, _ in self._signing_keys):
+            self._signing_keys.clear()
+        k_signing = self._signing_keys[key] = self._derive_signing_key(
+            date_stamp, region
+        )
+        return k_signing
+
+    def _derive_signing_key(self, date_stamp, region):
         k_date = self._sign((f'AWS4{self.client_secret}').encode('utf-8'), date_stamp)
         # print(f'date   : {string_to_hex(k_date)}')
         k_region = self._sign(key=k_date, msg=region)
@@ -150,12 +172,35 @@ class AWSSigner:
                 '?' + canonical_querystring
         )
 
+    def get_presigned_url(self, url, region, max_age=PRESIGNED_URL_MAX_AGE):
+        """Return a presigned url, reusing one signed less than max_age ago.
+
+        A cached url is no longer reused within the safety margin before the
+        end of its age, so it does not expire while connecting.
+        """
+        key = (url, region)
+        now = time.monotonic()
+        cached = self._presigned_urls.get(key)
+        if cached is not None and now - cached[0] < (
+            max_age - PRESIGNED_URL_SAFETY_MARGIN
+        ):
+            return cached[1]
+        signed = self.presign_url(url, region)
+        self._presigned_urls[key] = (now, signed)
+        return signed
+
     def update(
             self,
             client_id: str,
             client_secret: str,
             token: str
     ) -> None:
+        if (client_id, client_secret, token) != (
+            self.client_id, self.client_secret, self.token
+        ):
+            # Rotated credentials invalidate all derived keys and urls
+            self._signing_keys.clear()
+            self._presigned_urls.clear()
         self.client_id = client_id
         self.client_secret = client_secret
         self.token = token
@@ -425,12 +425,11 @@ def _resolve_action_value(value, entity: Entity):
 
 def _state_child_device(station: Station, child_key, child_state):
     """Return the child device targeted by an app shadow payload."""
+    getter = getattr(station, "get_device_by_identifier", None) or (
+        station.get_device_by_sn
+    )
     for value in _child_state_identifiers(child_key, child_state):
-        getter = getattr(station, "get_device_by_identifier", None)
-        if getter is not None:
-            if dev := getter(value):
-                return dev
-        if dev := station.get_device_by_sn(value):
+        if dev := getter(value):
             return dev
     return None
 
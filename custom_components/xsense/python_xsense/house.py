@@ -31,6 +31,7 @@ class House:
         self.room_order = []
         self.stations = {}
         self.station_order = []
+        self._station_by_sn: Dict[str, Station] = {}
 
         self.mqtt = MQTTHelper(signer, self)
 
@@ -108,6 +109,17 @@ class House:
             stations[station_id] = s
 
         self.stations = stations
+        self._station_by_sn = {}
+        for station in stations.values():
+            if station.sn is not None:
+                self._station_by_sn.setdefault(station.sn, station)
 
     def get_station_by_sn(self, sn: str):
-        return next((i for _, i in self.stations.items() if i.sn == sn), None)
+        station = self._station_by_sn.get(sn)
+        if station is not None and self.stations.get(station.entity_id) is station:
+            return station
+        # Stations can be added outside of set_stations, fall back to a scan
+        station = next((i for _, i in self.stations.items() if i.sn == sn), None)
+        if station is not None:
+            self._station_by_sn[sn] = station
+        return station
@@ -1,4 +1,5 @@
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 import typing
 
 property_mapper = {
@@ -275,11 +276,43 @@ type_mapping: dict[str, Callable[[typing.Any], typing.Any]] = {
 }
 
 
+Converter = Callable[[typing.Any], typing.Any]
+CompiledMapper = Mapping[str, tuple[str, Converter | None]]
+
+_compiled_mappers: dict[str | None, CompiledMapper] = {}
+
+
+def compile_mapper(device_type: str | None) -> CompiledMapper:
+    """Return the frozen {raw_key: (mapped_key, converter)} table of a device type.
+
+    The table is built the first time a device type is seen. Keys missing from
+    it are passed through unchanged.
+    """
+    if (compiled := _compiled_mappers.get(device_type)) is not None:
+        return compiled
+
+    table: dict[str, tuple[str, Converter | None]] = {
+        key: (key, converter) for key, converter in type_mapping.items()
+    }
+    mapping = property_mapper.get("*", {}) | property_mapper.get(device_type, {})
+    for raw_key, mapped_key in mapping.items():
+        table[raw_key] = (mapped_key, type_mapping.get(mapped_key))
+
+    compiled = _compiled_mappers[device_type] = MappingProxyType(table)
+    return compiled
+
+
 def map_type(k: str, value: typing.Any):
     return type_mapping[k](value) if k in type_mapping else value
 
 
 def map_values(device_type: str, data: typing.Dict):
-    mapping = property_mapper.get("*", {}) | property_mapper.get(device_type, {})
-
-    return {mapping.get(k, k): map_type(mapping.get(k, k), v) for k, v in data.items()}
+    table = compile_mapper(device_type)
+    result = {}
+    for k, v in data.items():
+        if (entry := table.get(k)) is None:
+            result[k] = v
+            continue
+        mapped_key, converter = entry
+        result[mapped_key] = converter(v) if converter is not None else v
+    return result
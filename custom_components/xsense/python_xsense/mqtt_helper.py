@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 import uuid
 import ssl
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
 
 from paho.mqtt import client as mqtt_client
@@ -62,18 +62,13 @@ def should_ignore_shadow_topic(topic: str) -> bool:
 
 class MQTTHelper:
     def _get_path(self):
-        if (
-            not self._mqtt_path
-            or not self._sig_age
-            or datetime.now() - self._sig_age > timedelta(minutes=URL_MAX_AGE)
-        ):
-            signed = self.signer.presign_url(
-                f"wss://{self.house.mqtt_server}/mqtt", self.house.mqtt_region
-            )
-            url_parts = signed.split("/")
-            self._mqtt_path = "/" + "/".join(url_parts[3:])
-            self._sig_age = datetime.now()
-
+        signed = self.signer.get_presigned_url(
+            f"wss://{self.house.mqtt_server}/mqtt",
+            self.house.mqtt_region,
+            max_age=URL_MAX_AGE * 60,
+        )
+        url_parts = signed.split("/")
+        self._mqtt_path = "/" + "/".join(url_parts[3:])
         return self._mqtt_path
 
     def __init__(self, signer: AWSSigner, house: House):
@@ -83,7 +78,6 @@ class MQTTHelper:
         self._last_update = None
         self._update_callback = None
         self._mqtt_path = None
-        self._sig_age = None
 
         self.client = mqtt_client.Client(
             callback_api_version=mqtt_client.CallbackAPIVersion.VERSION2,
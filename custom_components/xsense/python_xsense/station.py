@@ -1,8 +1,11 @@
-from typing import List, Dict
+from typing import Callable, List, Dict
 
 from .device import Device
 from .entity import Entity
 
+# Device fields holding the MACs a device is indexed by
+DEVICE_MAC_KEYS = ("mac", "macBT", "wiredMacAddress")
+
 
 class Station(Entity):
     devices: Dict[str, Device]
@@ -32,6 +35,11 @@ class Station(Entity):
         self.devices = {}
         self.device_order = []
         self.device_by_sn = {}
+        self._device_by_group_id: Dict[str, Device] = {}
+        self._device_by_shadow_name: Dict[str, Device] = {}
+        self._device_by_mac: Dict[str, Device] = {}
+        self._device_by_normalized_sn: Dict[str, Device] = {}
+        self._device_index_keys: Dict[str, tuple] = {}
         self.has_alarm = False
         self._alarm_data = {}
         super().__init__(**kwargs)
@@ -85,6 +93,48 @@ class Station(Entity):
             result_sn[str(device_data["deviceSn"])] = device_data["deviceId"]
         self.devices = result
         self.device_by_sn = result_sn
+        self._build_device_indexes()
+
+    def _build_device_indexes(self):
+        self._device_by_group_id = {}
+        self._device_by_shadow_name = {}
+        self._device_by_mac = {}
+        self._device_by_normalized_sn = {}
+        self._device_index_keys = {}
+        for dev in self.devices.values():
+            self._index_device(dev)
+
+    def _index_device(self, dev: Device):
+        keys = _device_index_keys(dev)
+        self._device_index_keys[dev.entity_id] = keys
+        group_id, shadow_name, macs, normalized_sn = keys
+        if group_id is not None:
+            self._device_by_group_id.setdefault(group_id, dev)
+        if shadow_name:
+            self._device_by_shadow_name.setdefault(shadow_name, dev)
+        for mac in macs:
+            self._device_by_mac.setdefault(mac, dev)
+        if normalized_sn:
+            self._device_by_normalized_sn.setdefault(normalized_sn, dev)
+
+    def reindex_device(self, dev: Device):
+        """Update the indexes of a device after its identifying fields changed."""
+        if self.devices.get(dev.entity_id) is not dev:
+            return
+        old_keys = self._device_index_keys.get(dev.entity_id)
+        if old_keys == _device_index_keys(dev):
+            return
+        if old_keys is not None:
+            group_id, shadow_name, macs, normalized_sn = old_keys
+            for index, key in (
+                (self._device_by_group_id, group_id),
+                (self._device_by_shadow_name, shadow_name),
+                (self._device_by_normalized_sn, normalized_sn),
+                *((self._device_by_mac, mac) for mac in macs),
+            ):
+                if index.get(key) is dev:
+                    del index[key]
+        self._index_device(dev)
 
     def get_device_by_sn(self, sn: str):
         if device_id := self.device_by_sn.get(str(sn)):
@@ -96,16 +146,55 @@ class Station(Entity):
         identifier = str(identifier)
         return self.devices.get(identifier) or self.get_device_by_sn(identifier)
 
-    def get_group_device(self, group_id):
-        group_id = _java_string(group_id)
+    def _lookup_device(
+        self, index: Dict[str, Device], key: str, matches: Callable[[Device], bool]
+    ):
+        """Return the indexed device matching a key.
+
+        set_data does not re-index devices, so the identifying fields of the hit are
+        checked. When they changed, or nothing is indexed under the key, the devices
+        are scanned like before the indexes and the found device is re-indexed.
+        """
+        dev = index.get(key)
+        if dev is not None:
+            if self.devices.get(dev.entity_id) is dev and matches(dev):
+                return dev
+            self.reindex_device(dev)
         for dev in self.devices.values():
-            if (
-                dev.type == "group-L"
-                and _java_string(dev.data.get("groupId")) == group_id
-            ):
+            if matches(dev):
+                self.reindex_device(dev)
                 return dev
         return None
 
+    def get_device_by_shadow_name(self, shadow_name: str):
+        shadow_name = str(shadow_name)
+        return self._lookup_device(
+            self._device_by_shadow_name,
+            shadow_name,
+            lambda dev: dev.shadow_name == shadow_name,
+        )
+
+    def get_device_by_mac(self, mac: str):
+        mac = _normalized_mac(mac)
+        if not mac:
+            return None
+        return self._lookup_device(
+            self._device_by_mac, mac, lambda dev: mac in _device_macs(dev)
+        )
+
+    def get_device_by_normalized_sn(self, sn: str):
+        """Return a child device by serial, ignoring case and separators."""
+        return self._device_by_normalized_sn.get(_normalized_serial(sn))
+
+    def get_group_device(self, group_id):
+        group_id = _java_string(group_id)
+        return self._lookup_device(
+            self._device_by_group_id,
+            group_id,
+            lambda dev: dev.type == "group-L"
+            and _java_string(dev.data.get("groupId")) == group_id,
+        )
+
     def set_alarm_data(self, values: dict):
         keys = [
             "mode",
@@ -208,6 +297,34 @@ def _light_group_device_sn(group_id) -> str:
     return f"LG{padded[2:]}"
 
 
+def _device_index_keys(dev: Device) -> tuple:
+    """Return the group id, shadow name, MACs and normalized serial of a device."""
+    data = dev.data
+    group_id = _java_string(data.get("groupId")) if dev.type == "group-L" else None
+    return group_id, dev.shadow_name, _device_macs(dev), _normalized_serial(dev.sn)
+
+
+def _device_macs(dev: Device) -> tuple:
+    """Return the normalized MACs of a device."""
+    return tuple(
+        mac
+        for mac in (_normalized_mac(dev.data.get(key)) for key in DEVICE_MAC_KEYS)
+        if mac
+    )
+
+
+def _normalized_serial(value) -> str:
+    if value is None:
+        return ""
+    return "".join(char for char in str(value).upper() if char.isalnum())
+
+
+def _normalized_mac(value) -> str:
+    if not isinstance(value, str):
+        return ""
+    return "".join(char for char in value.lower() if char in "0123456789abcdef")
+
+
 def _java_string(value) -> str:
     return "null" if value is None else str(value)
 